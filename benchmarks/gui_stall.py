@@ -0,0 +1,120 @@
+"""
+UI-thread stall harness for ui.task_runner.
+
+Simulates a user clicking Register / Drop every `--click-ms` while a
+heartbeat measures how late the event loop runs. "inline" calls the system
+on the loop thread, as MainGUI used to; "worker" goes through TaskRunner.
+`--latency-ms` adds a per-call delay to stand in for a slow backend
+(password hashing, remote storage).
+
+Runs on a small simulated event loop by default; pass --tk to use a real
+(withdrawn) Tk root when a display is available.
+
+    python -m benchmarks.gui_stall --latency-ms 40
+"""
+
+import argparse
+import heapq
+import itertools
+import time
+
+from controllers import RegistrationSystem
+from seed_courses import load_requisites, seed_courses
+from ui.task_runner import StallMonitor, TaskRunner
+
+
+class SimulatedLoop:
+    """Single-threaded stand-in for the Tk loop: after(), after_cancel(), run()."""
+
+    def __init__(self):
+        self._timers = []
+        self._ids = itertools.count()
+        self._cancelled = set()
+
+    def after(self, ms, fn):
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (time.perf_counter() + ms / 1000, timer_id, fn))
+        return timer_id
+
+    def after_cancel(self, timer_id):
+        self._cancelled.add(timer_id)
+
+    def run(self, seconds):
+        end = time.perf_counter() + seconds
+        while self._timers and time.perf_counter() < end:
+            due, timer_id, fn = heapq.heappop(self._timers)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            if timer_id in self._cancelled:
+                self._cancelled.discard(timer_id)
+                continue
+            fn()
+
+
+def _run_tk(root, seconds):
+    root.after(int(seconds * 1000), root.quit)
+    root.mainloop()
+
+
+def measure(mode, seconds, click_ms, latency_ms, use_tk):
+    system = RegistrationSystem()
+    seed_courses(system)
+    load_requisites(system)
+    system.register_student("bench", "Bench", "pwd")
+    system.login("bench", "pwd")
+    courses = [c.course_id for c in system.get_all_courses()]
+
+    def slow(fn, *args):
+        time.sleep(latency_ms / 1000)
+        return fn(*args)
+
+    if use_tk:
+        import tkinter
+        root = tkinter.Tk()
+        root.withdraw()
+    else:
+        root = SimulatedLoop()
+
+    runner = TaskRunner(root) if mode == "worker" else None
+    monitor = StallMonitor(root)
+    clicks = itertools.count()
+
+    def click():
+        n = next(clicks)
+        cid = courses[(n // 2) % len(courses)]
+        fn = system.register_course if n % 2 == 0 else system.drop_course
+        if runner is None:
+            slow(fn, cid)
+        else:
+            runner.submit(slow, fn, cid, key=("click", n))
+        root.after(click_ms, click)
+
+    monitor.start()
+    root.after(click_ms, click)
+    if use_tk:
+        _run_tk(root, seconds)
+    else:
+        root.run(seconds)
+    monitor.stop()
+    if runner is not None:
+        runner.shutdown()
+    return monitor.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--click-ms", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=25.0)
+    parser.add_argument("--tk", action="store_true", help="use a real Tk root")
+    args = parser.parse_args()
+
+    print(f"{'mode':>8} {'beats':>6} {'max ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+    for mode in ("inline", "worker"):
+        r = measure(mode, args.seconds, args.click_ms, args.latency_ms, args.tk)
+        print(f"{mode:>8} {r['beats']:>6} {r['max_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['mean_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Memory benchmark: standard Student/Course models vs CompactRegistry.
+
+Builds the same enrollment graph (4 courses per student, sections of 50)
+with both representations, through the Student / Course interface the
+RegistrationManager uses, and reports traced heap size, build time and the
+number of GC-tracked objects.
+
+    python -m benchmarks.memory_models [enrollments ...]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from models import CompactRegistry, Course, Student
+
+DEFAULT_SCALES = (10_000, 100_000, 1_000_000)
+COURSES_PER_STUDENT = 4  # 4 x 4 credits stays within MAX_CREDITS
+SECTION_SIZE = 50
+DEPARTMENTS = ("CSCI-UA", "MATH-UA", "PHYS-UA", "ECON-UB", "HIST-UA")
+
+
+def _shape(enrollments):
+    students = enrollments // COURSES_PER_STUDENT
+    courses = max(COURSES_PER_STUDENT, enrollments // SECTION_SIZE)
+    return students, courses
+
+
+def _course_row(i):
+    return (f"{DEPARTMENTS[i % len(DEPARTMENTS)]} {i}", f"Course {i}",
+            f"Prof. {i % 500}", 4, SECTION_SIZE)
+
+
+def build_standard(enrollments):
+    n_students, n_courses = _shape(enrollments)
+    courses = [Course(*_course_row(i)) for i in range(n_courses)]
+    students = []
+    for i in range(n_students):
+        s = Student(f"N{i:07d}", f"Student {i}", "pwd")
+        for k in range(COURSES_PER_STUDENT):
+            c = courses[(i * COURSES_PER_STUDENT + k) % n_courses]
+            s.add_course(c)
+            c.enroll_student(s)
+        students.append(s)
+    return students, courses
+
+
+def build_compact(enrollments):
+    n_students, n_courses = _shape(enrollments)
+    reg = CompactRegistry()
+    courses = [reg.new_course(*_course_row(i)) for i in range(n_courses)]
+    for i in range(n_students):
+        s = reg.new_student(f"N{i:07d}", f"Student {i}", "pwd")
+        for k in range(COURSES_PER_STUDENT):
+            c = courses[(i * COURSES_PER_STUDENT + k) % n_courses]
+            s.add_course(c)
+            c.enroll_student(s)
+    return reg, courses
+
+
+def measure(build, enrollments):
+    gc.collect()
+    tracked_before = len(gc.get_objects())
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    data = build(enrollments)
+    elapsed = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tracked = len(gc.get_objects()) - tracked_before
+    del data
+    gc.collect()
+    return current, elapsed, tracked
+
+
+def main(scales):
+    print(f"{'enrollments':>12} {'model':>9} {'heap MiB':>10} {'build s':>8} {'gc objects':>11}")
+    for n in scales:
+        results = {}
+        for label, build in (("standard", build_standard), ("compact", build_compact)):
+            results[label] = measure(build, n)
+            mem, elapsed, tracked = results[label]
+            print(f"{n:>12,} {label:>9} {mem / 2**20:>10.1f} {elapsed:>8.2f} {tracked:>11,}")
+        ratio = results["standard"][0] / max(1, results["compact"][0])
+        print(f"{'':>12} {'ratio':>9} {ratio:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or DEFAULT_SCALES)
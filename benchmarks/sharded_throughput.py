@@ -0,0 +1,124 @@
+"""
+Throughput of department-sharded registration across worker processes.
+
+Replays the same Zipf-skewed register requests (see benchmarks.suite)
+against a single-process RegistrationManager and against
+ShardedRegistrationSystem with 1, 2, 4, ... shards, in batches, and
+reports requests per second plus the speed-up over one shard, and how the
+courses and requests are spread over the shards. Each run also checks that
+no course is over capacity and that the owner-shard credit ledgers match
+the enrollments.
+
+    python -m benchmarks.sharded_throughput [--students 20000] [--requests 100000]
+        [--shards 1 2 4 8] [--batch 2000] [--partition department|hash] [--sqlite]
+
+With --sqlite every shard writes through its own SQLite file, which gives
+the workers realistic per-request cost; in memory the router's messaging
+is a larger share of the total. Scaling needs as many idle cores as shards.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.suite import Dataset
+from controllers import RegistrationManager
+from controllers.sharding import ShardedRegistrationSystem
+from models import Course, Student
+
+
+def requests_for(data, count, seed=0):
+    rng = random.Random(seed)
+    sids = [sid for sid, _, _ in data.students]
+    return list(zip((rng.choice(sids) for _ in range(count)), data.popular(rng, count)))
+
+
+def rows(data):
+    return [(c.course_id, c.title, c.instructor, c.credits, c.capacity, c.meeting_times)
+            for c in data.courses]
+
+
+def run_single(data, requests):
+    manager = RegistrationManager()
+    courses = {row[0]: Course(*row) for row in rows(data)}
+    students = {}
+    t0 = time.perf_counter()
+    accepted = 0
+    for sid, cid in requests:
+        stu = students.get(sid)
+        if stu is None:
+            stu = students[sid] = Student(sid, sid, "")
+        accepted += manager.register(stu, courses[cid])[0]
+    return time.perf_counter() - t0, accepted
+
+
+def run_sharded(data, requests, shards, batch, partition, db_dir):
+    system = ShardedRegistrationSystem(shards, partition, db_dir).start()
+    try:
+        system.add_courses(rows(data))
+        spread = [0] * shards
+        for _, cid in requests:
+            spread[system.course_shard(cid)] += 1
+        placement = (system.placement(), spread)
+        t0 = time.perf_counter()
+        accepted = 0
+        for i in range(0, len(requests), batch):
+            accepted += sum(ok for ok, _ in system.register_batch(requests[i:i + batch]))
+        elapsed = time.perf_counter() - t0
+        seats = system.get_seats([c.course_id for c in data.courses])
+        overbooked = sum(1 for s in seats if s is not None and s[0] > s[1])
+        problems = system.check()
+    finally:
+        system.stop()
+    return elapsed, accepted, overbooked, problems, placement
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--shards", type=int, nargs="+")
+    parser.add_argument("--batch", type=int, default=2_000)
+    parser.add_argument("--partition", choices=("department", "hash"), default="department")
+    parser.add_argument("--sqlite", action="store_true", help="persist each shard to SQLite")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    shard_counts = args.shards or sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)) | {1})
+    data = Dataset(args.students, args.seed)
+    requests = requests_for(data, args.requests, args.seed)
+    print(f"{len(requests):,} register requests, {args.students:,} students, "
+          f"{len(data.courses):,} courses, {cores} cores, partition={args.partition}"
+          f"{', sqlite' if args.sqlite else ''}")
+
+    if not args.sqlite:
+        elapsed, accepted = run_single(data, requests)
+        print(f"  {'in-process':>12s}: {len(requests) / elapsed:12,.0f} req/s  "
+              f"({accepted:,} accepted)")
+
+    failed = False
+    base = None
+    for shards in shard_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed, accepted, overbooked, problems, (courses, spread) = run_sharded(
+                data, requests, shards, args.batch, args.partition,
+                tmp if args.sqlite else None)
+        rate = len(requests) / elapsed
+        base = base or rate
+        print(f"  {shards:>5d} shards: {rate:12,.0f} req/s  x{rate / base:4.2f}  "
+              f"({accepted:,} accepted, {overbooked} overbooked)")
+        if shards > 1:
+            print(f"    courses per shard {courses}, requests per shard "
+                  f"{[f'{n / len(requests):.0%}' for n in spread]}")
+        for problem in problems:
+            print(f"    INCONSISTENT: {problem}")
+        failed = failed or bool(overbooked or problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Cold-start benchmark: time from interpreter start to a ready
+RegistrationSystem on the headless path.
+
+Each run is a fresh `python -X importtime` subprocess. The report gives
+wall-clock time to ready, total import time, the slowest imports by
+cumulative time, and whether any GUI or optional heavy module was loaded.
+
+    python -m benchmarks.startup_time [--runs 5] [--top 15] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import time, sys; t0 = time.perf_counter()\n"
+    "from bootstrap import create_system\n"
+    "create_system()\n"
+    "print(time.perf_counter() - t0)\n"
+    "print(','.join(sorted(sys.modules)))\n"
+)
+
+# Modules the headless path should never load
+UNWANTED = ("customtkinter", "tkinter", "numpy", "asyncio", "sqlite3")
+
+
+def run_once():
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    ready_s, modules = proc.stdout.strip().splitlines()[-2:]
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return float(ready_s), imports, set(modules.split(","))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    args = parser.parse_args()
+
+    ready, import_totals, last_imports, loaded = [], [], None, set()
+    for _ in range(args.runs):
+        ready_s, imports, modules = run_once()
+        ready.append(ready_s)
+        import_totals.append(sum(self_us for _, self_us, _ in imports) / 1e6)
+        last_imports, loaded = imports, modules
+
+    unwanted = [m for m in UNWANTED if m in loaded]
+    result = {
+        "runs": args.runs,
+        "ready_median_ms": statistics.median(ready) * 1000,
+        "ready_min_ms": min(ready) * 1000,
+        "imports_median_ms": statistics.median(import_totals) * 1000,
+        "slowest_imports": [
+            {"module": name, "cumulative_ms": cum / 1000, "self_ms": own / 1000}
+            for name, own, cum in sorted(last_imports, key=lambda i: -i[2])[:args.top]
+        ],
+        "unwanted_modules": unwanted,
+    }
+
+    print(f"ready in {result['ready_median_ms']:.1f} ms median "
+          f"(min {result['ready_min_ms']:.1f}) over {args.runs} runs; "
+          f"imports {result['imports_median_ms']:.1f} ms")
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for row in result["slowest_imports"]:
+        print(f"{row['cumulative_ms']:>14.1f} {row['self_ms']:>8.1f}  {row['module']}")
+    print("unwanted modules loaded: " + (", ".join(unwanted) or "none"))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 1 if unwanted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Multi-threaded stress test for RegistrationManager.
+
+Fires ATTEMPTS concurrent register calls (plus a share of drops) at a small
+set of oversubscribed courses and checks that no course ends up over
+capacity and that both sides of every enrollment agree.
+
+    python -m benchmarks.stress_registration [--compact]
+
+--compact runs the same plan on models.CompactRegistry entities.
+"""
+
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from models import CompactRegistry, Course, Student
+from controllers import RegistrationManager
+
+ATTEMPTS = 10_000
+THREADS = 64
+COURSES = 20
+CAPACITY = 50
+
+
+def run(attempts=ATTEMPTS, threads=THREADS, seed=0, compact=False):
+    rng = random.Random(seed)
+    manager = RegistrationManager()
+    new_course, new_student = Course, Student
+    if compact:
+        registry = CompactRegistry()
+        new_course, new_student = registry.new_course, registry.new_student
+    courses = [new_course(f"TEST-UA {i}", f"Course {i}", "Prof. Test", 4, CAPACITY)
+               for i in range(COURSES)]
+    students = [new_student(f"S{i}", f"Student {i}", "pwd") for i in range(attempts)]
+    plan = [(rng.choice(students), rng.choice(courses), rng.random() < 0.1)
+            for _ in range(attempts)]
+    start = threading.Barrier(threads)
+
+    def worker(chunk):
+        start.wait()
+        accepted = 0
+        for student, course, also_drop in chunk:
+            ok, _ = manager.register(student, course)
+            accepted += ok
+            if ok and also_drop:
+                manager.drop(student, course)
+        return accepted
+
+    chunks = [plan[i::threads] for i in range(threads)]
+    # Switch threads as often as possible to surface races
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    t0 = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            accepted = sum(pool.map(worker, chunks))
+    finally:
+        sys.setswitchinterval(old_interval)
+    elapsed = time.perf_counter() - t0
+
+    overbooked = [c for c in courses if c.enrolled_count() > c.capacity]
+    mismatched = [
+        (s, c) for c in courses for s in c.enrolled_students if not s.is_registered(c)
+    ] + [
+        (s, c) for s in students for c in s.registered_courses if not c.is_enrolled(s)
+    ]
+    bad_credits = [s for s in students
+                   if s.total_credits() != sum(c.credits for c in s.registered_courses)]
+
+    print(f"{attempts} attempts on {threads} threads in {elapsed:.2f}s, "
+          f"{accepted} accepted")
+    print(f"seats filled: {sum(c.enrolled_count() for c in courses)} / "
+          f"{COURSES * CAPACITY}")
+    print(f"overbooked courses: {len(overbooked)}, mismatched enrollments: "
+          f"{len(mismatched)}, wrong credit totals: {len(bad_credits)}")
+    return not (overbooked or mismatched or bad_credits)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run(compact="--compact" in sys.argv[1:]) else 1)
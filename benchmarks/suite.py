@@ -0,0 +1,485 @@
+"""
+Microbenchmarks for the public RegistrationSystem operations.
+
+A deterministic generator builds students, courses and a skewed (Zipf-like)
+course popularity for each scale; every operation is then timed against the
+same data. Results are written as JSON, and a previous result file can be
+passed to --compare to flag operations that got slower than --threshold.
+
+    python -m benchmarks.suite [--scales 1000 10000 100000] [--out results.json]
+    python -m benchmarks.suite --compare baseline.json [--threshold 0.2]
+    python -m benchmarks.suite --diff baseline.json results.json
+
+Scale is the number of students; the catalog has a tenth as many courses
+(at least 50). enable_journal, close and subscribe are not timed: they are
+one-off lifecycle calls, not per-request operations. Comparisons use the
+best repeat; on a shared machine keep --threshold above the run-to-run noise
+(check by diffing two runs of the same tree).
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from controllers import RegistrationSystem
+from models import Course
+
+SCALES = (1_000, 10_000, 100_000)
+ITERATIONS = 2_000
+REPEAT = 5
+THRESHOLD = 0.20
+
+DEPARTMENTS = ("CSCI-UA", "MATH-UA", "PHYS-UA", "ECON-UA", "BIOL-UA", "CHEM-UA",
+               "PSYC-UA", "HIST-UA")
+SUBJECTS = ("Algorithms", "Systems", "Networks", "Databases", "Statistics", "Calculus",
+            "Mechanics", "Genetics", "Markets", "Cognition", "Empires", "Chemistry",
+            "Learning", "Security", "Graphics", "Compilers")
+LEVELS = ("Intro to", "Topics in", "Advanced", "Applied", "Seminar in", "Foundations of")
+INSTRUCTORS = ("Smith", "Allen", "Lee", "Kumar", "Chen", "Davis", "Martinez", "Nguyen",
+               "Patel", "Zhao", "Roberts", "Gupta", "Yang", "Brown", "Wilson", "Garcia")
+
+
+# ---------- Synthetic data ----------
+class Dataset:
+    """Students, courses and popularity weights for one scale; same seed, same data."""
+
+    def __init__(self, scale: int, seed: int = 0, skew: float = 1.1):
+        rng = random.Random(seed)
+        self.scale = scale
+        self.students = [(f"N{i:07d}", f"Student {i}", f"pw{i}") for i in range(scale)]
+        self.courses = []
+        for i in range(max(scale // 10, 50)):
+            dept = DEPARTMENTS[i % len(DEPARTMENTS)]
+            title = f"{rng.choice(LEVELS)} {rng.choice(SUBJECTS)}"
+            self.courses.append(Course(
+                f"{dept} {100 + i // len(DEPARTMENTS)}", title,
+                f"Prof. {rng.choice(INSTRUCTORS)}", rng.choice((2, 4, 4, 4)),
+                rng.randint(20, 200),
+            ))
+        # Zipf popularity over a shuffled ranking, so hot courses span departments
+        ranking = list(range(len(self.courses)))
+        rng.shuffle(ranking)
+        weights = [0.0] * len(ranking)
+        for rank, idx in enumerate(ranking, start=1):
+            weights[idx] = 1.0 / rank ** skew
+        self._cum_weights = list(itertools.accumulate(weights))
+        self.course_ids = [c.course_id for c in self.courses]
+
+    def popular(self, rng, k: int = 1):
+        """k course ids drawn by popularity."""
+        return rng.choices(self.course_ids, cum_weights=self._cum_weights, k=k)
+
+
+def build_system(data: Dataset, seed: int = 0, enrollments_per_student: int = 2):
+    """A RegistrationSystem loaded with the dataset and a skewed set of enrollments."""
+    rng = random.Random(seed + 1)
+    system = RegistrationSystem(max_sessions=max(data.scale, 50_000))
+    system.course_catalog.add_courses(data.courses)
+    created, _ = system.register_students(data.students)
+    catalog, manager = system.course_catalog, system.reg_manager
+    for student in created:
+        for cid in data.popular(rng, enrollments_per_student):
+            manager.register(student, catalog.find_course(cid))
+    return system
+
+
+# ---------- Benchmarks ----------
+# Each benchmark is setup(system, data, rng, n) -> (fn, args, teardown);
+# fn(*a) is timed for every a in args, teardown (untimed) restores state
+# so repeats see the same system.
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def wrap(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return wrap
+
+
+def _students(system, data, rng, n):
+    """n distinct (student, token) pairs with open sessions."""
+    picked = rng.sample(data.students, min(n, len(data.students)))
+    tokens = [system.open_session(sid, pwd)[0] for sid, _, pwd in picked]
+    return [system.get_session_user(t) for t in tokens], tokens
+
+
+def _close_all(system, tokens):
+    def teardown():
+        for t in tokens:
+            system.close_session(t)
+    return teardown
+
+
+@benchmark("register_student")
+def _register_student(system, data, rng, n):
+    # Sign-ups are kept: there is no public way to remove a student, and a
+    # few thousand extra rows per repeat do not move the numbers
+    base = rng.randrange(1 << 30)
+    rows = [(f"B{base}-{i}", f"Bench {i}", "pw") for i in range(n)]
+    return system.register_student, rows, None
+
+
+@benchmark("register_students")
+def _register_students(system, data, rng, n):
+    base = rng.randrange(1 << 30)
+    batches = [([(f"M{base}-{i}-{j}", "Bench", "pw") for j in range(100)],)
+               for i in range(max(n // 100, 1))]
+    return system.register_students, batches, None
+
+
+@benchmark("login")
+def _login(system, data, rng, n):
+    rows = [(sid, pwd) for sid, _, pwd in (rng.choice(data.students) for _ in range(n))]
+    return system.login, rows, system.logout
+
+
+@benchmark("login_failure")
+def _login_failure(system, data, rng, n):
+    rows = [(rng.choice(data.students)[0], "wrong") for _ in range(n)]
+    return system.login, rows, None
+
+
+@benchmark("logout")
+def _logout(system, data, rng, n):
+    sid, _, pwd = data.students[0]
+    system.login(sid, pwd)
+    return system.logout, [()] * n, None
+
+
+@benchmark("open_session")
+def _open_session(system, data, rng, n):
+    rows = [(sid, pwd) for sid, _, pwd in rng.sample(data.students, min(n, data.scale))]
+    opened = []
+
+    def fn(sid, pwd):
+        opened.append(system.open_session(sid, pwd)[0])
+    return fn, rows, _close_all(system, opened)
+
+
+@benchmark("close_session")
+def _close_session(system, data, rng, n):
+    _, tokens = _students(system, data, rng, n)
+    return system.close_session, [(t,) for t in tokens], None
+
+
+@benchmark("get_session_user")
+def _get_session_user(system, data, rng, n):
+    _, tokens = _students(system, data, rng, n)
+    return system.get_session_user, [(t,) for t in tokens], _close_all(system, tokens)
+
+
+@benchmark("get_all_courses")
+def _get_all_courses(system, data, rng, n):
+    return system.get_all_courses, [()] * max(n // 20, 10), None
+
+
+@benchmark("get_catalog_snapshot")
+def _get_catalog_snapshot(system, data, rng, n):
+    system.get_catalog_snapshot()  # start the publisher outside the timed loop
+    return system.get_catalog_snapshot, [()] * n, None
+
+
+@benchmark("get_course_count")
+def _get_course_count(system, data, rng, n):
+    return system.get_course_count, [()] * n, None
+
+
+@benchmark("get_courses_page")
+def _get_courses_page(system, data, rng, n):
+    total = system.get_course_count()
+    return system.get_courses_page, [(rng.randrange(total), 50) for _ in range(n)], None
+
+
+@benchmark("get_course_details")
+def _get_course_details(system, data, rng, n):
+    return system.get_course_details, [(cid,) for cid in data.popular(rng, n)], None
+
+
+@benchmark("get_course_details_miss")
+def _get_course_details_miss(system, data, rng, n):
+    return system.get_course_details, [(f"NONE-UA {i}",) for i in range(n)], None
+
+
+@benchmark("get_requisites")
+def _get_requisites(system, data, rng, n):
+    return system.get_requisites, [(cid,) for cid in data.popular(rng, n)], None
+
+
+@benchmark("record_completed_courses")
+def _record_completed_courses(system, data, rng, n):
+    # Completions are kept, like sign-ups: recording one again is a no-op
+    rows = [(rng.choice(data.students)[0], data.popular(rng, 2), system.registrar_key)
+            for _ in range(n)]
+    return system.record_completed_courses, rows, None
+
+
+@benchmark("get_completed_courses")
+def _get_completed_courses(system, data, rng, n):
+    students, tokens = _students(system, data, rng, n)
+    return system.get_completed_courses, [(t,) for t in tokens], _close_all(system, tokens)
+
+
+@benchmark("get_open_courses")
+def _get_open_courses(system, data, rng, n):
+    system.get_open_courses()  # build the view outside the timed loop
+    return system.get_open_courses, [(rng.choice(DEPARTMENTS),) for _ in range(n)], None
+
+
+@benchmark("search_courses")
+def _search_courses(system, data, rng, n):
+    system.search_courses("")  # build the index outside the timed loop
+    words = [w for s in SUBJECTS + LEVELS for w in s.split()] + list(data.course_ids[:50])
+    queries = [(rng.choice(words)[: rng.randint(2, 8)],) for _ in range(n)]
+    return system.search_courses, queries, None
+
+
+@benchmark("catalog_columns_query")
+def _catalog_columns_query(system, data, rng, n):
+    try:
+        columns = system.get_catalog_columns()
+    except ImportError:
+        return None  # NumPy not installed
+    args = [(rng.choice(DEPARTMENTS), rng.choice((None, 4)), 1) for _ in range(n)]
+
+    def fn(dept, credits, min_seats):
+        columns.query(department=dept, credits=credits, min_seats=min_seats,
+                      sort_by="seats", descending=True, limit=20)
+    return fn, args, None
+
+
+@benchmark("register_course")
+def _register_course(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = list(zip(data.popular(rng, len(tokens)), tokens))
+
+    def teardown():
+        for cid, token in rows:
+            system.drop_course(cid, token)
+        _close_all(system, tokens)()
+    return system.register_course, rows, teardown
+
+
+@benchmark("drop_course")
+def _drop_course(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = []
+    for user, token in zip(users, tokens):
+        for c in user.get_registered_courses()[:1]:
+            rows.append((c.course_id, token))
+
+    def teardown():
+        for cid, token in rows:
+            system.register_course(cid, token)
+        _close_all(system, tokens)()
+    return system.drop_course, rows, teardown
+
+
+@benchmark("register_many")
+def _register_many(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = [(data.popular(rng, 2), token) for token in tokens]
+
+    def teardown():
+        for (cids, token), user in zip(rows, users):
+            for cid in cids:
+                c = system.get_course_details(cid)
+                if c is not None and user.is_registered(c):
+                    system.drop_course(cid, token)
+        _close_all(system, tokens)()
+    return system.register_many, rows, teardown
+
+
+@benchmark("swap")
+def _swap(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = []
+    for user, token in zip(users, tokens):
+        held = user.get_registered_courses()
+        if held:
+            rows.append((held[0].course_id, data.popular(rng)[0], token))
+
+    def teardown():
+        for (drop_cid, add_cid, token), user in zip(rows, users):
+            if not user.is_registered(system.get_course_details(drop_cid)):
+                system.swap(add_cid, drop_cid, token)
+        _close_all(system, tokens)()
+    return system.swap, rows, teardown
+
+
+@benchmark("join_waitlist")
+def _join_waitlist(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = list(zip(data.popular(rng, len(tokens)), tokens))
+
+    def teardown():
+        for cid, token in rows:
+            system.leave_waitlist(cid, token)
+        _close_all(system, tokens)()
+    return system.join_waitlist, rows, teardown
+
+
+@benchmark("leave_waitlist")
+def _leave_waitlist(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = list(zip(data.popular(rng, len(tokens)), tokens))
+    for cid, token in rows:
+        system.join_waitlist(cid, token)
+    return system.leave_waitlist, rows, _close_all(system, tokens)
+
+
+@benchmark("get_waitlist_position")
+def _get_waitlist_position(system, data, rng, n):
+    users, tokens = _students(system, data, rng, n)
+    rows = list(zip(data.popular(rng, len(tokens)), tokens))
+    joined = [row for row in rows if system.join_waitlist(*row)[0]]
+
+    def teardown():
+        for cid, token in joined:
+            system.leave_waitlist(cid, token)
+        _close_all(system, tokens)()
+    return system.get_waitlist_position, rows, teardown
+
+
+@benchmark("get_my_schedule")
+def _get_my_schedule(system, data, rng, n):
+    _, tokens = _students(system, data, rng, n)
+    return system.get_my_schedule, [(t,) for t in tokens], _close_all(system, tokens)
+
+
+@benchmark("get_current_user_credit_remaining")
+def _get_credit_remaining(system, data, rng, n):
+    _, tokens = _students(system, data, rng, n)
+    return (system.get_current_user_credit_remaining, [(t,) for t in tokens],
+            _close_all(system, tokens))
+
+
+# ---------- Runner ----------
+def time_benchmark(system, data, setup, iterations, repeat, seed):
+    """Per-call nanoseconds for each repeat; None when the benchmark is unavailable."""
+    samples = []
+    for r in range(repeat):
+        prepared = setup(system, data, random.Random(seed * 1000 + r), iterations)
+        if prepared is None:
+            return None
+        fn, args, teardown = prepared
+        clock = time.perf_counter_ns
+        gc.collect()
+        gc.disable()  # as timeit does: keep collector pauses out of the samples
+        try:
+            t0 = clock()
+            for a in args:
+                fn(*a)
+            elapsed = clock() - t0
+        finally:
+            gc.enable()
+        if teardown is not None:
+            teardown()
+        samples.append(elapsed / max(len(args), 1))
+    return samples
+
+
+def run(scales=SCALES, iterations=ITERATIONS, repeat=REPEAT, seed=0, only=None):
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "repeat": repeat,
+            "seed": seed,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": {},
+    }
+    for scale in scales:
+        t0 = time.perf_counter()
+        data = Dataset(scale, seed)
+        system = build_system(data, seed)
+        print(f"\nscale {scale:,}: {len(data.courses):,} courses, "
+              f"built in {time.perf_counter() - t0:.2f}s")
+        print(f"  {'operation':36s} {'best ns/op':>12s} {'median ns/op':>13s}")
+        for name, setup in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            samples = time_benchmark(system, data, setup, iterations, repeat, seed)
+            if samples is None:
+                print(f"  {name:36s} {'skipped':>12s}")
+                continue
+            entry = {"best_ns": min(samples), "median_ns": statistics.median(samples),
+                     "samples_ns": samples}
+            results["results"][f"{name}@{scale}"] = entry
+            print(f"  {name:36s} {entry['best_ns']:12,.0f} {entry['median_ns']:13,.0f}")
+        system.close()
+    return results
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """Print a comparison table; returns the keys that regressed beyond threshold."""
+    regressions = []
+    base, cur = baseline["results"], current["results"]
+    print(f"\n  {'benchmark':44s} {'baseline':>10s} {'current':>10s} {'change':>8s}")
+    for key in sorted(cur, key=lambda k: (int(k.rsplit("@", 1)[1]), k)):
+        if key not in base:
+            print(f"  {key:44s} {'-':>10s} {cur[key]['best_ns']:10,.0f} {'new':>8s}")
+            continue
+        before, after = base[key]["best_ns"], cur[key]["best_ns"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"  {key:44s} {before:10,.0f} {after:10,.0f} {change:+7.1%}{flag}")
+    missing = sorted(set(base) - set(cur))
+    if missing:
+        print(f"  not run this time: {', '.join(missing)}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="run just these operations")
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="compare this run against a previous results file")
+    parser.add_argument("--diff", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare two results files without running anything")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="slowdown that counts as a regression (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.diff:
+        with open(args.diff[0]) as f:
+            baseline = json.load(f)
+        with open(args.diff[1]) as f:
+            current = json.load(f)
+    else:
+        current = run(args.scales, args.iterations, args.repeat, args.seed, args.only)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(current, f, indent=2)
+        if not args.compare:
+            return 0
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+from controllers import RegistrationSystem
+from seed_courses import load_requisites, seed_courses
+
+
+def create_system(seed: bool = True, db_path: str = None, journal_dir: str = None,
+                  compact: bool = False):
+    """
+    Build a ready-to-use RegistrationSystem without importing the GUI stack.
+    Shared by main.py, scripts, servers and benchmarks.
+    """
+    repository = None
+    if db_path:
+        from storage import SQLiteRepository
+        repository = SQLiteRepository(db_path)
+
+    system = RegistrationSystem(repository, compact=compact)
+    if seed:
+        # Only a fresh catalog is seeded: re-importing into an existing
+        # database would bring back courses that were removed from it
+        if not system.get_course_count():
+            seed_courses(system)
+        # Requisite edges are not persisted, so they are loaded on every start
+        load_requisites(system)
+    if journal_dir:
+        system.enable_journal(journal_dir)
+    return system
@@ -1,11 +1,42 @@
+import importlib
+
 from .authentication_service import AuthenticationService
 from .course_catalog import CourseCatalog
+from .event_bus import ENROLLMENT_CHANGED, EnrollmentEvent, EventBus
+from .lock_stripes import LockStripes
+from .prerequisites import PrerequisiteGraph
 from .registration_manager import RegistrationManager
 from .registration_system import RegistrationSystem
+from .session_store import SessionStore
 
 __all__ = [
+    "AdmissionQueue",
     "AuthenticationService",
     "CourseCatalog",
+    "ENROLLMENT_CHANGED",
+    "EnrollmentEvent",
+    "EventBus",
+    "LockStripes",
+    "Metrics",
+    "PrerequisiteGraph",
     "RegistrationManager",
     "RegistrationSystem",
+    "SessionStore",
+    "ShardedRegistrationSystem",
 ]
+
+# Loaded on first access: AdmissionQueue pulls in asyncio, which would
+# dominate the import time of every headless script; Metrics is only
+# needed once instrumentation is switched on, and the sharded mode pulls
+# in multiprocessing.
+_LAZY = {
+    "AdmissionQueue": ".admission_queue",
+    "Metrics": ".metrics",
+    "ShardedRegistrationSystem": ".sharding",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections import deque
+
+BUSY = "Registration is busy. Please try again shortly."
+FULL = "Course is full."
+
+
+class AdmissionQueue:
+    """
+    asyncio front end for RegistrationSystem that absorbs registration-open
+    traffic spikes:
+    - a bounded request queue drained by a fixed number of workers
+    - explicit backpressure: when the queue is saturated, new requests are
+      answered immediately with BUSY instead of piling up
+    - per-course coalescing: once a course reports full, queued register
+      requests for it are answered from the course itself, without going
+      through RegistrationManager, until a seat frees up
+    - queue-depth and wait-time metrics for sizing
+
+    The blocking system calls run in the loop's default executor; the
+    registration engine is thread-safe, so workers can overlap.
+    """
+
+    def __init__(self, system, max_pending: int = 1000, workers: int = 8,
+                 wait_samples: int = 1024):
+        self.system = system
+        self.max_pending = max_pending
+        self.num_workers = workers
+        self._queue = None
+        self._workers = []
+        self._full_courses = set()  # course IDs last seen full
+        self._waits = deque(maxlen=wait_samples)  # recent queue wait times (s)
+        self._stats = {
+            "submitted": 0, "completed": 0, "rejected": 0, "coalesced": 0,
+            "max_depth": 0, "wait_total": 0.0, "wait_max": 0.0,
+        }
+
+    # ---------- lifecycle ----------
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._workers = [asyncio.ensure_future(self._worker())
+                         for _ in range(self.num_workers)]
+
+    async def stop(self):
+        """Finish the queued requests, then stop the workers."""
+        await self._queue.join()
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # ---------- requests ----------
+    async def register_course(self, cid, token=None):
+        return await self._submit("register", cid, token)
+
+    async def drop_course(self, cid, token=None):
+        return await self._submit("drop", cid, token)
+
+    async def _submit(self, op, cid, token):
+        if self._queue.full():
+            self._stats["rejected"] += 1
+            return False, BUSY
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((op, cid, token, future, time.perf_counter()))
+        self._stats["submitted"] += 1
+        self._stats["max_depth"] = max(self._stats["max_depth"], self._queue.qsize())
+        return await future
+
+    def _still_full(self, cid) -> bool:
+        # Read the course directly: an O(1) check that never takes the
+        # manager's locks. A stale "full" mark is cleared here.
+        course = self.system.get_course_details(cid)
+        if course is not None and course.is_full():
+            return True
+        self._full_courses.discard(cid)
+        return False
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            op, cid, token, future, enqueued = await self._queue.get()
+            try:
+                self._record_wait(time.perf_counter() - enqueued)
+                if op == "register" and cid in self._full_courses and self._still_full(cid):
+                    self._stats["coalesced"] += 1
+                    result = (False, FULL)
+                else:
+                    call = self.system.register_course if op == "register" else self.system.drop_course
+                    result = await loop.run_in_executor(None, call, cid, token)
+                    ok, msg = result
+                    if op == "register" and msg == FULL:
+                        self._full_courses.add(cid)
+                    elif op == "drop" and ok:
+                        self._full_courses.discard(cid)
+                if not future.cancelled():
+                    future.set_result(result)
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            finally:
+                self._stats["completed"] += 1
+                self._queue.task_done()
+
+    # ---------- metrics ----------
+    def _record_wait(self, wait):
+        self._waits.append(wait)
+        self._stats["wait_total"] += wait
+        self._stats["wait_max"] = max(self._stats["wait_max"], wait)
+
+    def metrics(self) -> dict:
+        """Snapshot of queue depth, outcomes and wait times (seconds)."""
+        waits = sorted(self._waits)
+
+        def pct(p):
+            return waits[min(len(waits) - 1, int(p * len(waits)))] if waits else 0.0
+
+        completed = self._stats["completed"]
+        return {
+            "depth": self._queue.qsize() if self._queue else 0,
+            "capacity": self.max_pending,
+            **self._stats,
+            "wait_avg": self._stats["wait_total"] / completed if completed else 0.0,
+            "wait_p50": pct(0.50),
+            "wait_p95": pct(0.95),
+            "wait_p99": pct(0.99),
+        }
@@ -1,28 +1,83 @@
 from models import Student
+from storage import MemoryRepository
 
 class AuthenticationService:
     """
     Controller for Student-related operations:
-    - sign up
+    - sign up (single or bulk)
     - login
+    Students are kept in a dict keyed by student ID, so lookups are O(1).
+    With case_insensitive=True, IDs are also matched case-folded
+    ("N12345" and "n12345" are the same student).
+    New students are written through to the repository.
+    Students are built by `student_factory` (the Student class by default,
+    CompactRegistry.new_student for the compact model).
     """
 
-    def __init__(self):
-        self.students = []  # in-memory list of Student
+    def __init__(self, repository=None, case_insensitive: bool = False,
+                 student_factory=Student):
+        self.repository = repository or MemoryRepository()
+        self.student_factory = student_factory
+        self.students = []       # in-memory list of Student, in sign-up order
+        self._by_id = {}         # student_id -> Student
+        self._by_folded_id = {}  # student_id.casefold() -> Student
+        self.case_insensitive = case_insensitive
+
+    def _key(self, student_id: str) -> str:
+        return student_id.casefold() if self.case_insensitive else student_id
+
+    def _directory(self) -> dict:
+        return self._by_folded_id if self.case_insensitive else self._by_id
+
+    def _add(self, student: Student):
+        self.students.append(student)
+        self._by_id[student.student_id] = student
+        self._by_folded_id.setdefault(student.student_id.casefold(), student)
+
+    def load(self, students):
+        """Add already-persisted students without writing them back."""
+        for s in students:
+            self._add(s)
+
+    def find_student(self, student_id: str):
+        return self._directory().get(self._key(student_id))
 
     def check_if_exists(self, student_id: str) -> bool:
-        return any(s.student_id == student_id for s in self.students)
+        return self._key(student_id) in self._directory()
 
     def sign_up(self, student_id: str, name: str, password: str):
         if self.check_if_exists(student_id):
             return None, "Student ID already exists."
 
-        new_student = Student(student_id, name, password)
-        self.students.append(new_student)
+        new_student = self.student_factory(student_id, name, password)
+        self.repository.add_students([new_student])
+        self._add(new_student)
         return new_student, "Sign-up success."
 
+    def sign_up_many(self, rows):
+        """
+        Bulk sign-up from an iterable of (student_id, name, password).
+        Rows are validated and inserted in a single pass; a duplicate is
+        reported against the directory or an earlier row of the same batch.
+        Returns (created students, [(row index, student_id, message), ...]).
+        """
+        created, errors = [], []
+        directory = self._directory()
+        for i, (student_id, name, password) in enumerate(rows):
+            if not student_id or not name or not password:
+                errors.append((i, student_id, "All fields are required."))
+                continue
+            if self._key(student_id) in directory:
+                errors.append((i, student_id, "Student ID already exists."))
+                continue
+            new_student = self.student_factory(student_id, name, password)
+            self._add(new_student)
+            created.append(new_student)
+        self.repository.add_students(created)
+        return created, errors
+
     def login(self, student_id: str, password: str):
-        for s in self.students:
-            if s.student_id == student_id and s.password == password:
-                return s, "Login success."
+        s = self.find_student(student_id)
+        if s is not None and s.password == password:
+            return s, "Login success."
         return None, "Invalid credentials."
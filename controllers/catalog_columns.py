@@ -0,0 +1,120 @@
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class CatalogColumns:
+    """
+    Optional NumPy-backed columnar view of the course catalog.
+
+    Course IDs, department codes, credits, capacity and enrolled counts are
+    kept as parallel arrays (one row per course). The view follows the
+    catalog (add / remove / update) and RegistrationManager enrollment
+    changes, so predicates such as "4-credit MATH-UA courses with at least 5
+    open seats" are evaluated vectorized over the whole catalog.
+    """
+
+    def __init__(self, catalog, manager=None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for CatalogColumns: pip install numpy")
+        self.catalog = catalog
+        self.rebuild()
+        catalog.subscribe(self._on_catalog_change)
+        if manager is not None:
+            manager.subscribe(self._on_enrollment)
+
+    # ---------- maintenance ----------
+    def rebuild(self):
+        courses = list(self.catalog.get_all_courses())
+        self._size = 0
+        self._rows = {}         # course_id -> row
+        self._dept_codes = {}   # department -> code
+        self._allocate(max(16, len(courses)))
+        for c in courses:
+            self._append(c)
+
+    def _allocate(self, n):
+        self.course_ids = np.empty(n, dtype=object)
+        self.department = np.zeros(n, dtype=np.int32)
+        self.credits = np.zeros(n, dtype=np.int32)
+        self.capacity = np.zeros(n, dtype=np.int32)
+        self.enrolled = np.zeros(n, dtype=np.int32)
+
+    def _grow(self):
+        n = len(self.credits) * 2
+        for name in ("course_ids", "department", "credits", "capacity", "enrolled"):
+            old = getattr(self, name)
+            new = np.empty(n, dtype=old.dtype) if old.dtype == object else np.zeros(n, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _write(self, row, c):
+        self.course_ids[row] = c.course_id
+        self.department[row] = self._dept_codes.setdefault(c.department, len(self._dept_codes))
+        self.credits[row] = c.credits
+        self.capacity[row] = c.capacity
+        self.enrolled[row] = c.enrolled_count()
+
+    def _append(self, c):
+        if self._size == len(self.credits):
+            self._grow()
+        row = self._size
+        self._write(row, c)
+        self._rows[c.course_id] = row
+        self._size += 1
+
+    def _on_catalog_change(self, action, c):
+        if action == "add":
+            self._append(c)
+        elif action == "update":
+            self._write(self._rows[c.course_id], c)
+        else:
+            self.rebuild()  # removals are rare; keep rows dense
+
+    def _on_enrollment(self, student, course, delta):
+        row = self._rows.get(course.course_id)
+        if row is not None:
+            self.enrolled[row] += delta
+
+    # ---------- queries ----------
+    def __len__(self) -> int:
+        return self._size
+
+    def seats_available(self):
+        n = self._size
+        return self.capacity[:n] - self.enrolled[:n]
+
+    def query(self, department=None, credits=None, min_seats=None,
+              sort_by=None, descending=False, limit=None):
+        """
+        Course IDs matching every given predicate.
+        sort_by: "seats", "credits", "capacity" or "enrolled".
+        """
+        n = self._size
+        mask = np.ones(n, dtype=bool)
+        if department is not None:
+            code = self._dept_codes.get(department)
+            if code is None:
+                return []
+            mask &= self.department[:n] == code
+        if credits is not None:
+            mask &= self.credits[:n] == credits
+        if min_seats is not None:
+            mask &= self.seats_available() >= min_seats
+        rows = np.flatnonzero(mask)
+
+        if sort_by is not None:
+            column = self.seats_available() if sort_by == "seats" else getattr(self, sort_by)[:n]
+            keys = column[rows]
+            order = np.argsort(-keys if descending else keys, kind="stable")
+            rows = rows[order]
+        if limit is not None:
+            rows = rows[:limit]
+        return self.course_ids[rows].tolist()
+
+    def find_courses(self, **predicates):
+        """Like query(), but returns the Course objects."""
+        return [self.catalog.find_course(cid) for cid in self.query(**predicates)]
@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import namedtuple
+
+
+class CourseView(namedtuple("CourseView", [
+        "course_id", "title", "instructor", "credits", "capacity",
+        "meeting_times", "enrolled"])):
+    """Immutable copy of a Course with its seat count, as of one snapshot."""
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, c):
+        return cls(c.course_id, c.title, c.instructor, c.credits, c.capacity,
+                   c.meeting_times, c.enrolled_count())
+
+    @property
+    def department(self) -> str:
+        return self.course_id.split(" ", 1)[0]
+
+    # Same read API as Course, so views can stand in for courses in the UI
+    def enrolled_count(self) -> int:
+        return self.enrolled
+
+    def seats_available(self) -> int:
+        return max(self.capacity - self.enrolled, 0)
+
+    def is_full(self) -> bool:
+        return self.enrolled >= self.capacity
+
+
+class CatalogSnapshot:
+    """
+    One immutable version of the catalog. Nothing in it changes after
+    publication, so any number of threads can read it without locks.
+    """
+
+    def __init__(self, version: int, courses, positions):
+        self.version = version
+        self.published = time.time()
+        self.courses = courses        # tuple of CourseView in catalog order
+        self._positions = positions   # course_id -> index; shared between versions
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def __iter__(self):
+        return iter(self.courses)
+
+    def find(self, cid: str):
+        i = self._positions.get(cid)
+        return self.courses[i] if i is not None else None
+
+    def page(self, offset: int, limit: int):
+        return self.courses[offset:offset + limit]
+
+    def open_courses(self):
+        return [v for v in self.courses if v.enrolled < v.capacity]
+
+
+class SnapshotPublisher:
+    """
+    Publishes CatalogSnapshots copy-on-write:
+    - catalog and enrollment listeners only note which course changed
+      (a set add), so register/drop never wait on readers or on copying
+    - a background thread publishes at most once per `interval` seconds,
+      folding every change since the last version into one new snapshot
+    - a new version re-copies only the changed courses; unchanged
+      CourseViews (and, without catalog edits, the position index) are
+      shared with the previous version
+    - publication is a single reference swap, so readers always see one
+      whole version
+    """
+
+    def __init__(self, catalog, manager=None, interval: float = 0.05):
+        self.catalog = catalog
+        self.interval = interval
+        self._dirty = set()       # course IDs changed since the last version
+        self._structural = False  # courses added, removed or edited
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._publish_lock = threading.Lock()
+        self._thread = None
+        self._snapshot = self._build_all(0)
+        catalog.subscribe(self._on_catalog_change)
+        if manager is not None:
+            manager.subscribe(self._on_enrollment)
+
+    # ---------- change tracking ----------
+    def _on_catalog_change(self, action, c):
+        self._structural = True
+        self._dirty.add(c.course_id)
+        self._wake.set()
+
+    def _on_enrollment(self, student, course, delta):
+        self._dirty.add(course.course_id)
+        if not self._wake.is_set():  # skip the Event's lock when already pending
+            self._wake.set()
+
+    # ---------- publishing ----------
+    def snapshot(self) -> CatalogSnapshot:
+        """The latest published version (lock-free)."""
+        return self._snapshot
+
+    def _build_all(self, version, prev=None, dirty=()):
+        """Snapshot in catalog order, reusing `prev`'s views of unchanged courses."""
+        views = []
+        for c in list(self.catalog.courses):
+            view = prev.find(c.course_id) if prev is not None and c.course_id not in dirty else None
+            views.append(view or CourseView.of(c))
+        positions = {v.course_id: i for i, v in enumerate(views)}
+        return CatalogSnapshot(version, tuple(views), positions)
+
+    def publish(self) -> CatalogSnapshot:
+        """Fold pending changes into a new version now; returns the current version."""
+        with self._publish_lock:
+            # Swap the set out first: changes that land meanwhile go to the next round
+            dirty, self._dirty = self._dirty, set()
+            structural, self._structural = self._structural, False
+            prev = self._snapshot
+            if not dirty and not structural:
+                return prev
+            if structural:
+                self._snapshot = self._build_all(prev.version + 1, prev, dirty)
+                return self._snapshot
+            courses = list(prev.courses)
+            for cid in dirty:
+                i = prev._positions.get(cid)
+                c = self.catalog.find_course(cid)
+                if i is not None and c is not None:
+                    courses[i] = CourseView.of(c)
+            self._snapshot = CatalogSnapshot(prev.version + 1, tuple(courses), prev._positions)
+            return self._snapshot
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            if self._stop.is_set():
+                return
+            # Let more changes accumulate, then publish them together
+            if self._stop.wait(self.interval):
+                return
+            self._wake.clear()
+            self.publish()
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="catalog-snapshots",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.publish()
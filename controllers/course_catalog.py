@@ -1,24 +1,162 @@
 from models import Course
+from models.schedule import parse_meeting_times
+from storage import MemoryRepository
 
 class CourseCatalog:
     """
     Controller for course-related operations:
-    - add courses
+    - add / remove / update courses
     - list courses
-    - find course by ID
+    - find course by ID (dict index)
+    - find courses by department, instructor or credits (secondary indexes)
+    Added, updated and removed courses are written through to the repository.
+    `course_factory` builds Course objects for loaders and importers (the
+    Course class by default, CompactRegistry.new_course for the compact model).
     """
 
-    def __init__(self):
-        self.courses = []  # list of Course
+    # Course attributes that feed a secondary index
+    INDEXED_FIELDS = ("department", "instructor", "credits")
+    # Course attributes update_course() may change
+    UPDATABLE_FIELDS = ("title", "instructor", "credits", "capacity", "meeting_times")
 
-    def add_course(self, c: Course):
+    def __init__(self, repository=None, course_factory=Course):
+        self.repository = repository or MemoryRepository()
+        self.course_factory = course_factory
+        self.courses = []  # list of Course, in insertion order
+        self._by_id = {}   # course_id -> Course
+        # field -> value -> {course_id: Course}; inner dicts keep insertion order
+        self._indexes = {field: {} for field in self.INDEXED_FIELDS}
+        self._listeners = []  # callables (action, course)
+
+    def subscribe(self, listener):
+        """Call `listener(action, course)` after "add", "remove" or "update"."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify(self, action: str, c: Course):
+        for listener in self._listeners:
+            listener(action, c)
+
+    # ---------- index maintenance ----------
+    def _index(self, c: Course):
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(c, field), {})[c.course_id] = c
+
+    def _unindex(self, c: Course):
+        for field, index in self._indexes.items():
+            key = getattr(c, field)
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(c.course_id, None)
+            if not bucket:
+                del index[key]
+
+    # ---------- mutations ----------
+    def _insert(self, c: Course):
         self.courses.append(c)
+        self._by_id[c.course_id] = c
+        self._index(c)
+
+    def load(self, courses):
+        """Add already-persisted courses without writing them back."""
+        for c in courses:
+            if c.course_id not in self._by_id:
+                self._insert(c)
+
+    def add_course(self, c: Course) -> bool:
+        if c.course_id in self._by_id:
+            return False
+        self.repository.add_courses([c])
+        self._insert(c)
+        self._notify("add", c)
+        return True
+
+    def add_courses(self, courses):
+        """
+        Bulk insert: the whole batch is written to the repository in one
+        call and indexed in a single pass. Returns the courses rejected as
+        duplicates (already in the catalog or repeated within the batch).
+        """
+        accepted, duplicates = {}, []
+        for c in courses:
+            if c.course_id in self._by_id or c.course_id in accepted:
+                duplicates.append(c)
+            else:
+                accepted[c.course_id] = c
+        if accepted:
+            self.repository.add_courses(accepted.values())
+            for c in accepted.values():
+                self._insert(c)
+            for c in accepted.values():
+                self._notify("add", c)
+        return duplicates
+
+    def remove_course(self, cid: str):
+        """
+        Remove a course and return it. A course that still has enrolled
+        students is refused (returns None): drop them through the
+        RegistrationManager first, so their schedules and credits stay right.
+        """
+        c = self._by_id.get(cid)
+        if c is None or c.enrolled_count() or not self.repository.remove_course(c):
+            return None
+        del self._by_id[cid]
+        self._unindex(c)
+        self.courses.remove(c)
+        self._notify("remove", c)
+        return c
 
+    def update_course(self, cid: str, **fields) -> bool:
+        """Change course attributes, keeping every index in step.
+
+        Only the UPDATABLE_FIELDS can change (the course ID is the primary
+        key). The change is written to the repository first and refused,
+        leaving the course as it was, if the capacity would drop below the
+        current enrollment or the repository does not accept it.
+        """
+        c = self._by_id.get(cid)
+        if c is None or not fields or not set(fields) <= set(self.UPDATABLE_FIELDS):
+            return False
+        if fields.get("capacity", c.capacity) < c.enrolled_count():
+            return False
+        if "meeting_times" in fields:
+            parse_meeting_times(fields["meeting_times"])  # raises ValueError before any change
+        if not self.repository.update_course(c, fields):
+            return False
+        self._unindex(c)
+        for name, value in fields.items():
+            setattr(c, name, value)
+        self._index(c)
+        self._notify("update", c)
+        return True
+
+    # ---------- queries ----------
     def get_all_courses(self):
         return self.courses
 
+    def count(self) -> int:
+        return len(self.courses)
+
+    def get_page(self, offset: int, limit: int):
+        return self.courses[offset:offset + limit]
+
     def find_course(self, cid: str):
-        for c in self.courses:
-            if c.course_id == cid:
-                return c
-        return None
+        return self._by_id.get(cid)
+
+    def _lookup(self, field: str, value):
+        return list(self._indexes[field].get(value, {}).values())
+
+    def find_by_department(self, department: str):
+        return self._lookup("department", department)
+
+    def find_by_instructor(self, instructor: str):
+        return self._lookup("instructor", instructor)
+
+    def find_by_credits(self, credits: int):
+        return self._lookup("credits", credits)
+
+    def get_departments(self):
+        return list(self._indexes["department"])
@@ -0,0 +1,207 @@
+import bisect
+import heapq
+import itertools
+import re
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str):
+    return _TOKEN.findall(text.lower())
+
+
+class _TrieNode:
+    __slots__ = ("children", "count", "top", "dirty")
+
+    def __init__(self):
+        self.children = {}
+        self.count = 0      # (token, course) postings in this subtree
+        self.top = []       # best (-weight, course_id) under this prefix, sorted
+        self.dirty = False  # `top` must be recomputed after a removal
+
+
+class CourseSearch:
+    """
+    Full-text and type-ahead search over course ID, title and instructor.
+
+    - an inverted index maps each token to the courses containing it, with
+      a field weight (course ID > title > instructor)
+    - a prefix trie over the tokens keeps the best TOP_K courses at every
+      node, so a one-word type-ahead query is a walk down the trie plus a
+      slice of a precomputed list
+    - multi-word queries treat the last word as a prefix. They first look
+      for matches among the prefix's cached best courses; if that does not
+      fill the page, they scan whichever is smaller, the rarest complete
+      word's postings or the prefix's subtree, first only SCAN_LIMIT
+      candidates and, if the page is still short, all of them. Every
+      matching course is therefore found; a broad query such as "intro a"
+      returns good matches quickly rather than the exact best of thousands,
+      and typing more narrows it
+
+    The index follows CourseCatalog changes incrementally.
+    """
+
+    FIELD_WEIGHTS = (("course_id", 3), ("title", 2), ("instructor", 1))
+    TOP_K = 50  # one page of GUI type-ahead results
+    SCAN_LIMIT = 200  # candidates a multi-word query ranks before a full scan
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self._postings = {}       # token -> {course_id: weight}
+        self._course_tokens = {}  # course_id -> {token: weight}
+        self._root = _TrieNode()
+        for c in catalog.get_all_courses():
+            self._add(c)
+        catalog.subscribe(self._on_catalog_change)
+
+    # ---------- indexing ----------
+    def _tokens_of(self, c):
+        weights = {}
+        for field, weight in self.FIELD_WEIGHTS:
+            for token in tokenize(str(getattr(c, field))):
+                if weights.get(token, 0) < weight:
+                    weights[token] = weight
+        return weights
+
+    def _add(self, c):
+        tokens = self._tokens_of(c)
+        self._course_tokens[c.course_id] = tokens
+        for token, weight in tokens.items():
+            self._postings.setdefault(token, {})[c.course_id] = weight
+            entry = (-weight, c.course_id)
+            node = self._root
+            for ch in token:
+                node = node.children.setdefault(ch, _TrieNode())
+                node.count += 1
+                self._offer(node, entry)
+
+    def _offer(self, node, entry):
+        top = node.top
+        for i, (_, cid) in enumerate(top):
+            if cid == entry[1]:
+                if top[i] <= entry:
+                    return
+                del top[i]
+                break
+        if len(top) < self.TOP_K or entry < top[-1]:
+            bisect.insort(top, entry)
+            del top[self.TOP_K:]
+
+    def _remove(self, course_id):
+        tokens = self._course_tokens.pop(course_id, {})
+        for token in tokens:
+            postings = self._postings[token]
+            del postings[course_id]
+            if not postings:
+                del self._postings[token]
+            node = self._root
+            for ch in token:
+                node = node.children[ch]
+                node.count -= 1
+                if any(cid == course_id for _, cid in node.top):
+                    node.dirty = True
+
+    def _on_catalog_change(self, action, c):
+        if action != "add":
+            self._remove(c.course_id)
+        if action != "remove":
+            self._add(c)
+
+    # ---------- trie ----------
+    def _node(self, prefix):
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def _subtree_best(self, node, prefix, cap=None):
+        """Best weight per course over every token under `node` (the first `cap` postings)."""
+        best = {}
+        seen = 0
+        stack = [(node, prefix)]
+        while stack:
+            n, token = stack.pop()
+            postings = self._postings.get(token, {})
+            if cap is not None and seen + len(postings) > cap:
+                postings = dict(itertools.islice(postings.items(), cap - seen))
+            seen += len(postings)
+            for cid, weight in postings.items():
+                if best.get(cid, 0) < weight:
+                    best[cid] = weight
+            if cap is not None and seen >= cap:
+                break
+            stack.extend((child, token + ch) for ch, child in n.children.items())
+        return best
+
+    def _top(self, node, prefix, limit):
+        if limit > self.TOP_K:
+            best = self._subtree_best(node, prefix)
+            return sorted((-w, cid) for cid, w in best.items())[:limit]
+        if node.dirty:
+            best = self._subtree_best(node, prefix)
+            node.top = sorted((-w, cid) for cid, w in best.items())[:self.TOP_K]
+            node.dirty = False
+        return node.top[:limit]
+
+    # ---------- queries ----------
+    def search(self, query: str, limit: int = 10):
+        """Course IDs best matching `query`; the last word may be incomplete."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        *words, prefix = terms
+        node = self._node(prefix)
+        if node is None:
+            return []
+        if not words:
+            return [cid for _, cid in self._top(node, prefix, limit)]
+
+        postings = [self._postings.get(w) for w in words]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+
+        # The prefix's cached best courses first: enough hits there and
+        # nothing needs scanning
+        ranked = {}
+        for neg_weight, cid in self._top(node, prefix, self.TOP_K):
+            if all(cid in p for p in postings):
+                ranked[cid] = neg_weight - sum(p[cid] for p in postings)
+        if len(ranked) < limit:
+            # A capped pass first; a short page means the cap may have
+            # skipped matches, so scan the rest too
+            if not self._scan(node, prefix, postings, ranked, self.SCAN_LIMIT) \
+                    and len(ranked) < limit:
+                self._scan(node, prefix, postings, ranked)
+        return [cid for _, cid in heapq.nsmallest(limit, ((v, k) for k, v in ranked.items()))]
+
+    def _scan(self, node, prefix, postings, ranked, cap=None) -> bool:
+        """
+        Rank into `ranked` the courses matching every posting dict and the
+        prefix, looking at the first `cap` candidates of the smaller side.
+        Returns True if no candidate was skipped.
+        """
+        if node.count < len(postings[0]):
+            # A capped walk can see only some of a course's tokens, so a
+            # later full walk may raise its weight
+            for cid, weight in self._subtree_best(node, prefix, cap).items():
+                if all(cid in p for p in postings):
+                    score = -(weight + sum(p[cid] for p in postings))
+                    if score < ranked.get(cid, 0):
+                        ranked[cid] = score
+            return cap is None or node.count <= cap
+        for cid in itertools.islice(postings[0], cap):
+            if cid in ranked or not all(cid in p for p in postings[1:]):
+                continue
+            weight = 0
+            for token, w in self._course_tokens[cid].items():
+                if w > weight and token.startswith(prefix):
+                    weight = w
+            if weight:
+                ranked[cid] = -(weight + sum(p[cid] for p in postings))
+        return cap is None or len(postings[0]) <= cap
+
+    def search_courses(self, query: str, limit: int = 10):
+        return [self.catalog.find_course(cid) for cid in self.search(query, limit)]
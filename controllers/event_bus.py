@@ -0,0 +1,41 @@
+import threading
+from collections import namedtuple
+
+ENROLLMENT_CHANGED = "enrollment_changed"
+
+# action is "register" or "drop"; seat and credit figures are after the change
+EnrollmentEvent = namedtuple(
+    "EnrollmentEvent",
+    ["action", "student_id", "course_id", "enrolled", "capacity", "credits_remaining"],
+)
+
+
+class EventBus:
+    """
+    Minimal publish/subscribe hub.
+
+    Subscriber lists are replaced, never mutated, so publish() can iterate
+    without taking a lock. Callbacks run synchronously on the publishing
+    thread; anything slow (or thread-affine, like Tk widgets) should hand
+    the event off to its own thread or loop.
+    """
+
+    def __init__(self):
+        self._subscribers = {}  # topic -> tuple of callbacks
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str, callback):
+        """Register `callback(event)`; returns a function that unsubscribes it."""
+        with self._lock:
+            self._subscribers[topic] = self._subscribers.get(topic, ()) + (callback,)
+
+        def unsubscribe():
+            with self._lock:
+                callbacks = self._subscribers.get(topic, ())
+                self._subscribers[topic] = tuple(cb for cb in callbacks if cb is not callback)
+
+        return unsubscribe
+
+    def publish(self, topic: str, event):
+        for callback in self._subscribers.get(topic, ()):
+            callback(event)
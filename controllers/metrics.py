@@ -0,0 +1,338 @@
+import json
+import os
+import threading
+import time
+
+from .admission_queue import BUSY
+from .registration_manager import (CART_REJECTED, COREQUISITES_MISSING,
+                                   PREREQUISITES_MISSING, SCHEDULE_CONFLICT)
+
+# Histogram bucket i counts calls that took under 2**i microseconds; the
+# last bucket is open-ended (+Inf), so 28 buckets cover up to ~67 s.
+BUCKETS = 28
+BUCKET_BOUNDS = tuple(2 ** i / 1e6 for i in range(BUCKETS - 1)) + (float("inf"),)
+
+# Per-request facade operations instrumented by default
+DEFAULT_METHODS = (
+    "register_student", "register_students", "login", "logout",
+    "open_session", "close_session", "get_session_user",
+    "get_all_courses", "get_catalog_snapshot", "get_course_count", "get_courses_page",
+    "get_course_details", "get_open_courses", "get_requisites",
+    "record_completed_courses", "get_completed_courses",
+    "search_courses", "register_course", "drop_course", "register_many", "swap",
+    "join_waitlist", "leave_waitlist", "get_waitlist_position",
+    "get_my_schedule", "get_current_user_credit_remaining",
+)
+
+
+# Failure label values. Facade messages can carry course IDs and other
+# request data, so they are mapped to these fixed codes (keys are messages
+# without the trailing period or any ": details" suffix); anything else is
+# counted as OTHER_REASON.
+REASON_CODES = {
+    "Course not found": "course_not_found",
+    "Student not found": "student_not_found",
+    "Already registered": "already_registered",
+    "Course is full": "full",
+    "You have exceeded the maximum credits for the semester": "credit_limit",
+    SCHEDULE_CONFLICT.rstrip("."): "schedule_conflict",
+    PREREQUISITES_MISSING.rstrip("."): "prereq",
+    COREQUISITES_MISSING.rstrip("."): "coreq",
+    CART_REJECTED.rstrip("."): "cart_rejected",
+    "Duplicate course in cart": "duplicate_in_cart",
+    "Could not save the registration": "storage_refused",
+    "Could not save the swap": "storage_refused",
+    "Could not save the drop": "storage_refused",
+    "Cannot swap a course for itself": "same_course",
+    "You are not enrolled in this course": "not_enrolled",
+    "Course has open seats. Register instead": "has_open_seats",
+    "Already on the waitlist": "already_waitlisted",
+    "You are not on the waitlist for this course": "not_waitlisted",
+    "You must be logged in": "not_logged_in",
+    BUSY.rstrip("."): "busy",
+    "Student ID already exists": "duplicate_student",
+    "All fields are required": "missing_fields",
+    "Invalid credentials": "invalid_credentials",
+    "Not authorized": "not_authorized",
+}
+OTHER_REASON = "other"
+
+
+def reason_code(message: str) -> str:
+    """Fixed code for a facade failure message."""
+    return REASON_CODES.get(message.split(":", 1)[0].rstrip("."), OTHER_REASON)
+
+
+def failure_reason(result, method=None):
+    """
+    Failure reason code (see REASON_CODES) for a facade result, or None on success.
+    Facade calls report failure as (falsy, message) or, for carts,
+    (False, [(course_id, ok, message), ...]); anything else is a success.
+    register_students returns (created, [(row, student_id, message), ...])
+    and fails, with its first rejected row's reason, if any row was rejected.
+    """
+    if method == "register_students":
+        errors = result[1] if isinstance(result, tuple) and len(result) == 2 else None
+        return reason_code(errors[0][2]) if errors else None
+    if not (isinstance(result, tuple) and len(result) == 2) or result[0]:
+        return None
+    detail = result[1]
+    if isinstance(detail, str):
+        return reason_code(detail)
+    if isinstance(detail, list):
+        # Report the course that sank the cart, not the CART_REJECTED bystanders.
+        # Other list results, e.g. get_requisites' ([], [...]), are not carts.
+        messages = [entry[2] for entry in detail
+                    if isinstance(entry, tuple) and len(entry) == 3 and not entry[1]]
+        for msg in messages:
+            if msg != CART_REJECTED:
+                return reason_code(msg)
+        return reason_code(CART_REJECTED) if messages else None
+    return None
+
+
+class _Series:
+    """One thread's figures for one method; only that thread writes to it."""
+    __slots__ = ("started", "count", "sum_ns", "buckets", "failures")
+
+    def __init__(self):
+        self.started = 0
+        self.count = 0
+        self.sum_ns = 0
+        self.buckets = [0] * BUCKETS
+        self.failures = {}  # reason -> count
+
+    def record(self, ns: int, reason):
+        i = (ns // 1000).bit_length()
+        self.buckets[i if i < BUCKETS else BUCKETS - 1] += 1
+        self.count += 1
+        self.sum_ns += ns
+        if reason is not None:
+            self.failures[reason] = self.failures.get(reason, 0) + 1
+
+
+class Metrics:
+    """
+    Latency and outcome instrumentation for the RegistrationSystem facade:
+    - Per-method log-bucketed latency histograms (powers of two in µs)
+    - Success counts and failure counts by reason (a fixed code from
+      REASON_CODES, or the exception's class name)
+    - In-flight gauges (calls started but not yet finished)
+
+    Each thread records into its own shard, so the hot path takes no lock;
+    readers merge the shards. instrument() shadows the facade's methods
+    with timing wrappers on the instance and uninstrument() removes them,
+    so a system without metrics runs its plain methods at no cost.
+    """
+
+    def __init__(self, prefix: str = "registration"):
+        self.prefix = prefix
+        self._local = threading.local()
+        self._shards = []  # one {method: _Series} per thread that recorded
+        self._shards_lock = threading.Lock()
+        self._instrumented = {}  # id(target) -> (target, [method names])
+        self._server = None
+
+    # ---------- Instrumentation ----------
+    def instrument(self, target, methods=DEFAULT_METHODS):
+        """Wrap `methods` of `target` (normally a RegistrationSystem)."""
+        _, names = self._instrumented.setdefault(id(target), (target, []))
+        for name in methods:
+            if name in names:
+                continue
+            setattr(target, name, self._wrap(name, getattr(target, name)))
+            names.append(name)
+        return target
+
+    def uninstrument(self, target=None):
+        """Restore the plain methods of `target` (or of every instrumented object)."""
+        for key in ([id(target)] if target is not None else list(self._instrumented)):
+            obj, names = self._instrumented.pop(key, (None, ()))
+            for name in names:
+                vars(obj).pop(name, None)
+
+    def _shard(self):
+        shard = {}
+        self._local.shard = shard
+        with self._shards_lock:
+            self._shards.append(shard)
+        return shard
+
+    def _wrap(self, name, fn):
+        local, clock, new_shard = self._local, time.perf_counter_ns, self._shard
+
+        def timed(*args, **kwargs):
+            shard = getattr(local, "shard", None)
+            if shard is None:
+                shard = new_shard()
+            series = shard.get(name)
+            if series is None:
+                series = shard[name] = _Series()
+            series.started += 1
+            t0 = clock()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                series.record(clock() - t0, type(exc).__name__)
+                raise
+            series.record(clock() - t0, failure_reason(result, name))
+            return result
+
+        timed.__name__ = name
+        timed.__wrapped__ = fn
+        return timed
+
+    # ---------- Reading ----------
+    def snapshot(self):
+        """Merged figures per method: {method: {...}} with latencies in seconds."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged = {}
+        for shard in shards:
+            for name, s in list(shard.items()):
+                m = merged.setdefault(name, {"started": 0, "count": 0, "sum_ns": 0,
+                                             "buckets": [0] * BUCKETS, "failures": {}})
+                m["started"] += s.started
+                m["count"] += s.count
+                m["sum_ns"] += s.sum_ns
+                m["buckets"] = [a + b for a, b in zip(m["buckets"], s.buckets)]
+                for reason, n in list(s.failures.items()):
+                    m["failures"][reason] = m["failures"].get(reason, 0) + n
+
+        out = {}
+        for name in sorted(merged):
+            m = merged[name]
+            failed = sum(m["failures"].values())
+            out[name] = {
+                "count": m["count"],
+                "success": m["count"] - failed,
+                "failures": dict(sorted(m["failures"].items())),
+                "in_flight": max(m["started"] - m["count"], 0),
+                "sum_seconds": m["sum_ns"] / 1e9,
+                "p50_seconds": _quantile(m["buckets"], 0.50),
+                "p95_seconds": _quantile(m["buckets"], 0.95),
+                "p99_seconds": _quantile(m["buckets"], 0.99),
+                "buckets": m["buckets"],
+            }
+        return out
+
+    def reset(self):
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.clear()
+
+    # ---------- Export ----------
+    def to_json(self) -> str:
+        methods = self.snapshot()
+        for m in methods.values():
+            # Sparse buckets keyed by upper bound; +Inf is spelled out for JSON
+            m["buckets"] = {_le(BUCKET_BOUNDS[i]): n for i, n in enumerate(m["buckets"]) if n}
+        return json.dumps({"time": time.time(), "methods": methods}, indent=2)
+
+    def to_prometheus(self) -> str:
+        p = self.prefix
+        methods = self.snapshot()
+        lines = [
+            f"# HELP {p}_request_duration_seconds Facade call latency.",
+            f"# TYPE {p}_request_duration_seconds histogram",
+        ]
+        for name, m in methods.items():
+            label = f'method="{_escape(name)}"'
+            cumulative = 0
+            for bound, n in zip(BUCKET_BOUNDS, m["buckets"]):
+                cumulative += n
+                lines.append(f'{p}_request_duration_seconds_bucket{{{label},le="{_le(bound)}"}} '
+                             f"{cumulative}")
+            lines.append(f"{p}_request_duration_seconds_sum{{{label}}} {m['sum_seconds']!r}")
+            lines.append(f"{p}_request_duration_seconds_count{{{label}}} {m['count']}")
+
+        lines += [f"# HELP {p}_requests_total Facade calls by outcome.",
+                  f"# TYPE {p}_requests_total counter"]
+        for name, m in methods.items():
+            label = f'method="{_escape(name)}"'
+            lines.append(f'{p}_requests_total{{{label},outcome="success"}} {m["success"]}')
+            lines.append(f'{p}_requests_total{{{label},outcome="failure"}} '
+                         f'{m["count"] - m["success"]}')
+
+        lines += [f"# HELP {p}_request_failures_total Failed facade calls by reason.",
+                  f"# TYPE {p}_request_failures_total counter"]
+        for name, m in methods.items():
+            for reason, n in m["failures"].items():
+                lines.append(f'{p}_request_failures_total{{method="{_escape(name)}",'
+                             f'reason="{_escape(reason)}"}} {n}')
+
+        lines += [f"# HELP {p}_requests_in_flight Facade calls currently running.",
+                  f"# TYPE {p}_requests_in_flight gauge"]
+        for name, m in methods.items():
+            lines.append(f'{p}_requests_in_flight{{method="{_escape(name)}"}} {m["in_flight"]}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str):
+        """Write the metrics to `path` atomically: JSON for *.json, Prometheus text otherwise."""
+        text = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1"):
+        """
+        Serve /metrics (Prometheus text) and /metrics.json from a daemon
+        thread; binds to localhost unless told otherwise. Returns the port.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, ctype = metrics.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, ctype = metrics.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.stop()
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http",
+                         daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _quantile(buckets, q):
+    """Upper bound of the bucket holding the q-th quantile (None without data)."""
+    total = sum(buckets)
+    if not total:
+        return None
+    rank, seen = q * total, 0
+    for bound, n in zip(BUCKET_BOUNDS, buckets):
+        seen += n
+        if seen >= rank:
+            return bound if bound != float("inf") else BUCKET_BOUNDS[-2]
+    return BUCKET_BOUNDS[-2]
+
+
+def _le(bound) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,239 @@
+class PrerequisiteGraph:
+    """
+    Prerequisite / corequisite DAG over the course catalog.
+
+    - every course ID gets a fixed bit; requirement sets are Python ints
+    - `closure[cid]` is the bitset of all transitive prerequisites of a
+      course, computed once on load and patched incrementally on change
+    - a student's completed courses are a bitset too (Student.completed_mask),
+      so "has the student met every prerequisite" is one AND
+    - corequisites must be completed or taken in the same term; they are
+      not transitive
+
+    Completing a course also counts its own prerequisites as met, so a
+    student with credit for CSCI-UA 102 is not sent back to CSCI-UA 101.
+    That expanded mask is derived from the current closures and cached on
+    the student until the graph's `version` or their completions change.
+    """
+
+    def __init__(self, catalog=None):
+        self._bit = {}        # course_id -> bit position (never reused)
+        self._ids = []        # bit position -> course_id
+        self._prereqs = {}    # course_id -> set of direct prerequisite IDs
+        self._coreqs = {}     # course_id -> bitset of corequisites
+        self._closure = {}    # course_id -> bitset of transitive prerequisites
+        self.version = 0      # bumped whenever a closure changes
+        if catalog is not None:
+            catalog.subscribe(self._on_catalog_change)
+
+    def bit(self, cid: str) -> int:
+        """Single-bit mask of a course, assigning a position on first use."""
+        pos = self._bit.get(cid)
+        if pos is None:
+            pos = self._bit[cid] = len(self._ids)
+            self._ids.append(cid)
+        return 1 << pos
+
+    def mask(self, cids) -> int:
+        m = 0
+        for cid in cids:
+            m |= self.bit(cid)
+        return m
+
+    def course_ids(self, mask: int):
+        """Course IDs of the bits set in `mask`, in bit order."""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self._ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
+
+    # ---------- building ----------
+    def load(self, requisites):
+        """
+        Bulk-load (course_id, required_id, kind) rows, kind being
+        "prerequisite" or "corequisite", then compute every closure in one
+        topological pass. Raises ValueError on an unknown kind, a course
+        requiring itself or a cycle; the graph is then left unchanged.
+        """
+        prereqs = {cid: set(reqs) for cid, reqs in self._prereqs.items()}
+        coreqs = []
+        for cid, required, kind in requisites:
+            if cid == required:
+                raise ValueError(f"{cid} cannot require itself")
+            if kind == "prerequisite":
+                prereqs.setdefault(cid, set()).add(required)
+            elif kind == "corequisite":
+                coreqs.append((cid, required))
+            else:
+                raise ValueError(f"Unknown requisite kind: {kind!r}")
+        closure = self._closures(prereqs)
+        self._prereqs, self._closure = prereqs, closure
+        for cid, required in coreqs:
+            self._coreqs[cid] = self._coreqs.get(cid, 0) | self.bit(required)
+        self.version += 1
+
+    def rebuild(self):
+        """Recompute every closure from the prerequisite edges."""
+        self._closure = self._closures(self._prereqs)
+        self.version += 1
+
+    def _closures(self, prereqs):
+        """Closures of `prereqs` (Kahn's algorithm); raises ValueError on a cycle."""
+        indegree = {cid: len(reqs) for cid, reqs in prereqs.items()}
+        dependents = {}
+        for cid, reqs in prereqs.items():
+            for r in reqs:
+                dependents.setdefault(r, []).append(cid)
+                indegree.setdefault(r, 0)
+        ready = [cid for cid, n in indegree.items() if n == 0]
+        closure = {}
+        while ready:
+            cid = ready.pop()
+            m = 0
+            for r in prereqs.get(cid, ()):
+                m |= self.bit(r) | closure[r]
+            closure[cid] = m
+            for d in dependents.get(cid, ()):
+                indegree[d] -= 1
+                if indegree[d] == 0:
+                    ready.append(d)
+        if len(closure) < len(indegree):
+            cyclic = sorted(cid for cid in indegree if cid not in closure)
+            raise ValueError(f"Prerequisite cycle among: {', '.join(cyclic)}")
+        return {cid: m for cid, m in closure.items() if m}
+
+    def add_prerequisite(self, cid: str, required: str):
+        """Make `required` a prerequisite of `cid`; raises ValueError on a cycle."""
+        if cid == required or self._closure.get(required, 0) & self.bit(cid):
+            raise ValueError(f"{required} cannot be a prerequisite of {cid}: cycle")
+        reqs = self._prereqs.setdefault(cid, set())
+        if required in reqs:
+            return
+        reqs.add(required)
+        gained = self.bit(required) | self._closure.get(required, 0)
+        # cid and everything that (transitively) requires it gain the same bits
+        cid_bit = self.bit(cid)
+        for other, m in self._closure.items():
+            if m & cid_bit:
+                self._closure[other] = m | gained
+        self._closure[cid] = self._closure.get(cid, 0) | gained
+        self.version += 1
+
+    def remove_prerequisite(self, cid: str, required: str) -> bool:
+        reqs = self._prereqs.get(cid)
+        if not reqs or required not in reqs:
+            return False
+        reqs.discard(required)
+        if not reqs:
+            del self._prereqs[cid]
+        self._refresh(cid)
+        return True
+
+    def add_corequisite(self, cid: str, required: str):
+        if cid == required:
+            raise ValueError(f"{cid} cannot be its own corequisite")
+        self._coreqs[cid] = self._coreqs.get(cid, 0) | self.bit(required)
+
+    def remove_corequisite(self, cid: str, required: str) -> bool:
+        m = self._coreqs.get(cid, 0)
+        b = self.bit(required)
+        if not m & b:
+            return False
+        if m == b:
+            del self._coreqs[cid]
+        else:
+            self._coreqs[cid] = m & ~b
+        return True
+
+    def _refresh(self, cid: str):
+        """Recompute the closures of `cid` and its dependents after edges were removed."""
+        cid_bit = self.bit(cid)
+        stale = {cid} | {other for other, m in self._closure.items() if m & cid_bit}
+        fresh = {}
+
+        def close(c):
+            if c not in stale:
+                return self._closure.get(c, 0)
+            if c not in fresh:
+                m = 0
+                for r in self._prereqs.get(c, ()):
+                    m |= self.bit(r) | close(r)
+                fresh[c] = m
+            return fresh[c]
+
+        for c in stale:
+            m = close(c)
+            if m:
+                self._closure[c] = m
+            else:
+                self._closure.pop(c, None)
+        self.version += 1
+
+    def _on_catalog_change(self, action, course):
+        if action != "remove":
+            return
+        cid = course.course_id
+        self._coreqs.pop(cid, None)
+        had_prereqs = self._prereqs.pop(cid, None) is not None
+        dependents = [c for c, reqs in self._prereqs.items() if cid in reqs]
+        for c in dependents:
+            self.remove_prerequisite(c, cid)
+        if had_prereqs:
+            self._refresh(cid)
+
+    # ---------- queries ----------
+    def prerequisites(self, cid: str):
+        """Direct prerequisite IDs of a course."""
+        return sorted(self._prereqs.get(cid, ()))
+
+    def all_prerequisites(self, cid: str):
+        """Transitive prerequisite IDs of a course."""
+        return self.course_ids(self._closure.get(cid, 0))
+
+    def corequisites(self, cid: str):
+        return self.course_ids(self._coreqs.get(cid, 0))
+
+    def mark_completed(self, student, cids):
+        """Record completed courses on `student`."""
+        new = {cid for cid in cids if cid not in student.completed_courses}
+        if not new:
+            return
+        # Rebound rather than updated in place: a CompactStudent starts out
+        # with a shared empty frozenset
+        student.completed_courses = student.completed_courses | new
+        for cid in new:
+            student.completed_mask |= self.bit(cid)
+
+    def met_mask(self, student) -> int:
+        """Courses `student` has credit for: the completed ones and their prerequisites."""
+        cached = student.requisites_met
+        if (cached is not None and cached[0] == self.version
+                and cached[1] == student.completed_mask):
+            return cached[2]
+        m = student.completed_mask
+        for cid in student.completed_courses:
+            m |= self._closure.get(cid, 0)
+        student.requisites_met = (self.version, student.completed_mask, m)
+        return m
+
+    def missing_prerequisites(self, student, course) -> int:
+        """Bitset of prerequisites `student` still lacks for `course` (0 = eligible)."""
+        needed = self._closure.get(course.course_id, 0)
+        return needed & ~self.met_mask(student) if needed else 0
+
+    def missing_corequisites(self, student, course, taking=()) -> int:
+        """
+        Bitset of corequisites of `course` that `student` has neither completed
+        nor registered for (or has in `taking`, e.g. the rest of a cart).
+        """
+        m = self._coreqs.get(course.course_id, 0)
+        if m:
+            m &= ~self.met_mask(student)
+        if m:
+            for c in student.registered_courses:
+                m &= ~self.bit(c.course_id)
+            for c in taking:
+                m &= ~self.bit(c.course_id)
+        return m
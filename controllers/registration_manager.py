@@ -1,16 +1,82 @@
 from models import Student, Course
+from storage import MemoryRepository
+from .lock_stripes import LockStripes
+from .waitlist import Waitlist
+
+CART_REJECTED = "Not registered because another course in the cart was rejected."
+SCHEDULE_CONFLICT = "Schedule conflict with a registered course."
+PREREQUISITES_MISSING = "Prerequisites not completed."
+COREQUISITES_MISSING = "Corequisites must be completed or taken in the same term."
 
 
 class RegistrationManager:
     """
     Controller for registration operations:
-    - register
-    - drop
-    - enforce business rules (duplicate, capacity, credit limit)
+    - register / drop
+    - register a whole cart of courses, or swap one course for another,
+      all-or-nothing
+    - enforce business rules (duplicate, capacity, credit limit,
+      schedule conflicts, prerequisites and corequisites)
+    - per-course waitlists; a freed seat goes to the head of the waitlist
+
+    register/drop are safe to call from many threads: each one holds the
+    striped locks of its student and course for the whole check-then-act,
+    so seats cannot be overbooked and unrelated courses do not contend.
+    Every change is written to the repository first; if the repository
+    refuses it (e.g. the database has no seat left), nothing changes.
     """
 
+    def __init__(self, repository=None, lock_stripes: int = 256, prerequisites=None):
+        self.repository = repository or MemoryRepository()
+        self.prerequisites = prerequisites  # PrerequisiteGraph, or None for no requisites
+        self._locks = LockStripes(lock_stripes)
+        self.waitlists = {}  # course_id -> Waitlist
+        self._listeners = []  # callables (student, course, delta)
+
+    def subscribe(self, listener):
+        """
+        Call `listener(student, course, delta)` after every enrollment change;
+        delta is +1 for an enrollment and -1 for a drop. Listeners run while
+        the student's and course's locks are held, so they must be quick.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def _link(self, student: Student, course: Course):
+        student.add_course(course)
+        course.enroll_student(student)
+        for listener in self._listeners:
+            listener(student, course, 1)
+
+    def _unlink(self, student: Student, course: Course):
+        student.remove_course(course)
+        course.remove_student(student)
+        for listener in self._listeners:
+            listener(student, course, -1)
+
+    def locked(self, student: Student, *courses: Course):
+        """Hold the locks guarding `student` and `courses` (deadlock-free)."""
+        return self._locks.hold(
+            ("student", student.student_id),
+            *(("course", c.course_id) for c in courses),
+        )
+
+    def load_enrollments(self, pairs):
+        """Re-link already-persisted (Student, Course) enrollments."""
+        for student, course in pairs:
+            if not student.is_registered(course):
+                self._link(student, course)
+
+    def unload_enrollments(self, pairs):
+        """Undo (Student, Course) enrollments without touching the repository."""
+        for student, course in pairs:
+            if student.is_registered(course):
+                self._unlink(student, course)
+
     def check_duplicate(self, student: Student, course: Course) -> bool:
-        return course in student.registered_courses
+        return student.is_registered(course)
 
     def check_capacity(self, course: Course) -> bool:
         return not course.is_full()
@@ -18,28 +84,204 @@ class RegistrationManager:
     def check_credit_limit(self, student: Student, course: Course) -> bool:
         return student.total_credits() + course.credits <= Student.MAX_CREDITS
 
+    def check_schedule_conflict(self, student: Student, course: Course) -> bool:
+        return student.has_conflict(course)
+
+    def check_requisites(self, student: Student, course: Course, taking=()):
+        """Error message if `student` lacks a prerequisite or corequisite, else None."""
+        graph = self.prerequisites
+        if graph is None:
+            return None
+        if graph.missing_prerequisites(student, course):
+            return PREREQUISITES_MISSING
+        if graph.missing_corequisites(student, course, taking):
+            return COREQUISITES_MISSING
+        return None
+
     def register(self, student: Student, course: Course):
-        if self.check_duplicate(student, course):
-            return False, "Already registered."
+        with self.locked(student, course):
+            if self.check_duplicate(student, course):
+                return False, "Already registered."
 
-        if not self.check_capacity(course):
-            return False, "Course is full."
+            if not self.check_capacity(course):
+                return False, "Course is full."
 
-        if not self.check_credit_limit(student, course):
-            return False, "You have exceeded the maximum credits for the semester."
+            if not self.check_credit_limit(student, course):
+                return False, "You have exceeded the maximum credits for the semester."
 
-        student.registered_courses.append(course)
-        course.enroll_student(student)
+            if self.check_schedule_conflict(student, course):
+                return False, SCHEDULE_CONFLICT
 
-        remaining = student.credits_remaining()
+            error = self.check_requisites(student, course)
+            if error:
+                return False, error
+
+            if not self.repository.enroll(student, [course]):
+                return False, "Course is full."
+
+            self._link(student, course)
+
+            remaining = student.credits_remaining()
         return True, f"Registration successful. Credits remaining: {remaining}."
 
+    def register_many(self, student: Student, courses):
+        """
+        Register `student` for every course in `courses` or for none of them.
+        The cart is validated in one pass against a single running credit
+        total and schedule mask, so courses in the cart that clash with each
+        other are caught too. Returns (ok, [(course_id, ok, message), ...]).
+        """
+        courses = list(courses)
+        with self.locked(student, *courses):
+            credits = student.total_credits()
+            schedule = student.schedule_mask
+            seen = set()
+            errors = []
+            for c in courses:
+                if c in seen:
+                    errors.append("Duplicate course in cart.")
+                    continue
+                seen.add(c)
+                if self.check_duplicate(student, c):
+                    errors.append("Already registered.")
+                elif not self.check_capacity(c):
+                    errors.append("Course is full.")
+                elif credits + c.credits > Student.MAX_CREDITS:
+                    errors.append("You have exceeded the maximum credits for the semester.")
+                elif schedule & c.schedule_mask:
+                    errors.append(SCHEDULE_CONFLICT)
+                else:
+                    # Corequisites may be satisfied by the rest of the cart
+                    error = self.check_requisites(student, c, courses)
+                    if error is None:
+                        credits += c.credits
+                        schedule |= c.schedule_mask
+                    errors.append(error)
+
+            if any(errors):
+                return False, [(c.course_id, False, err or CART_REJECTED)
+                               for c, err in zip(courses, errors)]
+
+            if not self.repository.enroll(student, courses):
+                return False, [(c.course_id, False, "Could not save the registration.")
+                               for c in courses]
+
+            for c in courses:
+                self._link(student, c)
+        return True, [(c.course_id, True, "Registered.") for c in courses]
+
+    def swap(self, student: Student, drop_course: Course, add_course: Course):
+        """Atomically drop one course and register for another."""
+        if drop_course is add_course:
+            return False, "Cannot swap a course for itself."
+
+        with self.locked(student, drop_course, add_course):
+            if not student.is_registered(drop_course):
+                return False, "You are not enrolled in this course."
+
+            if self.check_duplicate(student, add_course):
+                return False, "Already registered."
+
+            if not self.check_capacity(add_course):
+                return False, "Course is full."
+
+            credits = student.total_credits() - drop_course.credits + add_course.credits
+            if credits > Student.MAX_CREDITS:
+                return False, "You have exceeded the maximum credits for the semester."
+
+            if (student.schedule_mask & ~drop_course.schedule_mask) & add_course.schedule_mask:
+                return False, SCHEDULE_CONFLICT
+
+            error = self.check_requisites(student, add_course)
+            if error:
+                return False, error
+
+            if not self.repository.swap(student, drop_course, add_course):
+                return False, "Could not save the swap."
+
+            self._unlink(student, drop_course)
+            self._link(student, add_course)
+
+            remaining = student.credits_remaining()
+        self.promote_waitlisted(drop_course)
+        return True, f"Swap successful. Credits remaining: {remaining}."
+
     def drop(self, student: Student, course: Course):
-        if course not in student.registered_courses:
-            return False, "You are not enrolled in this course."
+        with self.locked(student, course):
+            if not student.is_registered(course):
+                return False, "You are not enrolled in this course."
 
-        student.registered_courses.remove(course)
-        course.remove_student(student)
+            if not self.repository.unenroll(student, course):
+                return False, "Could not save the drop."
 
-        remaining = student.credits_remaining()
+            self._unlink(student, course)
+
+            remaining = student.credits_remaining()
+        self.promote_waitlisted(course)
         return True, f"Course dropped. Credits remaining: {remaining}."
+
+
+    # ---------- waitlists ----------
+    def join_waitlist(self, student: Student, course: Course, priority: int = 0):
+        with self.locked(student, course):
+            if self.check_duplicate(student, course):
+                return False, "Already registered."
+            if self.check_capacity(course):
+                return False, "Course has open seats. Register instead."
+            waitlist = self.waitlists.setdefault(course.course_id, Waitlist())
+            position = waitlist.join(student, priority)
+        if position is None:
+            return False, "Already on the waitlist."
+        return True, f"Added to the waitlist at position {position}."
+
+    def leave_waitlist(self, student: Student, course: Course):
+        with self.locked(student, course):
+            waitlist = self.waitlists.get(course.course_id)
+            if waitlist is None or not waitlist.leave(student):
+                return False, "You are not on the waitlist for this course."
+        return True, "Removed from the waitlist."
+
+    def discard_waitlist(self, course: Course):
+        """Forget the waitlist of a course that left the catalog."""
+        with self._locks.hold(("course", course.course_id)):
+            self.waitlists.pop(course.course_id, None)
+
+    def waitlist_position(self, student: Student, course: Course):
+        waitlist = self.waitlists.get(course.course_id)
+        return waitlist.position(student) if waitlist is not None else None
+
+    def promote_waitlisted(self, course: Course):
+        """
+        Fill open seats in `course` from the head of its waitlist.
+        Entries that are no longer eligible (already registered, over the
+        credit limit, with a clashing schedule or missing requisites) are
+        removed as they reach the head.
+        Returns the list of promoted Students.
+        """
+        waitlist = self.waitlists.get(course.course_id)
+        promoted = []
+        while waitlist:
+            with self._locks.hold(("course", course.course_id)):
+                head = waitlist.peek()
+            if head is None:
+                break
+            # The head's own lock is needed too, so lock the pair in order
+            # and make sure nobody changed the head in the meantime.
+            with self.locked(head, course):
+                if waitlist.peek() is not head:
+                    continue
+                if not self.check_capacity(course):
+                    break
+                if (self.check_duplicate(head, course)
+                        or not self.check_credit_limit(head, course)
+                        or self.check_schedule_conflict(head, course)
+                        or self.check_requisites(head, course)):
+                    waitlist.pop()
+                    continue
+                # The head keeps their place if the repository refuses the seat
+                if not self.repository.enroll(head, [course]):
+                    break
+                waitlist.pop()
+                self._link(head, course)
+                promoted.append(head)
+        return promoted
@@ -1,6 +1,14 @@
+import hmac
+import secrets
+
+from models import CompactRegistry, Course, Student
+from storage import Journal, MemoryRepository, import_completions
 from .authentication_service import AuthenticationService
 from .course_catalog import CourseCatalog
-from .registration_manager import RegistrationManager
+from .event_bus import ENROLLMENT_CHANGED, EnrollmentEvent, EventBus
+from .prerequisites import PrerequisiteGraph
+from .registration_manager import RegistrationManager, CART_REJECTED
+from .session_store import SessionStore
 
 
 class RegistrationSystem:
@@ -8,17 +16,209 @@ class RegistrationSystem:
     High-level controller (Facade):
     Coordinates AuthenticationService, CourseCatalog, RegistrationManager.
     UI only interacts with this class.
+
+    Several students can be served at once through session tokens:
+    open_session() returns a token that the student operations accept.
+    Called without a token, those operations act on `current_user`
+    (the single-user login()/logout() flow used by the GUI).
+
+    All controllers share one storage Repository (in-memory by default);
+    anything it already holds is loaded on construction.
+    For the in-memory store, enable_journal() adds durability through an
+    append-only journal plus periodic snapshots. Sign-ups, enrollments and
+    completed courses are persisted; the catalog itself is not journaled.
+
+    Every enrollment change (including waitlist promotions) is published
+    on `events` as an ENROLLMENT_CHANGED EnrollmentEvent.
+
+    enable_metrics() times the per-request operations and counts their
+    outcomes; until then the methods run unwrapped.
+
+    get_catalog_snapshot() serves browsing from immutable, versioned copies
+    of the catalog, so listing courses never holds up registration.
+
+    Courses a student passed in earlier terms are recorded by the registrar
+    (record_completed_courses / import_completions), which requires
+    `registrar_key`; student sessions cannot record them.
+
+    With compact=True, students, courses and enrollments live in a
+    models.CompactRegistry (`self.models`) instead of Student / Course
+    objects that reference each other, for campus-scale data.
     """
 
-    def __init__(self):
-        self.auth_service = AuthenticationService()
-        self.course_catalog = CourseCatalog()
-        self.reg_manager = RegistrationManager()
+    def __init__(self, repository=None, session_ttl: float = 30 * 60,
+                 max_sessions: int = 50_000, snapshot_interval: float = 0.05,
+                 compact: bool = False):
+        self.repository = repository or MemoryRepository()
+        self.models = CompactRegistry() if compact else None
+        self.auth_service = AuthenticationService(
+            self.repository,
+            student_factory=self.models.new_student if compact else Student)
+        self.course_catalog = CourseCatalog(
+            self.repository,
+            course_factory=self.models.new_course if compact else Course)
+        self.prerequisites = PrerequisiteGraph(self.course_catalog)
+        self.reg_manager = RegistrationManager(self.repository,
+                                               prerequisites=self.prerequisites)
+        self.sessions = SessionStore(ttl=session_ttl, max_sessions=max_sessions)
         self.current_user = None  # currently logged-in Student
+        # Credential for registrar-only operations; give it to trusted
+        # tooling (transcript imports), never to a student session
+        self.registrar_key = secrets.token_urlsafe(24)
+        self.events = EventBus()
+        self.journal = None
+        self.columns = None
+        self.search = None
+        self.metrics = None
+        self.snapshots = None
+        self.seat_view = None
+        self.snapshot_interval = snapshot_interval
+        self._load()
+        self.reg_manager.subscribe(self._publish_enrollment)
+        self.course_catalog.subscribe(self._on_catalog_change)
+
+    def _publish_enrollment(self, student, course, delta):
+        self.events.publish(ENROLLMENT_CHANGED, EnrollmentEvent(
+            action="register" if delta > 0 else "drop",
+            student_id=student.student_id,
+            course_id=course.course_id,
+            enrolled=course.enrolled_count(),
+            capacity=course.capacity,
+            credits_remaining=student.credits_remaining(),
+        ))
+
+    def _on_catalog_change(self, action, course):
+        if action == "remove":
+            self.reg_manager.discard_waitlist(course)
+        elif action == "update":
+            # A capacity increase opens seats for the waitlist
+            self.reg_manager.promote_waitlisted(course)
+
+    def subscribe(self, topic, callback):
+        return self.events.subscribe(topic, callback)
+
+    def _load(self):
+        new_course, new_student = self.course_catalog.course_factory, self.auth_service.student_factory
+        self.course_catalog.load(new_course(*row) for row in self.repository.load_courses())
+        self.auth_service.load(new_student(*row) for row in self.repository.load_students())
+        self.reg_manager.load_enrollments(
+            (self.auth_service.find_student(sid), self.course_catalog.find_course(cid))
+            for sid, cid in self.repository.load_enrollments()
+        )
+        completed = {}
+        for sid, cid in self.repository.load_completions():
+            completed.setdefault(sid, []).append(cid)
+        for sid, cids in completed.items():
+            stu = self.auth_service.find_student(sid)
+            if stu is not None:
+                self.prerequisites.mark_completed(stu, cids)
+
+    def close(self):
+        self.disable_metrics()
+        if self.snapshots is not None:
+            self.snapshots.stop()
+        if self.journal:
+            self.journal.close()
+        self.repository.close()
+
+    # ---------- Metrics ----------
+    def enable_metrics(self, port=None):
+        """
+        Instrument the facade (see controllers.metrics.Metrics); with a port,
+        also serve /metrics and /metrics.json on localhost. Returns the Metrics.
+        """
+        if self.metrics is None:
+            from .metrics import Metrics
+            self.metrics = Metrics()
+            self.metrics.instrument(self)
+        if port is not None:
+            self.metrics.serve(port)
+        return self.metrics
+
+    def disable_metrics(self):
+        if self.metrics is not None:
+            self.metrics.stop()
+            self.metrics.uninstrument(self)
+            self.metrics = None
+
+    # ---------- Search ----------
+    def search_courses(self, query, limit=10):
+        """Best-matching courses for a (possibly partial) query."""
+        if self.search is None:
+            from .course_search import CourseSearch
+            self.search = CourseSearch(self.course_catalog)
+        return self.search.search_courses(query, limit)
+
+    # ---------- Journal ----------
+    def enable_journal(self, directory, snapshot_every=1000, group_commit=64,
+                       commit_interval=0.05):
+        """
+        Recover from the newest snapshot plus the journal tail in `directory`,
+        then journal every sign-up and enrollment change from here on.
+        Call after the course catalog has been loaded.
+        """
+        journal = Journal(directory, snapshot_every, group_commit, commit_interval)
+        snapshot, records = journal.recover()
+        if snapshot:
+            self._replay(["S", *row] for row in snapshot["students"])
+            self._replay(["E", *row] for row in snapshot["enrollments"])
+            self._replay(["C", *row] for row in snapshot.get("completed", ()))
+        self._replay(record[1:] for record in records)
+        self.journal = journal
+        self.reg_manager.subscribe(self._journal_enrollment)
+
+    def _replay(self, records):
+        for op, *args in records:
+            if op == "S":
+                if not self.auth_service.check_if_exists(args[0]):
+                    self.auth_service.load([self.auth_service.student_factory(*args)])
+                continue
+            if op == "C":
+                stu = self.auth_service.find_student(args[0])
+                if stu is not None:
+                    self.prerequisites.mark_completed(stu, args[1:])
+                continue
+            pair = (self.auth_service.find_student(args[0]),
+                    self.course_catalog.find_course(args[1]))
+            if not all(pair):
+                continue
+            if op == "E":
+                self.reg_manager.load_enrollments([pair])
+            elif op == "U":
+                self.reg_manager.unload_enrollments([pair])
+
+    def _journal_enrollment(self, student, course, delta):
+        self.journal.append("E" if delta > 0 else "U", student.student_id, course.course_id)
+
+    def _snapshot_state(self):
+        students = list(self.auth_service.students)
+        return {
+            "students": [[s.student_id, s.name, s.password] for s in students],
+            "enrollments": [[s.student_id, c.course_id]
+                            for s in students for c in s.registered_courses],
+            "completed": [[s.student_id, cid]
+                          for s in students for cid in sorted(s.completed_courses)],
+        }
+
+    def _journaled(self, result):
+        """Pass `result` through, snapshotting first if one is due."""
+        if self.journal and self.journal.snapshot_due():
+            self.journal.write_snapshot(self._snapshot_state)
+        return result
 
     # ---------- Student auth ----------
     def register_student(self, sid, name, pwd):
-        return self.auth_service.sign_up(sid, name, pwd)
+        stu, msg = self.auth_service.sign_up(sid, name, pwd)
+        if stu and self.journal:
+            self.journal.append("S", stu.student_id, stu.name, stu.password)
+        return self._journaled((stu, msg))
+
+    def register_students(self, rows):
+        created, errors = self.auth_service.sign_up_many(rows)
+        if self.journal:
+            for stu in created:
+                self.journal.append("S", stu.student_id, stu.name, stu.password)
+        return self._journaled((created, errors))
 
     def login(self, sid, pwd):
         stu, msg = self.auth_service.login(sid, pwd)
@@ -29,35 +229,186 @@ class RegistrationSystem:
     def logout(self):
         self.current_user = None
 
+    # ---------- Sessions ----------
+    def open_session(self, sid, pwd):
+        stu, msg = self.auth_service.login(sid, pwd)
+        if not stu:
+            return None, msg
+        return self.sessions.create(stu), msg
+
+    def close_session(self, token) -> bool:
+        return self.sessions.remove(token)
+
+    def get_session_user(self, token):
+        return self.sessions.get(token)
+
+    def _user(self, token):
+        if token is None:
+            return self.current_user
+        return self.sessions.get(token)
+
     # ---------- Course operations ----------
     def get_all_courses(self):
+        """The live course list; readers that must not race writers use get_catalog_snapshot()."""
         return self.course_catalog.get_all_courses()
 
+    def get_catalog_snapshot(self):
+        """
+        Latest immutable CatalogSnapshot (CourseViews with seat counts).
+        Publication starts on first use; a version trails writes by at most
+        about `snapshot_interval` seconds.
+        """
+        if self.snapshots is None:
+            from .catalog_snapshot import SnapshotPublisher
+            self.snapshots = SnapshotPublisher(self.course_catalog, self.reg_manager,
+                                               self.snapshot_interval).start()
+        return self.snapshots.snapshot()
+
+    def get_course_count(self):
+        return self.course_catalog.count()
+
+    def get_courses_page(self, offset, limit):
+        return self.course_catalog.get_page(offset, limit)
+
     def get_course_details(self, cid):
         return self.course_catalog.find_course(cid)
 
-    def register_course(self, cid):
-        if not self.current_user:
+    def get_requisites(self, cid):
+        """(direct prerequisite IDs, corequisite IDs) of a course."""
+        return self.prerequisites.prerequisites(cid), self.prerequisites.corequisites(cid)
+
+    def _is_registrar(self, key) -> bool:
+        return isinstance(key, str) and hmac.compare_digest(
+            key.encode(), self.registrar_key.encode())
+
+    def record_completed_courses(self, sid, cids, registrar_key):
+        """
+        Record courses a student passed in earlier terms; registrar only.
+        Written to the repository and the journal, so they count toward
+        prerequisites after a restart.
+        """
+        if not self._is_registrar(registrar_key):
+            return False, "Not authorized."
+        stu = self.auth_service.find_student(sid)
+        if stu is None:
+            return False, "Student not found."
+        cids = list(dict.fromkeys(cids))
+        unknown = [cid for cid in cids if not self.course_catalog.find_course(cid)]
+        if unknown:
+            return False, f"Course not found: {', '.join(unknown)}."
+        with self.reg_manager.locked(stu):
+            new = [cid for cid in cids if cid not in stu.completed_courses]
+            if new:
+                self.repository.add_completions(stu, new)
+                if self.journal:
+                    self.journal.append("C", stu.student_id, *new)
+                self.prerequisites.mark_completed(stu, new)
+        return self._journaled((True, "Completed courses recorded."))
+
+    def import_completions(self, path, registrar_key):
+        """Record a transcript file of (student_id, course_id) rows; registrar only."""
+        if not self._is_registrar(registrar_key):
+            return False, "Not authorized."
+        return True, import_completions(self, path, registrar_key)
+
+    def get_completed_courses(self, token=None):
+        """Sorted IDs of the courses the user completed in earlier terms."""
+        user = self._user(token)
+        if not user:
+            return []
+        return sorted(user.completed_courses)
+
+    def get_catalog_columns(self):
+        """NumPy columnar view of the catalog, built on first use."""
+        if self.columns is None:
+            from .catalog_columns import CatalogColumns
+            self.columns = CatalogColumns(self.course_catalog, self.reg_manager)
+        return self.columns
+
+    def get_seat_availability(self):
+        """Materialized seats-remaining / open-sections view, built on first use."""
+        if self.seat_view is None:
+            from .seat_availability import SeatAvailability
+            self.seat_view = SeatAvailability(self.course_catalog, self.reg_manager)
+        return self.seat_view
+
+    def get_open_courses(self, department=None):
+        """Courses with open seats (optionally in one department), sorted by ID."""
+        return self.get_seat_availability().open_courses(department)
+
+    def register_course(self, cid, token=None):
+        user = self._user(token)
+        if not user:
+            return False, "You must be logged in."
+        c = self.course_catalog.find_course(cid)
+        if not c:
+            return False, "Course not found."
+        return self._journaled(self.reg_manager.register(user, c))
+
+    def drop_course(self, cid, token=None):
+        user = self._user(token)
+        if not user:
+            return False, "You must be logged in."
+        c = self.course_catalog.find_course(cid)
+        if not c:
+            return False, "Course not found."
+        return self._journaled(self.reg_manager.drop(user, c))
+
+    def register_many(self, cids, token=None):
+        """Register for a cart of courses all-or-nothing; returns (ok, per-course results)."""
+        cids = list(cids)
+        user = self._user(token)
+        if not user:
+            return False, [(cid, False, "You must be logged in.") for cid in cids]
+        courses = [self.course_catalog.find_course(cid) for cid in cids]
+        if not all(courses):
+            return False, [(cid, False, CART_REJECTED if c else "Course not found.")
+                           for cid, c in zip(cids, courses)]
+        return self._journaled(self.reg_manager.register_many(user, courses))
+
+    def swap(self, drop_cid, add_cid, token=None):
+        user = self._user(token)
+        if not user:
+            return False, "You must be logged in."
+        drop_c = self.course_catalog.find_course(drop_cid)
+        add_c = self.course_catalog.find_course(add_cid)
+        if not drop_c or not add_c:
+            return False, "Course not found."
+        return self._journaled(self.reg_manager.swap(user, drop_c, add_c))
+
+    def join_waitlist(self, cid, token=None):
+        user = self._user(token)
+        if not user:
             return False, "You must be logged in."
         c = self.course_catalog.find_course(cid)
         if not c:
             return False, "Course not found."
-        return self.reg_manager.register(self.current_user, c)
+        return self.reg_manager.join_waitlist(user, c)
 
-    def drop_course(self, cid):
-        if not self.current_user:
+    def leave_waitlist(self, cid, token=None):
+        user = self._user(token)
+        if not user:
             return False, "You must be logged in."
         c = self.course_catalog.find_course(cid)
         if not c:
             return False, "Course not found."
-        return self.reg_manager.drop(self.current_user, c)
+        return self.reg_manager.leave_waitlist(user, c)
+
+    def get_waitlist_position(self, cid, token=None):
+        user = self._user(token)
+        c = self.course_catalog.find_course(cid)
+        if not user or not c:
+            return None
+        return self.reg_manager.waitlist_position(user, c)
 
-    def get_my_schedule(self):
-        if not self.current_user:
+    def get_my_schedule(self, token=None):
+        user = self._user(token)
+        if not user:
             return []
-        return self.current_user.get_registered_courses()
+        return user.get_registered_courses()
 
-    def get_current_user_credit_remaining(self):
-        if not self.current_user:
+    def get_current_user_credit_remaining(self, token=None):
+        user = self._user(token)
+        if not user:
             return None
-        return self.current_user.credits_remaining()
+        return user.credits_remaining()
@@ -0,0 +1,144 @@
+import bisect
+import heapq
+import threading
+import time
+from collections import deque
+
+
+class SeatAvailability:
+    """
+    Materialized seat-availability view:
+    - remaining seats per course
+    - per department, a sorted list of the course IDs with open seats,
+      so "open sections only" is an index read instead of a catalog scan
+
+    RegistrationManager and CourseCatalog listeners only append the change
+    to a delta queue (no view work while enrollment locks are held). Reads
+    fold the queued deltas in first, unless they are younger than
+    `max_staleness` seconds and fewer than `max_pending`, in which case the
+    current view is served as is. check() compares the view with the
+    underlying Course objects.
+    """
+
+    def __init__(self, catalog, manager, max_staleness: float = 0.0,
+                 max_pending: int = 10_000):
+        self.catalog = catalog
+        self.max_staleness = max_staleness
+        self.max_pending = max_pending
+        self._pending = deque()  # (monotonic time, course_id)
+        self._lock = threading.Lock()  # serializes folding; writers never take it
+        self._remaining = {}     # course_id -> open seats
+        self._department = {}    # course_id -> department at last fold
+        self._open = {}          # department -> sorted course IDs with open seats
+        catalog.subscribe(self._on_catalog_change)
+        manager.subscribe(self._on_enrollment)
+        self.rebuild()
+
+    # ---------- maintenance ----------
+    def _on_enrollment(self, student, course, delta):
+        self._pending.append((time.monotonic(), course.course_id))
+
+    def _on_catalog_change(self, action, course):
+        self._pending.append((time.monotonic(), course.course_id))
+
+    def rebuild(self):
+        with self._lock:
+            self._pending.clear()
+            self._remaining, self._department, self._open = {}, {}, {}
+            for c in list(self.catalog.get_all_courses()):
+                self._set(c.course_id, c)
+            for ids in self._open.values():
+                ids.sort()
+
+    def _set(self, cid, c, keep_sorted=False):
+        """Bring one course's entry in line with Course `c` (None if removed)."""
+        old_dept = self._department.pop(cid, None)
+        was_open = self._remaining.pop(cid, 0) > 0
+        if was_open:
+            ids = self._open[old_dept]
+            i = bisect.bisect_left(ids, cid)
+            if i < len(ids) and ids[i] == cid:
+                del ids[i]
+            if not ids:
+                del self._open[old_dept]
+        if c is None:
+            return
+        remaining = max(c.capacity - c.enrolled_count(), 0)
+        self._remaining[cid] = remaining
+        self._department[cid] = c.department
+        if remaining:
+            ids = self._open.setdefault(c.department, [])
+            if keep_sorted:
+                bisect.insort(ids, cid)
+            else:
+                ids.append(cid)
+
+    def _refresh(self, force=False):
+        pending = self._pending
+        # Another reader may fold (empty) the queue between any two unlocked
+        # reads, so the head is copied once rather than tested, then indexed
+        try:
+            oldest = pending[0][0]
+        except IndexError:
+            return
+        if (not force and len(pending) < self.max_pending
+                and time.monotonic() - oldest < self.max_staleness):
+            return
+        with self._lock:
+            changed = set()
+            while pending:
+                changed.add(pending.popleft()[1])
+            # Counts are read from the courses themselves, so the order in
+            # which deltas were queued does not matter
+            for cid in changed:
+                self._set(cid, self.catalog.find_course(cid), keep_sorted=True)
+
+    # ---------- queries ----------
+    def seats_remaining(self, cid: str):
+        self._refresh()
+        return self._remaining.get(cid)
+
+    def open_course_ids(self, department: str = None):
+        """Sorted IDs of courses with open seats, in one department or all of them."""
+        self._refresh()
+        if department is not None:
+            return list(self._open.get(department, ()))
+        return list(heapq.merge(*list(self._open.values())))
+
+    def open_courses(self, department: str = None):
+        find = self.catalog.find_course
+        return [c for c in map(find, self.open_course_ids(department)) if c is not None]
+
+    def open_count(self, department: str = None) -> int:
+        self._refresh()
+        if department is not None:
+            return len(self._open.get(department, ()))
+        return sum(len(ids) for ids in list(self._open.values()))
+
+    # ---------- verification ----------
+    def check(self):
+        """
+        Compare the view with the catalog and its enrollments; returns a
+        list of discrepancies (empty when consistent). Run it while no
+        registrations are in flight, or expect in-flight courses to differ.
+        """
+        self._refresh(force=True)
+        problems = []
+        with self._lock:
+            expected_open = {}
+            for c in list(self.catalog.get_all_courses()):
+                remaining = max(c.capacity - c.enrolled_count(), 0)
+                if self._remaining.get(c.course_id) != remaining:
+                    problems.append(f"{c.course_id}: view has {self._remaining.get(c.course_id)} "
+                                    f"seats, enrollments leave {remaining}")
+                if remaining:
+                    expected_open.setdefault(c.department, []).append(c.course_id)
+            extra = set(self._remaining) - {c.course_id for c in self.catalog.get_all_courses()}
+            problems += [f"{cid}: in the view but not in the catalog" for cid in sorted(extra)]
+            for dept in sorted(set(expected_open) | set(self._open)):
+                ids = self._open.get(dept, [])
+                if ids != sorted(ids):
+                    problems.append(f"{dept}: open list is out of order")
+                if sorted(ids) != sorted(expected_open.get(dept, [])):
+                    problems.append(f"{dept}: open list differs from the courses with seats")
+        return problems
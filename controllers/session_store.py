@@ -0,0 +1,66 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+
+class SessionStore:
+    """
+    In-memory store of logged-in sessions:
+    - create a session for a Student and hand back an opaque token
+    - resolve a token to its Student in O(1)
+    - expire sessions idle for longer than `ttl` seconds
+    - evict the least recently used session once `max_sessions` is reached
+    """
+
+    def __init__(self, ttl: float = 30 * 60, max_sessions: int = 50_000,
+                 clock=time.monotonic):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._clock = clock
+        # token -> (Student, last-seen time); least recently used first
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, student) -> str:
+        token = secrets.token_urlsafe(24)
+        with self._lock:
+            self._sessions[token] = (student, self._clock())
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return token
+
+    def get(self, token):
+        """Return the session's Student and refresh its idle timer."""
+        with self._lock:
+            entry = self._sessions.get(token)
+            if entry is None:
+                return None
+            student, last_seen = entry
+            now = self._clock()
+            if now - last_seen > self.ttl:
+                del self._sessions[token]
+                return None
+            self._sessions[token] = (student, now)
+            self._sessions.move_to_end(token)
+            return student
+
+    def remove(self, token) -> bool:
+        with self._lock:
+            return self._sessions.pop(token, None) is not None
+
+    def purge_expired(self) -> int:
+        """Drop every idle session; the oldest sit at the front."""
+        cutoff = self._clock() - self.ttl
+        purged = 0
+        with self._lock:
+            while self._sessions:
+                token, (_, last_seen) = next(iter(self._sessions.items()))
+                if last_seen >= cutoff:
+                    break
+                del self._sessions[token]
+                purged += 1
+        return purged
@@ -0,0 +1,540 @@
+import multiprocessing
+import os
+import threading
+import zlib
+from collections import namedtuple
+
+from models import Course, Student
+from models.schedule import parse_meeting_times
+from .registration_manager import (
+    COREQUISITES_MISSING, PREREQUISITES_MISSING, SCHEDULE_CONFLICT,
+)
+
+COURSE_NOT_FOUND = "Course not found."
+ALREADY_REGISTERED = "Already registered."
+CREDIT_LIMIT = "You have exceeded the maximum credits for the semester."
+
+
+class _CourseKey(namedtuple("_CourseKey", "course_id")):
+    """A course the owner shard only knows by ID, for the requisite checks."""
+    __slots__ = ()
+
+
+def shard_of(key: str, shards: int) -> int:
+    """Stable shard number for a key (crc32, so every process agrees)."""
+    return zlib.crc32(key.encode("utf-8")) % shards
+
+
+# ---------- worker side ----------
+class _Shard:
+    """
+    State owned by one worker process:
+    - a CourseCatalog slice and a RegistrationManager enrolling into it,
+      with per-shard Student replicas
+    - the ledger of the students this shard owns (student-credit owner):
+      credits, schedule mask and the IDs of the courses they hold on any
+      shard, which enforces duplicates, limits and clashes across shards
+    - a copy of the requisite graph, and the owned students' completed
+      courses, for the prerequisite / corequisite checks
+
+    With a database, the slice, its enrollments and the completions are
+    loaded from it on start; the router then rebuilds the ledgers.
+    """
+
+    def __init__(self, db_path=None):
+        from .course_catalog import CourseCatalog
+        from .prerequisites import PrerequisiteGraph
+        from .registration_manager import RegistrationManager
+
+        repository = None
+        if db_path:
+            from storage import SQLiteRepository
+            repository = SQLiteRepository(db_path)
+        self.catalog = CourseCatalog(repository)
+        self.manager = RegistrationManager(repository, lock_stripes=1)
+        self.repository = self.manager.repository
+        self.graph = PrerequisiteGraph()
+        self.students = {}  # student_id -> replica Student
+        self.ledger = {}    # owned student_id -> [credits, schedule mask, {course_id}]
+        self._load()
+
+    def _load(self):
+        self.catalog.load(Course(*row) for row in self.repository.load_courses())
+        for sid, _, _ in self.repository.load_students():
+            self.students[sid] = Student(sid, sid, "")
+        self.manager.load_enrollments(
+            (self.students[sid], self.catalog.find_course(cid))
+            for sid, cid in self.repository.load_enrollments())
+        for sid, cid in self.repository.load_completions():
+            self.graph.mark_completed(self.students[sid], [cid])
+
+    def _student(self, sid):
+        stu = self.students.get(sid)
+        if stu is None:
+            stu = self.students[sid] = Student(sid, sid, "")
+            self.repository.add_students([stu])
+        return stu
+
+    # Each handler takes and returns a list, so one message carries a batch
+    def add_courses(self, rows):
+        return [c.course_id for c in self.catalog.add_courses(Course(*row) for row in rows)]
+
+    def catalog_rows(self, _):
+        """(course_id, credits, schedule mask) of the slice, for the router's map."""
+        return [(c.course_id, c.credits, c.schedule_mask) for c in self.catalog.get_all_courses()]
+
+    def holdings(self, _):
+        """(student_id, course_id, credits, mask) of every enrollment in the slice."""
+        return [(stu.student_id, c.course_id, c.credits, c.schedule_mask)
+                for c in self.catalog.get_all_courses() for stu in c.enrolled_students]
+
+    def restore(self, items):
+        """Rebuild owned ledger entries from holdings(); no limits are checked."""
+        for sid, cid, credits, mask in items:
+            entry = self.ledger.setdefault(sid, [0, 0, set()])
+            if cid not in entry[2]:
+                entry[0] += credits
+                entry[1] |= mask
+                entry[2].add(cid)
+        return [None] * len(items)
+
+    def add_requisites(self, rows):
+        self.graph.load(rows)
+        return [None] * len(rows)
+
+    def complete(self, items):
+        """Record (student_id, [course_id]) completions of owned students."""
+        for sid, cids in items:
+            stu = self._student(sid)
+            new = [cid for cid in cids if cid not in stu.completed_courses]
+            if new:
+                self.repository.add_completions(stu, new)
+                self.graph.mark_completed(stu, new)
+        return [None] * len(items)
+
+    def _requisites(self, sid, cid, held):
+        stu = self._student(sid)
+        course = _CourseKey(cid)
+        if self.graph.missing_prerequisites(stu, course):
+            return PREREQUISITES_MISSING
+        if self.graph.missing_corequisites(stu, course, map(_CourseKey, held)):
+            return COREQUISITES_MISSING
+        return None
+
+    # The ledger answers with the student's remaining credits, since the
+    # replica on a course shard only sees that shard's courses
+    def reserve(self, items):
+        out = []
+        for sid, cid, credits, mask in items:
+            entry = self.ledger.setdefault(sid, [0, 0, set()])
+            if cid in entry[2]:
+                out.append((ALREADY_REGISTERED, None))
+            elif entry[0] + credits > Student.MAX_CREDITS:
+                out.append((CREDIT_LIMIT, None))
+            elif entry[1] & mask:
+                out.append((SCHEDULE_CONFLICT, None))
+            else:
+                error = self._requisites(sid, cid, entry[2])
+                if error:
+                    out.append((error, None))
+                    continue
+                entry[0] += credits
+                entry[1] |= mask
+                entry[2].add(cid)
+                out.append((None, Student.MAX_CREDITS - entry[0]))
+        return out
+
+    def release(self, items):
+        out = []
+        for sid, cid, credits, mask in items:
+            entry = self.ledger.setdefault(sid, [0, 0, set()])
+            if cid in entry[2]:
+                entry[0] -= credits
+                entry[1] &= ~mask
+                entry[2].discard(cid)
+            out.append(Student.MAX_CREDITS - entry[0])
+        return out
+
+    # A failing item is answered on its own, so the router learns the
+    # outcome of every other item in the batch and settles its ledger entry
+    def enroll(self, items):
+        return [self._each(self.manager.register, sid, cid) for sid, cid in items]
+
+    def unenroll(self, items):
+        return [self._each(self.manager.drop, sid, cid) for sid, cid in items]
+
+    def _each(self, action, sid, cid):
+        c = self.catalog.find_course(cid)
+        if c is None:
+            return False, COURSE_NOT_FOUND
+        try:
+            return action(self._student(sid), c)
+        except Exception as exc:
+            return False, f"{type(exc).__name__}: {exc}"
+
+    def courses(self, cids):
+        out = []
+        for cid in cids:
+            c = self.catalog.find_course(cid)
+            out.append(None if c is None else (c.enrolled_count(), c.capacity))
+        return out
+
+    def credits(self, sids):
+        return [self.ledger[sid][0] if sid in self.ledger else 0 for sid in sids]
+
+    def totals(self, _):
+        """(credits held by owned students, credits enrolled in this slice) for check()."""
+        owned = sum(entry[0] for entry in self.ledger.values())
+        enrolled = sum(c.credits * c.enrolled_count() for c in self.catalog.get_all_courses())
+        return [owned, enrolled]
+
+
+def _serve(conn, db_path):
+    shard = _Shard(db_path)
+    while True:
+        try:
+            op, payload = conn.recv()
+        except EOFError:
+            break
+        if op == "stop":
+            break
+        try:
+            conn.send((True, getattr(shard, op)(payload)))
+        except Exception as exc:  # report instead of killing the worker
+            conn.send((False, f"{type(exc).__name__}: {exc}"))
+    shard.repository.close()
+    conn.close()
+
+
+# ---------- router ----------
+class ShardedRegistrationSystem:
+    """
+    Registration spread over worker processes, one GIL each.
+
+    - courses are partitioned by department (default) or by a hash of the
+      course ID; a worker owns its slice's catalog and enrollments. Each
+      new department goes to the shard with the fewest courses (largest
+      department of a batch first), and the assignment is kept, so
+      departments spread evenly however their names hash
+    - each student is owned by one shard (hash of the student ID) that
+      keeps their credit total and schedule mask, so the credit limit and
+      time clashes hold across shards
+    - the owner shard also checks prerequisites and corequisites against
+      the student's completed courses (record_completed_courses) and the
+      edges given to add_requisites, which every shard keeps a copy of
+    - this object is the router: a registration reserves credits on the
+      owner shard, enrolls on the course shard and gives the credits back
+      if the course shard refuses
+    - batch calls send one message per shard and phase, and all shards
+      work on their part of the batch at the same time
+    - the router may be shared between threads: each phase holds a lock
+      while it talks to the shards
+
+    With `db_dir` each shard persists to its own SQLite file and reloads it
+    on start(). Requisite edges are not stored; pass them to
+    add_requisites() after every start.
+
+    Authentication, search and waitlists stay with RegistrationSystem;
+    this covers the register / drop hot path.
+    """
+
+    def __init__(self, shards: int = None, partition: str = "department", db_dir: str = None):
+        if partition not in ("department", "hash"):
+            raise ValueError(f"Unknown partition: {partition!r}")
+        self.shards = shards or os.cpu_count() or 1
+        self.partition = partition
+        self.db_dir = db_dir
+        self._courses = {}  # course_id -> (shard, credits, schedule mask)
+        self._departments = {}  # department -> shard (partition="department")
+        self._placed = [0] * self.shards  # courses on each shard
+        self._conns = []
+        self._procs = []
+        self._lock = threading.Lock()  # one phase on the pipes at a time
+
+    # ---------- lifecycle ----------
+    def start(self):
+        if self._procs:
+            return self
+        ctx = multiprocessing.get_context("spawn" if os.name == "nt" else None)
+        for i in range(self.shards):
+            db_path = os.path.join(self.db_dir, f"shard-{i}.db") if self.db_dir else None
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_serve, args=(child, db_path),
+                               name=f"registration-shard-{i}", daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        if self.db_dir:
+            self._recover()
+        return self
+
+    def _recover(self):
+        """Rebuild the course map and the owner ledgers from what the shards loaded."""
+        every = {shard: None for shard in range(self.shards)}
+        for shard, rows in self._scatter("catalog_rows", every).items():
+            for cid, credits, mask in rows:
+                self._record(cid, shard, credits, mask)
+        holdings = [item for items in self._scatter("holdings", every).values()
+                    for item in items]
+        keyed = [(self.owner_shard(item[0]), i, item) for i, item in enumerate(holdings)]
+        if keyed:
+            self._scatter("restore", self._group(keyed)[0])
+
+    def stop(self):
+        for conn in self._conns:
+            try:
+                conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+        for conn in self._conns:
+            conn.close()
+        self._conns, self._procs = [], []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---------- routing ----------
+    @staticmethod
+    def _department(cid: str) -> str:
+        return cid.split(" ", 1)[0]
+
+    def course_shard(self, cid: str) -> int:
+        """Shard that holds `cid`, or would if it were added now."""
+        if cid in self._courses:
+            return self._courses[cid][0]
+        if self.partition == "hash":
+            return shard_of(cid, self.shards)
+        return self._place([cid])[self._department(cid)]
+
+    def _place(self, cids):
+        """
+        {department: shard} for the departments of `cids`: known ones keep
+        their shard, new ones go, largest first, to the least-loaded shard.
+        Nothing is recorded; see _record().
+        """
+        placed = list(self._placed)
+        new = {}
+        for cid in cids:
+            dept = self._department(cid)
+            if dept not in self._departments:
+                new[dept] = new.get(dept, 0) + 1
+        out = {dept: self._departments[dept] for dept in map(self._department, cids)
+               if dept in self._departments}
+        for dept, count in sorted(new.items(), key=lambda kv: (-kv[1], kv[0])):
+            shard = min(range(self.shards), key=placed.__getitem__)
+            out[dept] = shard
+            placed[shard] += count
+        return out
+
+    def _record(self, cid, shard, credits, mask):
+        """Route `cid` to `shard` from now on (once a shard holds it)."""
+        if cid in self._courses:
+            return
+        self._courses[cid] = (shard, credits, mask)
+        self._departments.setdefault(self._department(cid), shard)
+        self._placed[shard] += 1
+
+    def placement(self):
+        """Number of courses on each shard."""
+        return list(self._placed)
+
+    def owner_shard(self, sid: str) -> int:
+        return shard_of(sid, self.shards)
+
+    def _gather(self, op, parts):
+        """
+        Send {shard: items} to the shards at once, then collect every reply.
+        Returns ({shard: results} of the shards that succeeded, RuntimeError
+        for the first one that failed, or None).
+        """
+        with self._lock:
+            results, failed, sent = {}, None, []
+            for shard, items in parts.items():
+                try:
+                    self._conns[shard].send((op, items))
+                    sent.append(shard)
+                except OSError as exc:  # the worker is gone
+                    failed = failed or RuntimeError(f"shard {shard} failed on {op}: {exc!r}")
+            for shard in sent:
+                try:
+                    ok, value = self._conns[shard].recv()
+                except (EOFError, OSError) as exc:
+                    ok, value = False, repr(exc)
+                if ok:
+                    results[shard] = value
+                elif failed is None:
+                    failed = RuntimeError(f"shard {shard} failed on {op}: {value}")
+        return results, failed
+
+    def _scatter(self, op, parts):
+        """_gather(), raising if any shard failed."""
+        results, failed = self._gather(op, parts)
+        if failed:
+            raise failed
+        return results
+
+    def _group(self, keyed):
+        """[(shard, index, item)] -> ({shard: [item]}, {shard: [index]})."""
+        parts, where = {}, {}
+        for shard, i, item in keyed:
+            parts.setdefault(shard, []).append(item)
+            where.setdefault(shard, []).append(i)
+        return parts, where
+
+    # ---------- catalog ----------
+    def add_courses(self, courses):
+        """Distribute Course objects (or row tuples) to their shards; returns duplicate IDs."""
+        rows = [c if isinstance(c, tuple) else (
+                    c.course_id, c.title, c.instructor, c.credits, c.capacity, c.meeting_times)
+                for c in courses]
+        if self.partition == "department":
+            departments = self._place([row[0] for row in rows])
+            shards = [departments[self._department(row[0])] for row in rows]
+        else:
+            shards = [self.course_shard(row[0]) for row in rows]
+        parts, where = self._group((shard, i, row) for i, (shard, row) in enumerate(zip(shards, rows)))
+        replies, failed = self._gather("add_courses", parts)
+        # Route only what a shard has acknowledged; the first copy of a
+        # repeated ID is the one it kept
+        duplicates = []
+        for shard, dup in replies.items():
+            duplicates += dup
+            for i in where[shard]:
+                row = rows[i]
+                self._record(row[0], shard, row[3],
+                             parse_meeting_times(row[5] if len(row) > 5 else ""))
+        if failed:
+            raise failed
+        return duplicates
+
+    def get_seats(self, cids):
+        """[(enrolled, capacity) or None] for each course ID."""
+        keyed = [(self._courses[cid][0], i, cid) for i, cid in enumerate(cids)
+                 if cid in self._courses]
+        parts, where = self._group(keyed)
+        out = [None] * len(cids)
+        for shard, values in self._scatter("courses", parts).items():
+            for i, value in zip(where[shard], values):
+                out[i] = value
+        return out
+
+    def get_credits(self, sid: str) -> int:
+        shard = self.owner_shard(sid)
+        return self._scatter("credits", {shard: [sid]})[shard][0]
+
+    # ---------- requisites ----------
+    def add_requisites(self, rows):
+        """Give every shard the (course_id, required_id, kind) edges (see PrerequisiteGraph.load)."""
+        rows = [tuple(row) for row in rows]
+        self._scatter("add_requisites", {shard: rows for shard in range(self.shards)})
+
+    def record_completed_courses(self, sid: str, cids):
+        """Record courses `sid` passed in earlier terms, on their owner shard."""
+        shard = self.owner_shard(sid)
+        self._scatter("complete", {shard: [(sid, list(cids))]})
+        return True, "Completed courses recorded."
+
+    # ---------- registration ----------
+    def register_batch(self, requests):
+        """
+        Register many (student_id, course_id) pairs; returns [(ok, message)]
+        in request order. Credits reserved for a request are held until its
+        course shard answers, so a later request of the same student in the
+        same batch may be refused on credits that end up released. If a
+        shard fails, every reservation that did not become an enrollment is
+        still handed back before the error is raised.
+        """
+        results = [None] * len(requests)
+        reserve = []
+        for i, (sid, cid) in enumerate(requests):
+            meta = self._courses.get(cid)
+            if meta is None:
+                results[i] = (False, COURSE_NOT_FOUND)
+            else:
+                reserve.append((self.owner_shard(sid), i, (sid, cid, meta[1], meta[2])))
+
+        held = {}  # request index -> (owner shard, reserved item), until enrolled
+        try:
+            # Phase 1: reserve credits and time slots on the owner shards
+            parts, where = self._group(reserve)
+            replies, failed = self._gather("reserve", parts)
+            enroll = []
+            remaining = {}
+            for shard, answers in replies.items():
+                for i, (error, left) in zip(where[shard], answers):
+                    if error:
+                        results[i] = (False, error)
+                    else:
+                        sid, cid = requests[i]
+                        _, credits, mask = self._courses[cid]
+                        held[i] = (shard, (sid, cid, credits, mask))
+                        remaining[i] = left
+                        enroll.append((self._courses[cid][0], i, (sid, cid)))
+            if failed:
+                raise failed
+
+            # Phase 2: enroll on the course shards
+            parts, where = self._group(enroll)
+            replies, failed = self._gather("enroll", parts)
+            for shard, answers in replies.items():
+                for i, result in zip(where[shard], answers):
+                    if result[0]:
+                        del held[i]
+                        results[i] = (True, f"Registration successful. "
+                                            f"Credits remaining: {remaining[i]}.")
+                    else:
+                        results[i] = result
+            if failed:
+                raise failed
+        finally:
+            # Phase 3: hand back the reservations that were refused or never answered
+            if held:
+                self._scatter("release", self._group(
+                    (shard, i, item) for i, (shard, item) in held.items())[0])
+        return results
+
+    def drop_batch(self, requests):
+        """Drop many (student_id, course_id) pairs; returns [(ok, message)] in order."""
+        results = [(False, COURSE_NOT_FOUND)] * len(requests)
+        keyed = [(self._courses[cid][0], i, (sid, cid)) for i, (sid, cid) in enumerate(requests)
+                 if cid in self._courses]
+        parts, where = self._group(keyed)
+        release = []
+        for shard, answers in self._scatter("unenroll", parts).items():
+            for i, result in zip(where[shard], answers):
+                results[i] = result
+                if result[0]:
+                    sid, cid = requests[i]
+                    _, credits, mask = self._courses[cid]
+                    release.append((self.owner_shard(sid), i, (sid, cid, credits, mask)))
+        if release:
+            parts, where = self._group(release)
+            for shard, answers in self._scatter("release", parts).items():
+                for i, left in zip(where[shard], answers):
+                    results[i] = (True, f"Course dropped. Credits remaining: {left}.")
+        return results
+
+    def register(self, sid: str, cid: str):
+        return self.register_batch([(sid, cid)])[0]
+
+    def drop(self, sid: str, cid: str):
+        return self.drop_batch([(sid, cid)])[0]
+
+    # ---------- verification ----------
+    def check(self):
+        """
+        Credits held in the owner ledgers must equal the credits enrolled
+        across all course shards. Returns a list of problems (empty if consistent).
+        """
+        totals = self._scatter("totals", {shard: None for shard in range(self.shards)})
+        owned = sum(t[0] for t in totals.values())
+        enrolled = sum(t[1] for t in totals.values())
+        if owned != enrolled:
+            return [f"owner ledgers hold {owned} credits, course shards enrolled {enrolled}"]
+        return []
@@ -0,0 +1,105 @@
+import heapq
+
+
+class _Fenwick:
+    """Append-only Fenwick (binary indexed) tree of counts, 1-based."""
+
+    def __init__(self):
+        self._tree = [0]
+
+    def append(self, value: int) -> int:
+        i = len(self._tree)
+        # node i covers (i - lowbit(i), i]
+        self._tree.append(value + self.prefix(i - 1) - self.prefix(i - (i & -i)))
+        return i
+
+    def add(self, i: int, delta: int):
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+
+class Waitlist:
+    """
+    Waitlist for one course.
+
+    Entries are ordered by (priority, join order); a lower priority value is
+    served first. A heap gives the head in O(log n); leaving is lazy (the
+    heap entry is skipped when it surfaces). Each priority level keeps a
+    Fenwick tree over join order, so a student's position is
+    O(levels + log n).
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._heap = []      # (priority, index within level, student_id)
+        self._entries = {}   # student_id -> (priority, index, Student)
+        self._levels = {}    # priority -> _Fenwick of live entries
+        self._counts = {}    # priority -> number of live entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, student) -> bool:
+        return student.student_id in self._entries
+
+    def join(self, student, priority: int = 0):
+        """Add `student`; returns their 1-based position, or None if already waiting."""
+        if student.student_id in self._entries:
+            return None
+        index = self._levels.setdefault(priority, _Fenwick()).append(1)
+        self._counts[priority] = self._counts.get(priority, 0) + 1
+        self._entries[student.student_id] = (priority, index, student)
+        heapq.heappush(self._heap, (priority, index, student.student_id))
+        return self.position(student)
+
+    def _discard(self, student_id):
+        priority, index, student = self._entries.pop(student_id)
+        self._levels[priority].add(index, -1)
+        self._counts[priority] -= 1
+        if not self._entries:
+            self._reset()
+        return student
+
+    def leave(self, student) -> bool:
+        if student.student_id not in self._entries:
+            return False
+        self._discard(student.student_id)
+        return True
+
+    def position(self, student):
+        entry = self._entries.get(student.student_id)
+        if entry is None:
+            return None
+        priority, index, _ = entry
+        ahead = sum(n for p, n in self._counts.items() if p < priority)
+        return ahead + self._levels[priority].prefix(index)
+
+    def _drop_stale(self):
+        while self._heap:
+            priority, index, student_id = self._heap[0]
+            entry = self._entries.get(student_id)
+            if entry is not None and entry[0] == priority and entry[1] == index:
+                return
+            heapq.heappop(self._heap)
+
+    def peek(self):
+        self._drop_stale()
+        return self._entries[self._heap[0][2]][2] if self._heap else None
+
+    def pop(self):
+        """Remove and return the Student at the head, or None."""
+        self._drop_stale()
+        if not self._heap:
+            return None
+        _, _, student_id = heapq.heappop(self._heap)
+        return self._discard(student_id)
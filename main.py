@@ -1,13 +1,49 @@
-from controllers import RegistrationSystem
-from ui.main_gui import MainGUI
-from seed_courses import seed_courses
+import argparse
+import threading
+
+from bootstrap import create_system
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Course Registration System")
+    parser.add_argument("--headless", action="store_true",
+                        help="build the system without loading the GUI")
+    parser.add_argument("--db", metavar="PATH",
+                        help="SQLite database file (default: in-memory)")
+    parser.add_argument("--journal", metavar="DIR",
+                        help="journal directory for durable in-memory mode")
+    parser.add_argument("--compact", action="store_true",
+                        help="keep students and enrollments in the compact model")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="serve facade metrics on http://127.0.0.1:PORT/metrics")
+    args = parser.parse_args(argv)
+
+    system = create_system(db_path=args.db, journal_dir=args.journal,
+                           compact=args.compact)
+    try:
+        if args.metrics_port is not None:
+            system.enable_metrics(args.metrics_port)
+
+        if args.headless:
+            print(f"Registration system ready: {system.get_course_count()} courses, "
+                  f"{len(system.auth_service.students)} students.")
+            if args.metrics_port is not None:
+                # Keep serving /metrics until interrupted
+                print(f"Serving metrics on http://127.0.0.1:{args.metrics_port}/metrics "
+                      "(Ctrl+C to stop).")
+                threading.Event().wait()
+            return
+
+        # Imported only when the GUI is requested
+        from ui.main_gui import MainGUI
+
+        gui = MainGUI(system)
+        gui.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        system.close()
 
-def main():
-    system = RegistrationSystem()
-    seed_courses(system)
-    
-    gui = MainGUI(system)
-    gui.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,4 +1,13 @@
 from .student import Student
 from .course import Course
+from .schedule import parse_meeting_times
+from .compact import CompactCourse, CompactRegistry, CompactStudent
 
-__all__ = ["Student", "Course"]
\ No newline at end of file
+__all__ = [
+    "Student",
+    "Course",
+    "CompactStudent",
+    "CompactCourse",
+    "CompactRegistry",
+    "parse_meeting_times",
+]
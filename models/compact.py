@@ -0,0 +1,332 @@
+import sys
+import threading
+from array import array
+
+from .schedule import parse_meeting_times
+from .student import Student
+
+NIL = -1  # end of an edge list
+NO_COURSES = frozenset()  # shared by every student without a transcript
+
+
+class CompactStudent:
+    """Student with the standard interface, backed by a CompactRegistry."""
+
+    __slots__ = ("_registry", "sid", "student_id", "name", "password",
+                 "_credits", "_schedule", "_clashing",
+                 "completed_courses", "completed_mask", "requisites_met")
+
+    MAX_CREDITS = Student.MAX_CREDITS
+
+    def __init__(self, registry, sid: int, student_id: str, name: str, password: str):
+        self._registry = registry
+        self.sid = sid  # dense integer ID
+        self.student_id = student_id
+        self.name = name
+        self.password = password
+        self._credits = 0
+        self._schedule = 0
+        self._clashing = False
+        # Most students carry no container of their own until a transcript
+        # arrives (PrerequisiteGraph.mark_completed rebinds the attribute)
+        self.completed_courses = NO_COURSES
+        self.completed_mask = 0
+        self.requisites_met = None
+
+    @property
+    def registered_courses(self):
+        courses = self._registry.courses
+        return [courses[cid] for cid in self._registry.courses_of(self.sid)]
+
+    def get_registered_courses(self):
+        return self.registered_courses
+
+    def is_registered(self, course) -> bool:
+        return self._registry.is_enrolled(self.sid, course.cid)
+
+    def add_course(self, course) -> bool:
+        return self._registry.link(self, course)
+
+    def remove_course(self, course) -> bool:
+        return self._registry.unlink(self, course)
+
+    def _linked(self, course):
+        self._credits += course.credits
+        if self._schedule & course.schedule_mask:
+            self._clashing = True
+        self._schedule |= course.schedule_mask
+
+    def _unlinked(self, course):
+        self._credits -= course.credits
+        if self._clashing:
+            self.refresh_schedule()
+        else:
+            self._schedule &= ~course.schedule_mask
+
+    def refresh_credits(self):
+        """Recompute the running credit total from the registered courses."""
+        self._credits = sum(c.credits for c in self.registered_courses)
+
+    def refresh_schedule(self):
+        """Rebuild the schedule mask from the registered courses."""
+        mask, clashing = 0, False
+        for c in self.registered_courses:
+            clashing = clashing or bool(mask & c.schedule_mask)
+            mask |= c.schedule_mask
+        self._schedule, self._clashing = mask, clashing
+
+    @property
+    def schedule_mask(self) -> int:
+        return self._schedule
+
+    def has_conflict(self, course) -> bool:
+        return bool(self._schedule & course.schedule_mask)
+
+    def total_credits(self) -> int:
+        return self._credits
+
+    def credits_remaining(self) -> int:
+        return Student.MAX_CREDITS - self._credits
+
+    def __repr__(self) -> str:
+        return f"CompactStudent({self.student_id}, {self.name})"
+
+
+class CompactCourse:
+    """Course with the standard interface, backed by a CompactRegistry."""
+
+    __slots__ = ("_registry", "cid", "course_id", "title", "department",
+                 "_instructor", "_credits", "capacity", "_meeting_times",
+                 "schedule_mask")
+
+    def __init__(self, registry, cid: int, course_id: str, title: str,
+                 instructor: str, credits: int, capacity: int,
+                 meeting_times: str = ""):
+        self._registry = registry
+        self.cid = cid  # dense integer ID
+        self.course_id = course_id
+        self.title = title
+        # Departments and instructors repeat across thousands of sections
+        self.department = sys.intern(course_id.split(" ", 1)[0])
+        self.instructor = instructor
+        self.credits = credits
+        self.capacity = capacity
+        self.meeting_times = meeting_times
+
+    @property
+    def instructor(self) -> str:
+        return self._instructor
+
+    @instructor.setter
+    def instructor(self, name: str):
+        self._instructor = sys.intern(name)
+
+    @property
+    def credits(self) -> int:
+        return self._credits
+
+    @credits.setter
+    def credits(self, value: int):
+        self._credits = value
+        for student in self.enrolled_students:
+            student.refresh_credits()
+
+    @property
+    def meeting_times(self) -> str:
+        return self._meeting_times
+
+    @meeting_times.setter
+    def meeting_times(self, text: str):
+        mask = parse_meeting_times(text)
+        self._meeting_times = text or ""
+        self.schedule_mask = mask
+        for student in self.enrolled_students:
+            student.refresh_schedule()
+
+    @property
+    def enrolled_students(self):
+        students = self._registry.students
+        return [students[sid] for sid in self._registry.students_of(self.cid)]
+
+    def enrolled_count(self) -> int:
+        return self._registry.enrolled_count(self.cid)
+
+    def is_enrolled(self, student) -> bool:
+        return self._registry.is_enrolled(student.sid, self.cid)
+
+    def is_full(self) -> bool:
+        return self.enrolled_count() >= self.capacity
+
+    def enroll_student(self, student) -> bool:
+        return not self.is_full() and self._registry.link(student, self)
+
+    def remove_student(self, student) -> bool:
+        return self._registry.unlink(student, self)
+
+    def __repr__(self) -> str:
+        return f"CompactCourse({self.course_id}, {self.title})"
+
+
+class CompactRegistry:
+    """
+    Memory-lean storage for campus-scale data, selected with
+    RegistrationSystem(compact=True).
+
+    new_student() / new_course() build CompactStudent / CompactCourse
+    objects that offer the Student / Course interface the controllers use
+    but own no containers: they are __slots__ objects with a dense integer
+    ID, scalar fields and interned department / instructor strings.
+
+    Every enrollment is one edge stored in flat array('i') columns (its
+    student, its course, and next / previous links threaded through the
+    student's and the course's edge lists). An enrollment is therefore a
+    few machine words and no Python object, and the GC tracks one object
+    per student and per course however many enrollments there are. Freed
+    edges are reused.
+
+    The two sides share each edge, so student.add_course(course) and
+    course.enroll_student(student) are the same operation; the second call
+    of the pair the RegistrationManager makes finds the edge in place.
+    """
+
+    def __init__(self):
+        self.students = []  # sid -> CompactStudent
+        self.courses = []   # cid -> CompactCourse
+        self._lock = threading.Lock()
+        # per entity: first / last edge of its list; per course: list length
+        self._student_first = array("i")
+        self._student_last = array("i")
+        self._course_first = array("i")
+        self._course_last = array("i")
+        self._course_size = array("i")
+        # per edge
+        self._edge_student = array("i")
+        self._edge_course = array("i")
+        self._next_of_student = array("i")
+        self._prev_of_student = array("i")
+        self._next_of_course = array("i")
+        self._prev_of_course = array("i")
+        self._free = array("i")  # unused edge slots
+
+    # ---------- entities ----------
+    def new_student(self, student_id: str, name: str, password: str) -> CompactStudent:
+        with self._lock:
+            sid = len(self.students)
+            student = CompactStudent(self, sid, student_id, name, password)
+            self.students.append(student)
+            self._student_first.append(NIL)
+            self._student_last.append(NIL)
+        return student
+
+    def new_course(self, course_id: str, title: str, instructor: str,
+                   credits: int, capacity: int, meeting_times: str = "") -> CompactCourse:
+        with self._lock:
+            cid = len(self.courses)
+            self.courses.append(None)
+            self._course_first.append(NIL)
+            self._course_last.append(NIL)
+            self._course_size.append(0)
+        # Built outside the lock: the credits / meeting_times setters read
+        # the (still empty) enrollment list
+        course = self.courses[cid] = CompactCourse(
+            self, cid, course_id, title, instructor, credits, capacity, meeting_times)
+        return course
+
+    # ---------- enrollments ----------
+    def _find(self, sid: int, cid: int) -> int:
+        # A student holds a handful of courses, so walk the student's side
+        edge, courses, following = self._student_first[sid], self._edge_course, self._next_of_student
+        while edge != NIL and courses[edge] != cid:
+            edge = following[edge]
+        return edge
+
+    def is_enrolled(self, sid: int, cid: int) -> bool:
+        with self._lock:
+            return self._find(sid, cid) != NIL
+
+    def link(self, student: CompactStudent, course: CompactCourse) -> bool:
+        """Add the edge student-course; False if it already exists."""
+        sid, cid = student.sid, course.cid
+        s_next, s_prev = self._next_of_student, self._prev_of_student
+        c_next, c_prev = self._next_of_course, self._prev_of_course
+        with self._lock:
+            if self._find(sid, cid) != NIL:
+                return False
+            s_last, c_last = self._student_last[sid], self._course_last[cid]
+            if self._free:
+                edge = self._free.pop()
+                self._edge_student[edge], self._edge_course[edge] = sid, cid
+                s_next[edge], s_prev[edge] = NIL, s_last
+                c_next[edge], c_prev[edge] = NIL, c_last
+            else:
+                edge = len(s_next)
+                self._edge_student.append(sid)
+                self._edge_course.append(cid)
+                s_next.append(NIL)
+                s_prev.append(s_last)
+                c_next.append(NIL)
+                c_prev.append(c_last)
+            if s_last == NIL:
+                self._student_first[sid] = edge
+            else:
+                s_next[s_last] = edge
+            if c_last == NIL:
+                self._course_first[cid] = edge
+            else:
+                c_next[c_last] = edge
+            self._student_last[sid] = self._course_last[cid] = edge
+            self._course_size[cid] += 1
+        student._linked(course)
+        return True
+
+    def unlink(self, student: CompactStudent, course: CompactCourse) -> bool:
+        """Remove the edge student-course; False if there is none."""
+        sid, cid = student.sid, course.cid
+        with self._lock:
+            edge = self._find(sid, cid)
+            if edge == NIL:
+                return False
+            self._splice(edge, sid, self._student_first, self._student_last,
+                         self._next_of_student, self._prev_of_student)
+            self._splice(edge, cid, self._course_first, self._course_last,
+                         self._next_of_course, self._prev_of_course)
+            self._course_size[cid] -= 1
+            self._free.append(edge)
+        student._unlinked(course)
+        return True
+
+    @staticmethod
+    def _splice(edge, owner, first, last, following, preceding):
+        nxt, prv = following[edge], preceding[edge]
+        if prv == NIL:
+            first[owner] = nxt
+        else:
+            following[prv] = nxt
+        if nxt == NIL:
+            last[owner] = prv
+        else:
+            preceding[nxt] = prv
+
+    def courses_of(self, sid: int):
+        """Course IDs (cid) of a student, in enrollment order."""
+        with self._lock:
+            out, edge = [], self._student_first[sid]
+            while edge != NIL:
+                out.append(self._edge_course[edge])
+                edge = self._next_of_student[edge]
+        return out
+
+    def students_of(self, cid: int):
+        """Student IDs (sid) of a course, in enrollment order."""
+        with self._lock:
+            out, edge = [], self._course_first[cid]
+            while edge != NIL:
+                out.append(self._edge_student[edge])
+                edge = self._next_of_course[edge]
+        return out
+
+    def enrolled_count(self, cid: int) -> int:
+        return self._course_size[cid]
+
+    def enrollment_count(self) -> int:
+        return len(self._edge_student) - len(self._free)
@@ -1,25 +1,70 @@
+from .schedule import parse_meeting_times
+
+
 class Course:
     def __init__(self, course_id: str, title: str,
-                 instructor: str, credits: int, capacity: int):
+                 instructor: str, credits: int, capacity: int,
+                 meeting_times: str = ""):
         self.course_id = course_id
         self.title = title
         self.instructor = instructor
+        # dict used as an insertion-ordered set of Student
+        self._enrolled = {}
         self.credits = credits
         self.capacity = capacity
-        self.enrolled_students = []  # list of Student
+        self.meeting_times = meeting_times
+
+    @property
+    def credits(self) -> int:
+        return self._credits
+
+    @credits.setter
+    def credits(self, value: int):
+        self._credits = value
+        # Enrolled students keep a running credit total that counts this course
+        for student in self._enrolled:
+            student.refresh_credits()
+
+    @property
+    def meeting_times(self) -> str:
+        return self._meeting_times
+
+    @meeting_times.setter
+    def meeting_times(self, text: str):
+        # Parse first so a bad string leaves the course unchanged
+        mask = parse_meeting_times(text)
+        self._meeting_times = text or ""
+        self.schedule_mask = mask  # occupied 5-minute slots, see models.schedule
+        for student in self._enrolled:
+            student.refresh_schedule()
+
+    @property
+    def enrolled_students(self):
+        return list(self._enrolled)
+
+    @property
+    def department(self) -> str:
+        # "CSCI-UA 101" -> "CSCI-UA"
+        return self.course_id.split(" ", 1)[0]
+
+    def enrolled_count(self) -> int:
+        return len(self._enrolled)
+
+    def is_enrolled(self, student) -> bool:
+        return student in self._enrolled
 
     def is_full(self) -> bool:
-        return len(self.enrolled_students) >= self.capacity
+        return len(self._enrolled) >= self.capacity
 
     def enroll_student(self, student) -> bool:
-        if not self.is_full():
-            self.enrolled_students.append(student)
+        if not self.is_full() and student not in self._enrolled:
+            self._enrolled[student] = None
             return True
         return False
 
     def remove_student(self, student) -> bool:
-        if student in self.enrolled_students:
-            self.enrolled_students.remove(student)
+        if student in self._enrolled:
+            del self._enrolled[student]
             return True
         return False
 
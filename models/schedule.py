@@ -0,0 +1,51 @@
+"""
+Weekly meeting times as bitmasks.
+
+The week is cut into 5-minute slots (288 per day, 2016 per week) and a
+set of meetings becomes a Python int with one bit per occupied slot, so
+two schedules clash exactly when `a & b` is non-zero.
+
+Meeting times are written as day letters plus a time range, several
+blocks separated by ";":  "MW 10:00-11:15; F 09:00-09:50".
+Days are M T W R F S U (R is Thursday); times are 24-hour.
+"""
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAYS = "MTWRFSU"
+
+
+def slot_mask(day: int, start: int, end: int) -> int:
+    """Mask for [start, end) minutes after midnight on `day` (0 = Monday)."""
+    if not 0 <= day < len(DAYS) or not 0 <= start < end <= 24 * 60:
+        raise ValueError(f"Invalid meeting: day {day}, {start}-{end} minutes")
+    first = day * SLOTS_PER_DAY + start // SLOT_MINUTES
+    last = day * SLOTS_PER_DAY + -(-end // SLOT_MINUTES)  # round the end up
+    return ((1 << (last - first)) - 1) << first
+
+
+def _minutes(text: str) -> int:
+    hours, _, minutes = text.strip().partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+
+def parse_meeting_times(text: str) -> int:
+    """Mask for a meeting-time string; "" (or "TBA") meets at no fixed time."""
+    mask = 0
+    if not text or text.strip().upper() == "TBA":
+        return mask
+    for block in text.split(";"):
+        days, _, hours = block.strip().partition(" ")
+        start, sep, end = hours.partition("-")
+        if not days or not sep:
+            raise ValueError(f"Invalid meeting time: {block.strip()!r}")
+        try:
+            start, end = _minutes(start), _minutes(end)
+        except ValueError:
+            raise ValueError(f"Invalid meeting time: {block.strip()!r}") from None
+        for letter in days.upper():
+            day = DAYS.find(letter)
+            if day < 0:
+                raise ValueError(f"Invalid meeting day {letter!r} in {block.strip()!r}")
+            mask |= slot_mask(day, start, end)
+    return mask
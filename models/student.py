@@ -5,13 +5,73 @@ class Student:
         self.student_id = student_id
         self.name = name
         self.password = password
-        self.registered_courses = []  # list of Course
+        # dict used as an insertion-ordered set of Course
+        self._registered = {}
+        self._credits = 0  # running total of registered credits
+        # OR of the registered courses' schedule masks; _clashing is set if
+        # two of them overlap (only possible for data loaded from storage),
+        # in which case a drop rebuilds the mask instead of clearing bits
+        self._schedule = 0
+        self._clashing = False
+        # Courses passed in earlier terms; the mask uses the bit positions
+        # of controllers.PrerequisiteGraph, which caches the mask expanded
+        # with their prerequisites in requisites_met
+        self.completed_courses = set()
+        self.completed_mask = 0
+        self.requisites_met = None
+
+    @property
+    def registered_courses(self):
+        return list(self._registered)
 
     def get_registered_courses(self):
         return self.registered_courses
 
+    def is_registered(self, course) -> bool:
+        return course in self._registered
+
+    def add_course(self, course) -> bool:
+        if course in self._registered:
+            return False
+        self._registered[course] = None
+        self._credits += course.credits
+        if self._schedule & course.schedule_mask:
+            self._clashing = True
+        self._schedule |= course.schedule_mask
+        return True
+
+    def remove_course(self, course) -> bool:
+        if course not in self._registered:
+            return False
+        del self._registered[course]
+        self._credits -= course.credits
+        if self._clashing:
+            self.refresh_schedule()
+        else:
+            self._schedule &= ~course.schedule_mask
+        return True
+
+    def refresh_credits(self):
+        """Recompute the running credit total from the registered courses."""
+        self._credits = sum(c.credits for c in self._registered)
+
+    def refresh_schedule(self):
+        """Rebuild the schedule mask from the registered courses."""
+        mask, clashing = 0, False
+        for c in self._registered:
+            clashing = clashing or bool(mask & c.schedule_mask)
+            mask |= c.schedule_mask
+        self._schedule, self._clashing = mask, clashing
+
+    @property
+    def schedule_mask(self) -> int:
+        return self._schedule
+
+    def has_conflict(self, course) -> bool:
+        return bool(self._schedule & course.schedule_mask)
+
     def total_credits(self) -> int:
-        return sum(c.credits for c in self.registered_courses)
+        return self._credits
 
     def credits_remaining(self) -> int:
         return Student.MAX_CREDITS - self.total_credits()
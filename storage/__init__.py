@@ -0,0 +1,20 @@
+import importlib
+
+from .journal import Journal
+from .repository import Repository
+from .memory_repository import MemoryRepository
+from .catalog_import import ImportReport, import_completions, import_courses, import_requisites
+
+__all__ = [
+    "ImportReport", "Journal", "Repository", "MemoryRepository", "SQLiteRepository",
+    "import_completions", "import_courses", "import_requisites",
+]
+
+# sqlite3 is only imported when the SQLite backend is actually used
+_LAZY = {"SQLiteRepository": ".sqlite_repository"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
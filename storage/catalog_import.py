@@ -0,0 +1,198 @@
+import csv
+import json
+import os
+
+from models import Course
+
+REQUIRED_FIELDS = ("course_id", "title", "instructor", "credits", "capacity")
+REQUISITE_FIELDS = ("course_id", "requires", "kind")
+REQUISITE_KINDS = ("prerequisite", "corequisite")
+COMPLETION_FIELDS = ("student_id", "course_id")
+# Optional: meeting_times, e.g. "MW 10:00-11:15" (see models.schedule)
+
+
+class ImportReport:
+    """Outcome of an import; keeps at most `max_rejects` rejected rows in detail."""
+
+    def __init__(self, max_rejects: int = 100):
+        self.max_rejects = max_rejects
+        self.accepted = 0
+        self.rejected = 0
+        self.rejects = []  # (line number, reason), first max_rejects only
+
+    def reject(self, line_no: int, reason: str):
+        self.rejected += 1
+        if len(self.rejects) < self.max_rejects:
+            self.rejects.append((line_no, reason))
+
+    def __repr__(self) -> str:
+        return f"ImportReport(accepted={self.accepted}, rejected={self.rejected})"
+
+
+def iter_csv(path):
+    """Yield (line number, row dict) from a CSV file with a header row."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def iter_jsonl(path):
+    """Yield (line number, row dict) from a JSON Lines file; bad JSON yields the error."""
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except ValueError as exc:
+                yield line_no, exc
+
+
+READERS = {".csv": iter_csv, ".jsonl": iter_jsonl, ".ndjson": iter_jsonl}
+
+
+def parse_course(row, factory=Course) -> Course:
+    """Validate one row and build its Course with `factory`; raises ValueError with the reason."""
+    if isinstance(row, Exception):
+        raise ValueError(f"invalid JSON: {row}")
+    if not isinstance(row, dict):
+        raise ValueError("row is not an object")
+    missing = [f for f in REQUIRED_FIELDS if not str(row.get(f) or "").strip()]
+    if missing:
+        raise ValueError("missing " + ", ".join(missing))
+    try:
+        credits = int(row["credits"])
+        capacity = int(row["capacity"])
+    except (TypeError, ValueError):
+        raise ValueError("credits and capacity must be integers") from None
+    if credits <= 0 or capacity <= 0:
+        raise ValueError("credits and capacity must be positive")
+    return factory(str(row["course_id"]).strip(), str(row["title"]).strip(),
+                   str(row["instructor"]).strip(), credits, capacity,
+                   str(row.get("meeting_times") or "").strip())
+
+
+def import_courses(catalog, path, fmt: str = None, batch_size: int = 1000,
+                   max_rejects: int = 100) -> ImportReport:
+    """
+    Stream courses from a CSV or JSONL file into `catalog`.
+
+    Rows are parsed one at a time and handed to CourseCatalog.add_courses
+    in batches of `batch_size`, so memory stays bounded by the batch (plus
+    the catalog itself) however large the file is. Rows that fail
+    validation or repeat an existing course_id are counted as rejected.
+    """
+    reader = READERS.get(fmt or os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Unsupported catalog format: {fmt or path}")
+
+    report = ImportReport(max_rejects)
+    batch, lines = [], []
+
+    def flush():
+        duplicates = {id(c) for c in catalog.add_courses(batch)}
+        for c, line_no in zip(batch, lines):
+            if id(c) in duplicates:
+                report.reject(line_no, f"duplicate course_id {c.course_id}")
+            else:
+                report.accepted += 1
+        batch.clear()
+        lines.clear()
+
+    for line_no, row in reader(path):
+        try:
+            batch.append(parse_course(row, catalog.course_factory))
+            lines.append(line_no)
+        except ValueError as exc:
+            report.reject(line_no, str(exc))
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return report
+
+
+def import_requisites(graph, path, fmt: str = None, max_rejects: int = 100) -> ImportReport:
+    """
+    Load (course_id, requires, kind) rows into a PrerequisiteGraph; kind is
+    "prerequisite" or "corequisite". The closure is computed once, after
+    every valid row has been read. If the rows contain a cycle, they are
+    added one at a time instead and the rows that would close it are rejected.
+    """
+    reader = READERS.get(fmt or os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Unsupported requisite format: {fmt or path}")
+
+    report = ImportReport(max_rejects)
+    rows, lines = [], []
+    for line_no, row in reader(path):
+        if not isinstance(row, dict):
+            report.reject(line_no, "row is not an object")
+            continue
+        values = [str(row.get(f) or "").strip() for f in REQUISITE_FIELDS]
+        missing = [f for f, v in zip(REQUISITE_FIELDS, values) if not v]
+        if missing:
+            report.reject(line_no, "missing " + ", ".join(missing))
+        elif values[2] not in REQUISITE_KINDS:
+            report.reject(line_no, f"unknown kind {values[2]!r}")
+        elif values[0] == values[1]:
+            report.reject(line_no, "a course cannot require itself")
+        else:
+            rows.append(tuple(values))
+            lines.append(line_no)
+    try:
+        graph.load(rows)
+    except ValueError:
+        # load() left the graph unchanged; find the rows that close a cycle
+        for (cid, required, kind), line_no in zip(rows, lines):
+            add = graph.add_prerequisite if kind == "prerequisite" else graph.add_corequisite
+            try:
+                add(cid, required)
+            except ValueError as exc:
+                report.reject(line_no, str(exc))
+                continue
+            report.accepted += 1
+        return report
+    report.accepted = len(rows)
+    return report
+
+
+def import_completions(system, path, registrar_key, fmt: str = None,
+                       max_rejects: int = 100) -> ImportReport:
+    """
+    Record (student_id, course_id) transcript rows through
+    RegistrationSystem.record_completed_courses, one call per student.
+    Rows naming an unknown student or course are rejected on their own,
+    so they do not sink the rest of that student's transcript.
+    """
+    reader = READERS.get(fmt or os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Unsupported transcript format: {fmt or path}")
+
+    report = ImportReport(max_rejects)
+    by_student = {}  # student_id -> [(line number, course_id)]
+    for line_no, row in reader(path):
+        if not isinstance(row, dict):
+            report.reject(line_no, "row is not an object")
+            continue
+        sid, cid = (str(row.get(f) or "").strip() for f in COMPLETION_FIELDS)
+        if not sid or not cid:
+            report.reject(line_no, "missing " + ", ".join(
+                f for f, v in zip(COMPLETION_FIELDS, (sid, cid)) if not v))
+        elif system.auth_service.find_student(sid) is None:
+            report.reject(line_no, f"unknown student_id {sid}")
+        elif system.course_catalog.find_course(cid) is None:
+            report.reject(line_no, f"unknown course_id {cid}")
+        else:
+            by_student.setdefault(sid, []).append((line_no, cid))
+
+    for sid, rows in by_student.items():
+        ok, msg = system.record_completed_courses(sid, [cid for _, cid in rows], registrar_key)
+        if ok:
+            report.accepted += len(rows)
+        else:
+            for line_no, _ in rows:
+                report.reject(line_no, msg)
+    return report
@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+
+SEGMENT = "journal-{:012d}.log"
+SNAPSHOT = "snapshot-{:012d}.json"
+
+
+def _numbered(directory, pattern):
+    """Sorted (number, path) pairs for files matching SEGMENT or SNAPSHOT."""
+    prefix, suffix = pattern.split("{:012d}")
+    found = []
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name.endswith(suffix):
+            number = name[len(prefix):-len(suffix)]
+            if number.isdigit():
+                found.append((int(number), os.path.join(directory, name)))
+    return sorted(found)
+
+
+class Journal:
+    """
+    Append-only write-ahead journal with periodic snapshots.
+
+    Records are compact JSON arrays, one per line: [seq, op, *args].
+    Appends are buffered and fsync'ed as a group, once `group_commit`
+    records are pending or every `commit_interval` seconds, whichever comes
+    first. After a crash, at most the last un-synced group is lost.
+
+    Once `snapshot_every` records have been appended, the owner writes a
+    snapshot of its full state. The journal then starts a new segment and
+    deletes everything the snapshot covers, so recovery only reads the
+    newest snapshot plus a short tail.
+
+    Replaying a record must be idempotent: a snapshot can already include
+    the effect of a few records that follow it.
+    """
+
+    def __init__(self, directory: str, snapshot_every: int = 1000,
+                 group_commit: int = 64, commit_interval: float = 0.05):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.group_commit = group_commit
+        self.commit_interval = commit_interval
+        self.seq = 0
+        self._file = None
+        self._pending = 0
+        self._since_snapshot = 0
+        self._lock = threading.Lock()
+        self._snapshotting = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+
+    # ---------- recovery ----------
+    def recover(self):
+        """
+        Read the newest snapshot and the journal records after it, truncate a
+        torn last record, then open a segment for appending. Returns
+        (snapshot state or None, records).
+        """
+        state, snap_seq = None, 0
+        snapshots = _numbered(self.directory, SNAPSHOT)
+        if snapshots:
+            snap_seq, path = snapshots[-1]
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+
+        records = []
+        last_seq = snap_seq
+        for _, path in _numbered(self.directory, SEGMENT):
+            valid = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn write at the end of a segment
+                    valid += len(line)
+                    last_seq = max(last_seq, record[0])
+                    if record[0] > snap_seq:
+                        records.append(record)
+            if valid < os.path.getsize(path):
+                # Cut the torn tail off, otherwise the next segment could be
+                # this same file and new records would land behind it.
+                with open(path, "r+b") as f:
+                    f.truncate(valid)
+                    os.fsync(f.fileno())
+
+        self.seq = last_seq
+        self._since_snapshot = len(records)
+        self._open_segment()
+        self._flusher.start()
+        return state, records
+
+    # ---------- appending ----------
+    def _open_segment(self):
+        path = os.path.join(self.directory, SEGMENT.format(self.seq + 1))
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _sync_locked(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def append(self, op: str, *args) -> int:
+        with self._lock:
+            self.seq += 1
+            self._file.write(json.dumps([self.seq, op, *args], separators=(",", ":")) + "\n")
+            self._pending += 1
+            self._since_snapshot += 1
+            if self._pending >= self.group_commit:
+                self._sync_locked()
+            return self.seq
+
+    def sync(self):
+        with self._lock:
+            if self._pending:
+                self._sync_locked()
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.commit_interval):
+            self.sync()
+
+    # ---------- snapshots ----------
+    def snapshot_due(self) -> bool:
+        return self._since_snapshot >= self.snapshot_every
+
+    def write_snapshot(self, build_state) -> bool:
+        """
+        Snapshot the state returned by `build_state()` and drop the journal
+        segments it covers. Returns False if another snapshot is in progress.
+        """
+        if not self._snapshotting.acquire(blocking=False):
+            return False
+        try:
+            with self._lock:
+                seq = self.seq
+                self._sync_locked()
+                self._file.close()
+                self._open_segment()
+                self._since_snapshot = 0
+
+            # Built outside the lock: every record up to `seq` was appended
+            # after its change was made, so the state includes all of them.
+            state = build_state()
+            path = os.path.join(self.directory, SNAPSHOT.format(seq))
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+
+            for number, old in _numbered(self.directory, SNAPSHOT):
+                if number < seq:
+                    os.remove(old)
+            for first_seq, old in _numbered(self.directory, SEGMENT):
+                if first_seq <= seq:
+                    os.remove(old)
+            return True
+        finally:
+            self._snapshotting.release()
+
+    def close(self):
+        self._closed.set()
+        if self._flusher.is_alive():
+            self._flusher.join()
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
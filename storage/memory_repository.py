@@ -0,0 +1,46 @@
+from .repository import Repository
+
+
+class MemoryRepository(Repository):
+    """
+    The original in-memory store: the Student / Course objects held by the
+    controllers are the only copy of the data, so there is nothing to load
+    and every write is accepted as-is (the controllers have already
+    enforced capacity). All data is lost when the process exits.
+    """
+
+    def load_students(self):
+        return ()
+
+    def load_courses(self):
+        return ()
+
+    def load_enrollments(self):
+        return ()
+
+    def load_completions(self):
+        return ()
+
+    def add_students(self, students):
+        pass
+
+    def add_courses(self, courses):
+        pass
+
+    def add_completions(self, student, course_ids):
+        pass
+
+    def update_course(self, course, fields) -> bool:
+        return True
+
+    def remove_course(self, course) -> bool:
+        return True
+
+    def enroll(self, student, courses) -> bool:
+        return True
+
+    def unenroll(self, student, course) -> bool:
+        return True
+
+    def swap(self, student, drop_course, add_course) -> bool:
+        return True
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+
+
+class Repository(ABC):
+    """
+    Persistence interface used by the controllers.
+
+    The controllers keep working on the in-memory object graph
+    (Student / Course); a repository mirrors every change so the state
+    can be reloaded after a restart. Write methods that can be refused
+    (enrollments) return a bool, and the controller only mutates its
+    objects once the repository has accepted the change.
+
+    Every method except close() is abstract, so a backend that misses one
+    fails when it is instantiated rather than halfway through a save.
+    """
+
+    # ---------- loading ----------
+    @abstractmethod
+    def load_students(self):
+        """Iterable of (student_id, name, password)."""
+
+    @abstractmethod
+    def load_courses(self):
+        """Iterable of (course_id, title, instructor, credits, capacity, meeting_times)."""
+
+    @abstractmethod
+    def load_enrollments(self):
+        """Iterable of (student_id, course_id)."""
+
+    @abstractmethod
+    def load_completions(self):
+        """Iterable of (student_id, course_id) for courses passed in earlier terms."""
+
+    # ---------- writes ----------
+    @abstractmethod
+    def add_students(self, students):
+        ...
+
+    @abstractmethod
+    def add_courses(self, courses):
+        ...
+
+    @abstractmethod
+    def add_completions(self, student, course_ids):
+        ...
+
+    @abstractmethod
+    def update_course(self, course, fields) -> bool:
+        """Store new values for the course columns in `fields` (a dict)."""
+
+    @abstractmethod
+    def remove_course(self, course) -> bool:
+        """Delete a course; refused while it has enrollments."""
+
+    @abstractmethod
+    def enroll(self, student, courses) -> bool:
+        """Enroll `student` in every course in `courses`, or in none of them."""
+
+    @abstractmethod
+    def unenroll(self, student, course) -> bool:
+        ...
+
+    @abstractmethod
+    def swap(self, student, drop_course, add_course) -> bool:
+        ...
+
+    def close(self):
+        pass
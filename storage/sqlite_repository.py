@@ -0,0 +1,216 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+from .repository import Repository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    student_id TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    password   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    course_id  TEXT PRIMARY KEY,
+    title      TEXT NOT NULL,
+    instructor TEXT NOT NULL,
+    credits    INTEGER NOT NULL,
+    capacity   INTEGER NOT NULL,
+    enrolled   INTEGER NOT NULL DEFAULT 0,
+    meeting_times TEXT NOT NULL DEFAULT '',
+    CHECK (enrolled >= 0 AND enrolled <= capacity)
+);
+CREATE TABLE IF NOT EXISTS enrollments (
+    student_id TEXT NOT NULL REFERENCES students(student_id),
+    course_id  TEXT NOT NULL REFERENCES courses(course_id),
+    PRIMARY KEY (student_id, course_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS enrollments_by_course
+    ON enrollments (course_id, student_id);
+CREATE TABLE IF NOT EXISTS completed_courses (
+    student_id TEXT NOT NULL REFERENCES students(student_id),
+    course_id  TEXT NOT NULL,
+    PRIMARY KEY (student_id, course_id)
+) WITHOUT ROWID;
+"""
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache always hits and they are only ever prepared once per connection.
+INSERT_STUDENT = "INSERT OR IGNORE INTO students VALUES (?, ?, ?)"
+INSERT_COURSE = ("INSERT OR IGNORE INTO courses "
+                 "(course_id, title, instructor, credits, capacity, meeting_times) "
+                 "VALUES (?, ?, ?, ?, ?, ?)")
+TAKE_SEAT = ("UPDATE courses SET enrolled = enrolled + 1 "
+             "WHERE course_id = ? AND enrolled < capacity")
+INSERT_COMPLETION = "INSERT OR IGNORE INTO completed_courses VALUES (?, ?)"
+DELETE_COURSE = "DELETE FROM courses WHERE course_id = ? AND enrolled = 0"
+# Columns update_course() may set; names are checked against this before
+# they are put into the statement
+COURSE_COLUMNS = ("title", "instructor", "credits", "capacity", "meeting_times")
+FREE_SEAT = "UPDATE courses SET enrolled = enrolled - 1 WHERE course_id = ?"
+INSERT_ENROLLMENT = "INSERT INTO enrollments VALUES (?, ?)"
+DELETE_ENROLLMENT = "DELETE FROM enrollments WHERE student_id = ? AND course_id = ?"
+
+
+class _Rollback(Exception):
+    pass
+
+
+class SQLiteRepository(Repository):
+    """
+    SQLite-backed repository.
+
+    - WAL journal mode, so readers never block the single writer
+    - a small pool of connections shared by threads
+    - bulk inserts go through executemany, committed every `batch_size` rows
+    - enrollments are indexed by (student, course) and (course, student)
+    - each course row carries its seat count under a CHECK constraint,
+      and a seat is taken with a conditional UPDATE inside the same
+      transaction as the enrollment row, so the database cannot overbook
+      even if two processes share the file
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        if path == ":memory:":
+            pool_size = 1  # each connection would be a separate database
+        self._pool = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(courses)")}
+            if "meeting_times" not in columns:  # database created before meeting times
+                conn.execute("ALTER TABLE courses "
+                             "ADD COLUMN meeting_times TEXT NOT NULL DEFAULT ''")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False,
+                               isolation_level=None, cached_statements=64)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _transaction(self):
+        """Run the block in one BEGIN IMMEDIATE transaction; constraint failures roll back."""
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except (_Rollback, sqlite3.IntegrityError):
+                conn.execute("ROLLBACK")
+                raise _Rollback
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _apply(self, steps) -> bool:
+        """Run (sql, params, must_change_a_row) steps in one transaction."""
+        try:
+            with self._transaction() as conn:
+                for sql, params, must_change in steps:
+                    if conn.execute(sql, params).rowcount == 0 and must_change:
+                        raise _Rollback
+        except _Rollback:
+            return False
+        return True
+
+    # ---------- loading ----------
+    def _select(self, sql):
+        with self._connection() as conn:
+            return conn.execute(sql).fetchall()
+
+    def load_students(self):
+        return self._select("SELECT student_id, name, password FROM students")
+
+    def load_courses(self):
+        return self._select(
+            "SELECT course_id, title, instructor, credits, capacity, meeting_times "
+            "FROM courses")
+
+    def load_enrollments(self):
+        return self._select("SELECT student_id, course_id FROM enrollments")
+
+    def load_completions(self):
+        return self._select("SELECT student_id, course_id FROM completed_courses")
+
+    # ---------- writes ----------
+    def _insert_batched(self, sql, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                with self._transaction() as conn:
+                    conn.executemany(sql, batch)
+                batch = []
+        if batch:
+            with self._transaction() as conn:
+                conn.executemany(sql, batch)
+
+    def add_students(self, students):
+        self._insert_batched(
+            INSERT_STUDENT, ((s.student_id, s.name, s.password) for s in students))
+
+    def add_courses(self, courses):
+        self._insert_batched(
+            INSERT_COURSE,
+            ((c.course_id, c.title, c.instructor, c.credits, c.capacity, c.meeting_times)
+             for c in courses))
+
+    def add_completions(self, student, course_ids):
+        self._insert_batched(INSERT_COMPLETION,
+                             ((student.student_id, cid) for cid in course_ids))
+
+    def update_course(self, course, fields) -> bool:
+        columns = [name for name in COURSE_COLUMNS if name in fields]
+        if len(columns) != len(fields):
+            return False
+        if not columns:
+            return True
+        # The CHECK constraint refuses a capacity below the current enrollment
+        sql = (f"UPDATE courses SET {', '.join(f'{name} = ?' for name in columns)} "
+               f"WHERE course_id = ?")
+        return self._apply([
+            (sql, (*(fields[name] for name in columns), course.course_id), True),
+        ])
+
+    def remove_course(self, course) -> bool:
+        return self._apply([(DELETE_COURSE, (course.course_id,), True)])
+
+    def enroll(self, student, courses) -> bool:
+        steps = []
+        for c in courses:
+            steps.append((TAKE_SEAT, (c.course_id,), True))
+            steps.append((INSERT_ENROLLMENT, (student.student_id, c.course_id), True))
+        return self._apply(steps)
+
+    def unenroll(self, student, course) -> bool:
+        return self._apply([
+            (DELETE_ENROLLMENT, (student.student_id, course.course_id), True),
+            (FREE_SEAT, (course.course_id,), True),
+        ])
+
+    def swap(self, student, drop_course, add_course) -> bool:
+        return self._apply([
+            (DELETE_ENROLLMENT, (student.student_id, drop_course.course_id), True),
+            (FREE_SEAT, (drop_course.course_id,), True),
+            (TAKE_SEAT, (add_course.course_id,), True),
+            (INSERT_ENROLLMENT, (student.student_id, add_course.course_id), True),
+        ])
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
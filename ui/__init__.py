@@ -1,3 +1,13 @@
-from .main_gui import MainGUI
+import importlib
 
 __all__ = ["MainGUI"]
+
+# The GUI stack (customtkinter / tkinter) is only imported when MainGUI is
+# requested, so helpers like ui.task_runner stay importable headless.
+_LAZY = {"MainGUI": ".main_gui"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,9 @@ Before using this GUI, install CustomTkinter:
 try:
     import customtkinter as ctk
     from tkinter import messagebox
-    from controllers import RegistrationSystem
+    from controllers import ENROLLMENT_CHANGED, RegistrationSystem
+    from .task_runner import TaskRunner
+    from .virtual_list import VirtualList
     
     CTK_AVAILABLE = True
 except ImportError:
@@ -43,9 +45,18 @@ class MainGUI:
         # Center the main window on the screen
         self.center_window(1100, 700)
         
+        # Backend calls run on worker threads; results come back via root.after
+        self.tasks = TaskRunner(self.root)
+        
         # A placeholder for the active UI frame
         self.current_frame = None
         
+        # Widgets patched in place when enrollments change
+        self.credits_label = None
+        self.seat_labels = {}      # course_id -> [CTkLabel] in open detail windows
+        self.schedule_view = None  # widgets of the open schedule window
+        self.system.subscribe(ENROLLMENT_CHANGED, self.on_enrollment_changed)
+        
         # Status bar at the bottom
         self.status_label = ctk.CTkLabel(
             self.root,
@@ -77,6 +88,49 @@ class MainGUI:
         """Update the bottom status bar message."""
         self.status_label.configure(text=msg)
     
+    # =============================================================
+    # Enrollment events
+    # =============================================================
+    def on_enrollment_changed(self, event):
+        """Event bus callback (any thread); widget updates run on the Tk loop."""
+        self.tasks.call_soon(self.apply_enrollment_event, event)
+    
+    def apply_enrollment_event(self, event):
+        """Patch only the widgets affected by one enrollment change."""
+        labels = [l for l in self.seat_labels.get(event.course_id, []) if l.winfo_exists()]
+        for label in labels:
+            label.configure(text=f"{event.enrolled} / {event.capacity}")
+        if labels:
+            self.seat_labels[event.course_id] = labels
+        else:
+            self.seat_labels.pop(event.course_id, None)
+        
+        user = self.system.current_user
+        if not user or user.student_id != event.student_id:
+            return
+        
+        if self.credits_label is not None and self.credits_label.winfo_exists():
+            self.credits_label.configure(text=f"📚 {event.credits_remaining} Credits")
+        
+        view = self.schedule_view
+        if view is None or not view["win"].winfo_exists():
+            return
+        if event.action == "drop":
+            row = view["rows"].pop(event.course_id, None)
+            if row is not None:
+                row.destroy()
+        elif event.course_id not in view["rows"]:
+            def add_row(course):
+                if course and view["win"].winfo_exists() and course.course_id not in view["rows"]:
+                    self.add_schedule_row(view, course)
+            
+            self.tasks.submit(
+                self.system.get_course_details, event.course_id,
+                on_done=add_row,
+                owner=view["win"]
+            )
+        view["total_label"].configure(text=f"Total: {user.total_credits()} Credits")
+    
     # =============================================================
     # Login View
     # =============================================================
@@ -144,23 +198,32 @@ class MainGUI:
         def handle_login():
             sid = sid_entry.get().strip()
             pwd = pwd_entry.get().strip()
-            _, msg = self.system.login(sid, pwd)
             
-            if self.system.current_user:
-                self.set_status("✓ Login successful!")
-                self.show_main_menu()
-            else:
-                messagebox.showerror("Login Failed", msg)
-                self.set_status(f"⚠ {msg}")
+            def done(result):
+                _, msg = result
+                if self.system.current_user:
+                    self.set_status("✓ Login successful!")
+                    self.show_main_menu()
+                else:
+                    messagebox.showerror("Login Failed", msg)
+                    self.set_status(f"⚠ {msg}")
+            
+            self.tasks.submit(
+                self.system.login, sid, pwd,
+                on_done=done,
+                key="login",
+                busy=(login_btn, "Logging in...")
+            )
         
         # Login button
-        ctk.CTkButton(
+        login_btn = ctk.CTkButton(
             card,
             text="Login",
             height=40,
             font=("Segoe UI", 12, "bold"),
             command=handle_login
-        ).pack(fill="x", padx=30, pady=(0, 15))
+        )
+        login_btn.pack(fill="x", padx=30, pady=(0, 15))
         
         # Signup link area
         link_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -272,14 +335,22 @@ class MainGUI:
                 messagebox.showwarning("Sign Up", "All fields are required.")
                 return
             
-            _, msg = self.system.register_student(sid, name, pwd)
-            if "exists" in msg:
-                messagebox.showerror("Sign Up Failed", msg)
-            else:
-                messagebox.showinfo("Success", "Account created! Please login.")
-                self.show_login_view()
+            def done(result):
+                _, msg = result
+                if "exists" in msg:
+                    messagebox.showerror("Sign Up Failed", msg)
+                else:
+                    messagebox.showinfo("Success", "Account created! Please login.")
+                    self.show_login_view()
+            
+            self.tasks.submit(
+                self.system.register_student, sid, name, pwd,
+                on_done=done,
+                key="signup",
+                busy=(create_btn, "Creating account...")
+            )
         
-        ctk.CTkButton(
+        create_btn = ctk.CTkButton(
             card,
             text="Create Account",
             height=40,
@@ -287,7 +358,8 @@ class MainGUI:
             fg_color="#10b981",
             hover_color="#059669",
             command=handle_create
-        ).pack(fill="x", padx=30, pady=(0, 15))
+        )
+        create_btn.pack(fill="x", padx=30, pady=(0, 15))
         
         # Login link
         link_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -347,11 +419,23 @@ class MainGUI:
         right = ctk.CTkFrame(nav, fg_color="transparent")
         right.pack(side="right", padx=20, pady=15)
         
-        ctk.CTkLabel(
+        self.credits_label = ctk.CTkLabel(
             right,
             text=f"📚 {credits} Credits",
             font=("Segoe UI", 12, "bold")
-        ).pack(side="left", padx=(0, 15))
+        )
+        self.credits_label.pack(side="left", padx=(0, 15))
+        
+        ctk.CTkButton(
+            right,
+            text="Completed Courses",
+            width=150,
+            height=35,
+            fg_color="transparent",
+            border_width=1,
+            text_color=("gray10", "gray90"),
+            command=self.show_completed_window
+        ).pack(side="left", padx=(0, 10))
         
         ctk.CTkButton(
             right,
@@ -414,9 +498,14 @@ class MainGUI:
     # =============================================================
     def show_course_list_window(self):
         """Open a window listing all available courses."""
-        courses = self.system.get_all_courses()
-        
-        if not courses:
+        self.tasks.submit(
+            self.system.get_course_count,
+            on_done=self.open_course_list_window,
+            key="course-list"
+        )
+    
+    def open_course_list_window(self, total):
+        if not total:
             messagebox.showinfo("Courses", "No courses available.")
             return
         
@@ -433,14 +522,29 @@ class MainGUI:
             font=("Segoe UI", 20, "bold")
         ).pack(side="left", padx=20, pady=20)
         
+        search_entry = ctk.CTkEntry(
+            header,
+            placeholder_text="Search by course, title or instructor",
+            width=320,
+            height=35,
+            font=("Segoe UI", 11)
+        )
+        search_entry.pack(side="right", padx=20, pady=20)
+        
+        open_only = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            header,
+            text="Open sections only",
+            variable=open_only,
+            command=lambda: run_search(),
+            font=("Segoe UI", 11)
+        ).pack(side="right", padx=10, pady=20)
+        
         content = ctk.CTkFrame(win)
         content.pack(fill="both", expand=True, padx=20, pady=20)
         
-        table_frame = ctk.CTkScrollableFrame(content)
-        table_frame.pack(fill="both", expand=True)
-        
         # Header - Only Course Name and Action
-        header_row = ctk.CTkFrame(table_frame, fg_color="#e2e8f0")
+        header_row = ctk.CTkFrame(content, fg_color="#e2e8f0")
         header_row.pack(fill="x", pady=(0, 5))
         
         ctk.CTkLabel(
@@ -459,50 +563,130 @@ class MainGUI:
             anchor="center"
         ).grid(row=0, column=1, padx=20, pady=10)
         
-        # Data rows - Show only course title and register button
-        for c in courses:
-            row = ctk.CTkFrame(table_frame, fg_color="transparent")
-            row.pack(fill="x", pady=2)
-            
-            def make_detail_handler(course):
-                def handler():
-                    self.show_course_detail_window(course)
-                return handler
+        # Closing the window drops any result still on its way
+        win.bind("<Destroy>", lambda e: self.tasks.cancel_owner(win) if e.widget is win else None)
+        
+        def show_result(title, result):
+            ok, msg = result
+            self.set_status(msg)
+            if ok:
+                messagebox.showinfo(title, msg)
+            else:
+                messagebox.showwarning("Failed", msg)
+        
+        def registered(course, result):
+            ok, msg = result
+            if not ok and msg == "Course is full." and messagebox.askyesno(
+                    "Course Full", "This course is full. Join the waitlist?"):
+                self.tasks.submit(
+                    self.system.join_waitlist, course.course_id,
+                    on_done=lambda r: show_result("Waitlist", r),
+                    key=("waitlist", course.course_id),
+                    owner=win
+                )
+            else:
+                show_result("Success", result)
+        
+        def handle_register(course):
+            self.set_status(f"Registering for {course.course_id}...")
+            self.tasks.submit(
+                self.system.register_course, course.course_id,
+                on_done=lambda r: registered(course, r),
+                key=("register", course.course_id),
+                owner=win
+            )
+        
+        # Data rows - only the visible ones exist; they are rebound on scroll
+        def make_row(parent):
+            row = ctk.CTkFrame(parent, fg_color="transparent")
             
             # Clickable course title
             course_btn = ctk.CTkButton(
                 row,
-                text=c.title,
+                text="",
                 width=500,
                 height=40,
                 anchor="w",
                 fg_color="transparent",
                 text_color=("blue", "lightblue"),
                 hover_color="#f0f0f0",
-                font=("Segoe UI", 12),
-                command=make_detail_handler(c)
+                font=("Segoe UI", 12)
             )
             course_btn.grid(row=0, column=0, padx=20, pady=5, sticky="w")
             
-            def make_register_handler(course):
-                def handler():
-                    ok, msg = self.system.register_course(course.course_id)
-                    if ok:
-                        messagebox.showinfo("Success", msg)
-                        win.destroy()
-                        self.show_main_menu()
-                    else:
-                        messagebox.showwarning("Failed", msg)
-                return handler
-            
-            ctk.CTkButton(
+            register_btn = ctk.CTkButton(
                 row,
                 text="Register",
                 width=100,
-                height=35,
-                command=make_register_handler(c)
-            ).grid(row=0, column=1, padx=20, pady=5)
-    
+                height=35
+            )
+            register_btn.grid(row=0, column=1, padx=20, pady=5)
+            
+            def bind(course):
+                course_btn.configure(
+                    text=course.title,
+                    command=lambda: self.show_course_detail_window(course)
+                )
+                register_btn.configure(command=lambda: handle_register(course))
+            
+            return row, bind
+        
+        course_list = VirtualList(content, create_row=make_row, row_height=50)
+        course_list.pack(fill="both", expand=True)
+        
+        def show_courses(courses):
+            course_list.set_source(
+                lambda offset, limit: courses[offset:offset + limit],
+                len(courses)
+            )
+        
+        # Browsing reads immutable catalog snapshots, never the live objects;
+        # open sections come straight from the seat-availability index
+        def show_catalog():
+            wanted = open_only.get()
+            
+            def loaded(result):
+                # A search or another toggle has replaced this listing
+                if search_entry.get().strip() or open_only.get() != wanted:
+                    return
+                if wanted:
+                    show_courses(result)
+                else:
+                    course_list.set_source(result.page, len(result))
+            
+            self.tasks.submit(
+                self.system.get_open_courses if wanted else self.system.get_catalog_snapshot,
+                on_done=loaded,
+                owner=win
+            )
+        
+        show_catalog()
+        
+        # Type-ahead search over course ID, title and instructor;
+        # runs once typing pauses, and stale results are ignored
+        def show_results(query, results):
+            if query != search_entry.get().strip():
+                return
+            if open_only.get():
+                results = [c for c in results if not c.is_full()]
+            show_courses(results)
+        
+        def run_search():
+            query = search_entry.get().strip()
+            if not query:
+                show_catalog()
+                return
+            self.tasks.submit(
+                self.system.search_courses, query, 50,
+                on_done=lambda results: show_results(query, results),
+                owner=win
+            )
+        
+        search_entry.bind(
+            "<KeyRelease>",
+            lambda _e: self.tasks.debounce("search", 150, run_search)
+        )
+
     def show_course_detail_window(self, course):
         """Show detailed information about a course."""
         detail_win = ctk.CTkToplevel(self.root)
@@ -590,6 +774,23 @@ class MainGUI:
             anchor="w"
         ).pack(side="left")
         
+        # Meeting times
+        info_row = ctk.CTkFrame(details, fg_color="transparent")
+        info_row.pack(fill="x", pady=10)
+        ctk.CTkLabel(
+            info_row,
+            text="Meets:",
+            font=("Segoe UI", 13, "bold"),
+            anchor="w",
+            width=150
+        ).pack(side="left")
+        ctk.CTkLabel(
+            info_row,
+            text=course.meeting_times or "TBA",
+            font=("Segoe UI", 13),
+            anchor="w"
+        ).pack(side="left")
+
         # Capacity
         info_row = ctk.CTkFrame(details, fg_color="transparent")
         info_row.pack(fill="x", pady=10)
@@ -617,12 +818,14 @@ class MainGUI:
             anchor="w",
             width=150
         ).pack(side="left")
-        ctk.CTkLabel(
+        seat_label = ctk.CTkLabel(
             info_row,
-            text=f"{len(course.enrolled_students)} / {course.capacity}",
+            text=f"{course.enrolled_count()} / {course.capacity}",
             font=("Segoe UI", 13),
             anchor="w"
-        ).pack(side="left")
+        )
+        seat_label.pack(side="left")
+        self.seat_labels.setdefault(course.course_id, []).append(seat_label)
         
         # Close button
         ctk.CTkButton(
@@ -638,8 +841,13 @@ class MainGUI:
     # =============================================================
     def show_schedule_window(self):
         """Open a window displaying the user's schedule."""
-        schedule = self.system.get_my_schedule()
-        
+        self.tasks.submit(
+            self.system.get_my_schedule,
+            on_done=self.open_schedule_window,
+            key="schedule"
+        )
+    
+    def open_schedule_window(self, schedule):
         if not schedule:
             messagebox.showinfo("My Schedule", "You have no registered courses.")
             return
@@ -658,12 +866,13 @@ class MainGUI:
         ).pack(side="left", padx=20, pady=20)
         
         total = sum(c.credits for c in schedule)
-        ctk.CTkLabel(
+        total_label = ctk.CTkLabel(
             header,
             text=f"Total: {total} Credits",
             font=("Segoe UI", 12),
             text_color="gray"
-        ).pack(side="right", padx=20, pady=20)
+        )
+        total_label.pack(side="right", padx=20, pady=20)
         
         content = ctk.CTkFrame(win)
         content.pack(fill="both", expand=True, padx=20, pady=20)
@@ -686,49 +895,111 @@ class MainGUI:
                 anchor="center" if i == 3 else "w"
             ).grid(row=0, column=i, padx=10, pady=10)
         
+        win.bind("<Destroy>", lambda e: self.tasks.cancel_owner(win) if e.widget is win else None)
+        
+        # Rows are added / removed by apply_enrollment_event from here on
+        self.schedule_view = {
+            "win": win,
+            "table": table,
+            "total_label": total_label,
+            "col_widths": col_widths,
+            "rows": {},  # course_id -> row frame
+        }
         for c in schedule:
-            row = ctk.CTkFrame(table)
-            row.pack(fill="x", pady=2)
-            
-            values = [c.course_id, c.title, c.instructor, str(c.credits)]
-            for i, val in enumerate(values):
-                ctk.CTkLabel(
-                    row,
-                    text=val,
-                    width=col_widths[i],
-                    anchor="center" if i == 3 else "w"
-                ).grid(row=0, column=i, padx=10, pady=8)
-            
-            def make_drop(course):
-                def handler():
-                    ok, msg = self.system.drop_course(course.course_id)
-                    if ok:
-                        messagebox.showinfo("Success", msg)
-                        win.destroy()
-                        self.show_main_menu()
-                    else:
-                        messagebox.showwarning("Failed", msg)
-                return handler
-            
-            ctk.CTkButton(
+            self.add_schedule_row(self.schedule_view, c)
+    
+    def add_schedule_row(self, view, course):
+        """Append one course row to the open schedule window."""
+        row = ctk.CTkFrame(view["table"])
+        row.pack(fill="x", pady=2)
+        view["rows"][course.course_id] = row
+        
+        values = [course.course_id, course.title, course.instructor, str(course.credits)]
+        for i, val in enumerate(values):
+            ctk.CTkLabel(
                 row,
-                text="Drop",
-                fg_color="#ef4444",
-                hover_color="#dc2626",
-                width=80,
-                height=30,
-                command=make_drop(c)
-            ).grid(row=0, column=4, padx=10)
+                text=val,
+                width=view["col_widths"][i],
+                anchor="center" if i == 3 else "w"
+            ).grid(row=0, column=i, padx=10, pady=8)
+        
+        def dropped(result):
+            ok, msg = result
+            self.set_status(msg)
+            if ok:
+                messagebox.showinfo("Success", msg)
+            else:
+                messagebox.showwarning("Failed", msg)
+        
+        def handle_drop():
+            self.tasks.submit(
+                self.system.drop_course, course.course_id,
+                on_done=dropped,
+                key=("drop", course.course_id),
+                owner=view["win"],
+                busy=(drop_btn, "...")
+            )
+        
+        drop_btn = ctk.CTkButton(
+            row,
+            text="Drop",
+            fg_color="#ef4444",
+            hover_color="#dc2626",
+            width=80,
+            height=30,
+            command=handle_drop
+        )
+        drop_btn.grid(row=0, column=4, padx=10)
+
+    # =============================================================
+    # Completed Courses Window
+    # =============================================================
+    def show_completed_window(self):
+        """Open a window listing the courses completed in earlier terms."""
+        self.tasks.submit(
+            self.system.get_completed_courses,
+            on_done=self.open_completed_window,
+            key="completed"
+        )
+    
+    def open_completed_window(self, completed):
+        win = ctk.CTkToplevel(self.root)
+        win.title("Completed Courses")
+        win.geometry("520x300")
+        
+        ctk.CTkLabel(
+            win,
+            text="🎓 Completed Courses",
+            font=("Segoe UI", 18, "bold")
+        ).pack(pady=(25, 5))
+        
+        ctk.CTkLabel(
+            win,
+            text="Recorded by the registrar from your transcript; they count toward prerequisites.",
+            font=("Segoe UI", 11),
+            text_color="gray",
+            wraplength=440
+        ).pack(pady=(0, 15))
+        
+        ctk.CTkLabel(
+            win,
+            text=", ".join(completed) or "None recorded yet.",
+            font=("Segoe UI", 12),
+            wraplength=440
+        ).pack(padx=30, pady=(0, 20))
 
     # =============================================================
     # Logout
     # =============================================================
     def handle_logout(self):
         """Log the user out of the system."""
-        self.system.logout()
-        self.set_status("Successfully logged out")
-        self.show_login_view()
+        def done(_result):
+            self.set_status("Successfully logged out")
+            self.show_login_view()
+        
+        self.tasks.submit(self.system.logout, on_done=done, key="logout")
     
     def run(self):
         """Start the event loop."""
         self.root.mainloop()
+        self.tasks.shutdown()
@@ -0,0 +1,160 @@
+"""
+Run blocking backend calls off the Tk main thread.
+
+Tk widgets may only be touched from the thread running the event loop, so
+results come back through a queue that the loop polls with root.after().
+The runner needs nothing from Tk except root.after / after_cancel, which
+also lets benchmarks drive it with a plain event loop.
+"""
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _Task:
+    __slots__ = ("key", "owner", "on_done", "on_error", "busy", "future", "cancelled")
+
+    def __init__(self, key, owner, on_done, on_error, busy):
+        self.key = key
+        self.owner = owner
+        self.on_done = on_done
+        self.on_error = on_error
+        self.busy = busy
+        self.future = None
+        self.cancelled = False
+
+
+class TaskRunner:
+    """
+    Dispatches calls to a worker pool and delivers results on the Tk loop.
+
+    - key: while a task with the same key is running, repeated submits are
+      ignored (debounces double-clicks)
+    - owner: a window; results are dropped once it has been closed, and
+      cancel_owner() cancels its pending work
+    - busy: (widget, loading text); the widget is disabled and relabelled
+      until the result arrives
+    """
+
+    def __init__(self, root, max_workers: int = 4, poll_ms: int = 15):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="gui-worker")
+        self._done = queue.SimpleQueue()
+        self._inflight = {}   # key -> _Task
+        self._timers = {}     # debounce key -> after() id
+        self._closed = False
+        self.root.after(self.poll_ms, self._poll)
+
+    def submit(self, fn, *args, on_done=None, on_error=None, key=None,
+               owner=None, busy=None):
+        """Run fn(*args) on a worker; returns False if debounced."""
+        if self._closed or (key is not None and key in self._inflight):
+            return False
+        task = _Task(key, owner, on_done, on_error, busy)
+        if key is not None:
+            self._inflight[key] = task
+        if busy is not None:
+            widget, text = busy
+            task.busy = (widget, widget.cget("text"))
+            widget.configure(state="disabled", text=text)
+        task.future = self._pool.submit(fn, *args)
+        # Runs on the worker thread; the queue hands the task to the loop
+        task.future.add_done_callback(lambda _f: self._done.put(lambda: self._deliver(task)))
+        return True
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the loop; safe to call from any thread."""
+        self._done.put(lambda: fn(*args))
+
+    def debounce(self, key, delay_ms: int, fn, *args):
+        """Run fn(*args) on the loop after `delay_ms` of quiet for `key`."""
+        pending = self._timers.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def fire():
+            self._timers.pop(key, None)
+            fn(*args)
+
+        self._timers[key] = self.root.after(delay_ms, fire)
+
+    def cancel_owner(self, owner):
+        for task in list(self._inflight.values()):
+            if task.owner is owner:
+                task.cancelled = True
+                task.future.cancel()
+
+    def _poll(self):
+        while True:
+            try:
+                callback = self._done.get_nowait()
+            except queue.Empty:
+                break
+            callback()
+        if not self._closed:
+            self.root.after(self.poll_ms, self._poll)
+
+    def _deliver(self, task):
+        if task.key is not None and self._inflight.get(task.key) is task:
+            del self._inflight[task.key]
+        owner_gone = task.owner is not None and not task.owner.winfo_exists()
+        if task.busy is not None and not owner_gone:
+            widget, text = task.busy
+            if widget.winfo_exists():
+                widget.configure(state="normal", text=text)
+        if task.cancelled or owner_gone or task.future.cancelled():
+            return
+        error = task.future.exception()
+        if error is not None:
+            if task.on_error is not None:
+                task.on_error(error)
+            return
+        if task.on_done is not None:
+            task.on_done(task.future.result())
+
+    def shutdown(self):
+        self._closed = True
+        self._pool.shutdown(wait=False)
+
+
+class StallMonitor:
+    """
+    Measures how late the event loop runs a heartbeat scheduled every
+    `interval_ms`; the lateness is time the UI thread was blocked.
+    """
+
+    def __init__(self, root, interval_ms: int = 10):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stalls = []  # seconds late, one per heartbeat
+        self._expected = None
+        self._running = False
+
+    def start(self):
+        self._running = True
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self.root.after(self.interval_ms, self._beat)
+
+    def stop(self):
+        self._running = False
+
+    def _beat(self):
+        now = time.perf_counter()
+        self.stalls.append(max(0.0, now - self._expected))
+        if self._running:
+            self._expected = now + self.interval_ms / 1000
+            self.root.after(self.interval_ms, self._beat)
+
+    def summary(self) -> dict:
+        stalls = sorted(self.stalls)
+        if not stalls:
+            return {"beats": 0, "max_ms": 0.0, "p95_ms": 0.0, "mean_ms": 0.0}
+        return {
+            "beats": len(stalls),
+            "max_ms": stalls[-1] * 1000,
+            "p95_ms": stalls[int(0.95 * (len(stalls) - 1))] * 1000,
+            "mean_ms": sum(stalls) / len(stalls) * 1000,
+        }
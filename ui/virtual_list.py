@@ -0,0 +1,149 @@
+"""
+Virtualized list widget: only the visible rows (plus a small overscan)
+exist as widgets, and they are rebound to different items while scrolling.
+"""
+
+import math
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+class PageCache:
+    """LRU cache of fixed-size pages fetched lazily with fetch_page(offset, limit)."""
+
+    def __init__(self, fetch_page, page_size: int = 100, max_pages: int = 20):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+
+    def item(self, index: int):
+        page_no, offset = divmod(index, self.page_size)
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self.fetch_page(page_no * self.page_size, self.page_size)
+            self._pages[page_no] = page
+            if len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_no)
+        return page[offset] if offset < len(page) else None
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrollable list of `total` fixed-height rows.
+
+    create_row(parent) must return (frame, bind) where bind(item) points
+    the row's widgets at `item`; the frame should be about `row_height`
+    tall (CustomTkinter does not allow sizing widgets through place()).
+    Items are pulled page by page through set_source(fetch_page, total),
+    so opening the list costs the same for ten items or a hundred thousand.
+    """
+
+    def __init__(self, master, create_row, row_height: int = 50,
+                 overscan: int = 3, **kwargs):
+        super().__init__(master, **kwargs)
+        self.create_row = create_row
+        self.row_height = row_height
+        self.overscan = overscan
+        self._cache = None
+        self._total = 0
+        self._top = 0.0    # pixel offset of the viewport into the list
+        self._pool = []    # [frame, bind, bound index]
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport.bind("<Configure>", lambda _e: self._layout())
+        # Wheel events are bound to a tag of this list's own, added to every
+        # widget inside it, so nothing outlives the list or leaks to others
+        self._wheel_tag = f"VirtualListWheel{id(self)}"
+        for seq in WHEEL_EVENTS:
+            self.bind_class(self._wheel_tag, seq, self._on_wheel)
+        self._tag_wheel(self)
+
+    def _tag_wheel(self, widget):
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((self._wheel_tag,) + tags)
+        for child in widget.winfo_children():
+            self._tag_wheel(child)
+
+    def destroy(self):
+        for seq in WHEEL_EVENTS:
+            self.unbind_class(self._wheel_tag, seq)
+        super().destroy()
+
+    # ---------- data ----------
+    def set_source(self, fetch_page, total: int):
+        self._cache = PageCache(fetch_page)
+        self._total = total
+        self._top = 0.0
+        for entry in self._pool:
+            entry[2] = None
+        self._layout()
+
+    def refresh(self):
+        """Re-fetch and rebind the visible rows (e.g. after data changed)."""
+        if self._cache is not None:
+            self.set_source(self._cache.fetch_page, self._total)
+
+    # ---------- scrolling ----------
+    def _max_top(self) -> float:
+        return max(0.0, self._total * self.row_height - self.viewport.winfo_height())
+
+    def _scroll_to(self, top: float):
+        self._top = min(max(0.0, top), self._max_top())
+        self._layout()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(float(amount) * self._total * self.row_height)
+        elif unit == "pages":
+            self._scroll_to(self._top + int(amount) * self.viewport.winfo_height())
+        else:
+            self._scroll_to(self._top + int(amount) * self.row_height)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            steps = -1
+        elif getattr(event, "num", None) == 5:
+            steps = 1
+        else:
+            steps = -1 if event.delta > 0 else 1
+        self._scroll_to(self._top + steps * self.row_height)
+
+    # ---------- rendering ----------
+    def _layout(self):
+        height = max(1, self.viewport.winfo_height())
+        wanted = min(self._total, math.ceil(height / self.row_height) + 1 + 2 * self.overscan)
+        while len(self._pool) < wanted:
+            frame, bind = self.create_row(self.viewport)
+            self._tag_wheel(frame)
+            self._pool.append([frame, bind, None])
+
+        first = max(0, int(self._top // self.row_height) - self.overscan)
+        for i, entry in enumerate(self._pool):
+            index = first + i
+            frame = entry[0]
+            item = self._cache.item(index) if self._cache and index < self._total else None
+            if item is None:
+                frame.place_forget()
+                entry[2] = None
+                continue
+            if entry[2] != index:
+                entry[1](item)
+                entry[2] = index
+            frame.place(x=0, y=index * self.row_height - self._top, relwidth=1.0)
+
+        span = self._total * self.row_height
+        if span:
+            self.scrollbar.set(self._top / span, min(1.0, (self._top + height) / span))
+        else:
+            self.scrollbar.set(0.0, 1.0)